@@ -13,14 +13,17 @@ from .io_emcee import from_emcee
 from .io_json import from_json, to_json
 from .io_netcdf import from_netcdf, to_netcdf
 from .io_numpyro import from_numpyro
+from .io_parquet import from_parquet, to_parquet
 from .io_pyjags import from_pyjags
 from .io_pyro import from_pyro
 from .io_pystan import from_pystan
 from .io_zarr import from_zarr, to_zarr
 from .utils import extract, extract_dataset
+from .writer import InferenceDataWriter
 
 __all__ = [
     "InferenceData",
+    "InferenceDataWriter",
     "concat",
     "load_arviz_data",
     "list_datasets",
@@ -50,6 +53,8 @@ __all__ = [
     "to_netcdf",
     "from_zarr",
     "to_zarr",
+    "from_parquet",
+    "to_parquet",
     "CoordSpec",
     "DimSpec",
 ]
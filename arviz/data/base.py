@@ -1,5 +1,6 @@
 """Low level converters usually used by other functions."""
 
+import base64
 import datetime
 import functools
 import importlib
@@ -19,7 +20,7 @@ except ImportError:
     # https://github.com/python/mypy/issues/1153
     import json  # type: ignore
 
-from .. import __version__, utils
+from .. import __version__
 from ..rcparams import rcParams
 
 CoordSpec = Dict[str, List[Any]]
@@ -89,11 +90,7 @@ def _yield_flat_up_to(shallow_tree, input_tree, path=()):
         input_tree.
     """
     # pylint: disable=protected-access
-    if isinstance(shallow_tree, tree._TEXT_OR_BYTES) or not (
-        isinstance(shallow_tree, tree.collections_abc.Mapping)
-        or tree._is_namedtuple(shallow_tree)
-        or tree._is_attrs(shallow_tree)
-    ):
+    if _is_tree_leaf(shallow_tree):
         yield (path, input_tree)
     else:
         input_tree = dict(tree._yield_sorted_items(input_tree))
@@ -107,10 +104,35 @@ def _yield_flat_up_to(shallow_tree, input_tree, path=()):
     # pylint: enable=protected-access
 
 
+def _is_tree_leaf(structure):
+    """Check if a pytree node is a leaf, lists and strings are leaves."""
+    # pylint: disable=protected-access
+    return isinstance(structure, tree._TEXT_OR_BYTES) or not (
+        isinstance(structure, tree.collections_abc.Mapping)
+        or tree._is_namedtuple(structure)
+        or tree._is_attrs(structure)
+    )
+
+
 def _flatten_with_path(structure):
+    if isinstance(structure, dict) and all(map(_is_tree_leaf, structure.values())):
+        # flat dictionaries need no recursion, only sorting like dm-tree does
+        return [
+            ((key,), value)
+            for key, value in tree._yield_sorted_items(  # pylint: disable=protected-access
+                structure
+            )
+        ]
     return list(_yield_flat_up_to(structure, structure))
 
 
+def _is_duck_array(ary):
+    """Check if ``ary`` is an array xarray can wrap without conversion, e.g. dask arrays."""
+    return isinstance(ary, np.ndarray) or all(
+        hasattr(ary, attr) for attr in ("ndim", "shape", "dtype", "__array_function__")
+    )
+
+
 def generate_dims_coords(
     shape,
     var_name,
@@ -163,8 +185,9 @@ def generate_dims_coords(
     if coords is None:
         coords = {}
 
-    coords = deepcopy(coords)
-    dims = deepcopy(dims)
+    # only keys are added or removed, the coordinate values are never modified
+    coords = dict(coords)
+    dims = list(dims)
 
     ndims = len([dim for dim in dims if dim not in default_dims])
     if ndims > len(shape):
@@ -219,6 +242,7 @@ def numpy_to_data_array(
     default_dims=None,
     index_origin=None,
     skip_event_dims=None,
+    dtype=None,
 ):
     """Convert a numpy array to an xarray.DataArray.
 
@@ -249,17 +273,47 @@ def numpy_to_data_array(
     index_origin : int, optional
         Passed to :py:func:`generate_dims_coords`
     skip_event_dims : bool
+    dtype : str or numpy.dtype, optional
+        Dtype floating point arrays are converted to. Integer and boolean arrays are
+        never converted. Defaults to ``rcParams["data.float_dtype"]``; if that is also
+        None, the dtype of ``ary`` is kept.
 
     Returns
     -------
     xr.DataArray
         Will have the same data as passed, but with coordinates and dimensions
     """
-    # manage and transform copies
+    ary, dims, coords = _prepare_data_array(
+        ary,
+        var_name=var_name,
+        coords=coords,
+        dims=dims,
+        default_dims=default_dims,
+        index_origin=index_origin,
+        skip_event_dims=skip_event_dims,
+        dtype=dtype,
+    )
+    return xr.DataArray(ary, coords=_index_variables(coords), dims=dims)
+
+
+def _prepare_data_array(
+    ary, *, var_name, coords, dims, default_dims, index_origin, skip_event_dims, dtype
+):
+    """Get the array, dimensions and coordinates of a variable without copying its data.
+
+    Numpy arrays, including memory maps, are only reshaped into views when they have
+    less dimensions than ``default_dims`` and dask arrays are kept lazy. Data is only
+    copied when it has to be converted to ``dtype``. Coordinates are returned as
+    numpy arrays for the dimensions of the variable only.
+    """
     if default_dims is None:
         default_dims = ["chain", "draw"]
-    if "chain" in default_dims and "draw" in default_dims:
-        ary = utils.two_de(ary)
+    if not _is_duck_array(ary):
+        ary = np.asarray(ary)
+    min_ndim = 2 if "chain" in default_dims and "draw" in default_dims else 1
+    if ary.ndim < min_ndim:
+        ary = ary.reshape((1,) * (min_ndim - ary.ndim) + ary.shape)
+    if min_ndim == 2:
         n_chains, n_samples, *_ = ary.shape
         if n_chains > n_samples:
             warnings.warn(
@@ -269,8 +323,10 @@ def numpy_to_data_array(
                 ),
                 UserWarning,
             )
-    else:
-        ary = utils.one_de(ary)
+    if dtype is None:
+        dtype = rcParams["data.float_dtype"]
+    if dtype is not None and np.issubdtype(ary.dtype, np.floating) and ary.dtype != dtype:
+        ary = ary.astype(dtype)
 
     dims, coords = generate_dims_coords(
         ary.shape[len(default_dims) :],
@@ -290,13 +346,24 @@ def numpy_to_data_array(
 
     index_origin = rcParams["data.index_origin"]
     if "chain" not in coords and "chain" in default_dims:
-        coords["chain"] = np.arange(index_origin, n_chains + index_origin)
+        coords["chain"] = _sample_index(n_chains, index_origin)
     if "draw" not in coords and "draw" in default_dims:
-        coords["draw"] = np.arange(index_origin, n_samples + index_origin)
+        coords["draw"] = _sample_index(n_samples, index_origin)
 
+    if len(dims) != ary.ndim:
+        raise ValueError(
+            f"different number of dimensions on data and dims: {ary.ndim} vs {len(dims)}"
+        )
     # filter coords based on the dims
-    coords = {key: xr.IndexVariable((key,), data=np.asarray(coords[key])) for key in dims}
-    return xr.DataArray(ary, coords=coords, dims=dims)
+    return ary, dims, {key: np.asarray(coords[key]) for key in dims}
+
+
+@functools.lru_cache(maxsize=16)
+def _sample_index(size, index_origin):
+    """Get the read only chain or draw index shared by all variables of the same size."""
+    index = np.arange(index_origin, size + index_origin)
+    index.flags.writeable = False
+    return index
 
 
 def pytree_to_dataset(
@@ -309,6 +376,7 @@ def pytree_to_dataset(
     default_dims=None,
     index_origin=None,
     skip_event_dims=None,
+    dtype=None,
 ):
     """Convert a dictionary or pytree of numpy arrays to an xarray.Dataset.
 
@@ -337,6 +405,8 @@ def pytree_to_dataset(
         Necessary for PPLs which have the same name in both observed data and log
         likelihood groups, to account for their different shapes when observations are
         multivariate.
+    dtype : str or numpy.dtype, optional
+        Passed to :py:func:`numpy_to_data_array`
 
     Returns
     -------
@@ -391,8 +461,8 @@ def pytree_to_dataset(
     except TypeError:  # probably unsortable keys -- the function will still work if
         pass  # it is an honest dictionary.
 
-    data_vars = {
-        key: numpy_to_data_array(
+    variables = {
+        key: _prepare_data_array(
             values,
             var_name=key,
             coords=coords,
@@ -400,15 +470,58 @@ def pytree_to_dataset(
             default_dims=default_dims,
             index_origin=index_origin,
             skip_event_dims=skip_event_dims,
+            dtype=dtype,
         )
         for key, values in data.items()
     }
-    return xr.Dataset(data_vars=data_vars, attrs=make_attrs(attrs=attrs, library=library))
+    attrs = make_attrs(attrs=attrs, library=library)
+    # build every index once and the dataset at once instead of aligning one DataArray per
+    # variable, unless the coordinates of some variables differ and have to be aligned
+    dataset_coords = {}
+    for _, _, var_coords in variables.values():
+        for dim, coord in var_coords.items():
+            if dim not in dataset_coords:
+                dataset_coords[dim] = coord
+            elif coord is not dataset_coords[dim] and not np.array_equal(
+                coord, dataset_coords[dim]
+            ):
+                return xr.Dataset(
+                    data_vars={
+                        key: xr.DataArray(ary, coords=_index_variables(coords), dims=dims)
+                        for key, (ary, dims, coords) in variables.items()
+                    },
+                    attrs=attrs,
+                )
+    return xr.Dataset(
+        data_vars={key: xr.Variable(dims, ary) for key, (ary, dims, _) in variables.items()},
+        coords=_index_variables(dataset_coords),
+        attrs=attrs,
+    )
+
+
+def _index_variables(coords):
+    """Convert a dict of coordinate values to index variables."""
+    return {dim: xr.IndexVariable((dim,), data=coord) for dim, coord in coords.items()}
 
 
 dict_to_dataset = pytree_to_dataset
 
 
+def _group_float_dtype(dtype, group):
+    """Get the float dtype of ``group`` from the ``dtype`` argument of a converter.
+
+    ``dtype`` can be a single dtype for all groups or a dict of dtypes per group, in
+    which case warmup groups fall back to the dtype of the corresponding group.
+    """
+    if isinstance(dtype, dict):
+        if group in dtype:
+            return dtype[group]
+        if group.startswith("warmup_"):
+            return dtype.get(group[len("warmup_") :])
+        return None
+    return dtype
+
+
 def make_attrs(attrs=None, library=None):
     """Make standard attributes to attach to xarray datasets.
 
@@ -519,8 +632,63 @@ def _extend_xr_method(func, doc=None, description="", examples="", see_also=""):
     return wrapped
 
 
-def _make_json_serializable(data: dict) -> dict:
-    """Convert `data` with numpy.ndarray-like values to JSON-serializable form."""
+# keys of the array format description and of the encoded arrays in the binary json formats
+ARRAYS_JSON_KEY = "__arviz_arrays__"
+NDARRAY_JSON_KEY = "__ndarray__"
+# alignment in bytes of the arrays in binary side-car files
+_SIDECAR_ALIGNMENT = 64
+
+
+def _encode_ndarray(value, buffer=None):
+    """Encode an array as a dict with a little-endian binary payload.
+
+    The payload is base64-encoded in the dict if ``buffer`` is None, otherwise it is
+    written to the ``buffer`` file object and the dict stores its offset.
+    """
+    value = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+    encoded = {"dtype": value.dtype.str, "shape": list(value.shape)}
+    if buffer is None:
+        encoded[NDARRAY_JSON_KEY] = base64.b64encode(value.data).decode("ascii")
+    else:
+        offset = buffer.tell()
+        padding = -offset % _SIDECAR_ALIGNMENT
+        buffer.write(b"\0" * padding)
+        encoded[NDARRAY_JSON_KEY] = offset + padding
+        buffer.write(value.data)
+    return encoded
+
+
+def _decode_ndarray(encoded, buffer=None):
+    """Decode an array encoded with `_encode_ndarray` without copying its payload."""
+    dtype = np.dtype(encoded["dtype"])
+    shape = encoded["shape"]
+    payload = encoded[NDARRAY_JSON_KEY]
+    if isinstance(payload, str):
+        return np.frombuffer(base64.b64decode(payload), dtype=dtype).reshape(shape)
+    count = int(np.prod(shape))
+    return np.frombuffer(buffer, dtype=dtype, count=count, offset=payload).reshape(shape)
+
+
+def _decode_json_arrays(data: dict, buffer=None) -> dict:
+    """Convert the binary encoded arrays in `data` back to numpy arrays."""
+    ret = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if NDARRAY_JSON_KEY in value:
+                ret[key] = _decode_ndarray(value, buffer)
+            else:
+                ret[key] = _decode_json_arrays(value, buffer)
+        else:
+            ret[key] = value
+    return ret
+
+
+def _make_json_serializable(data: dict, binary=False, buffer=None) -> dict:
+    """Convert `data` with numpy.ndarray-like values to JSON-serializable form.
+
+    If `binary` is True, arrays are encoded as little-endian binary payloads with their
+    dtype and shape, see `_encode_ndarray`. Object arrays are always converted to lists.
+    """
     ret = {}
     for key, value in data.items():
         try:
@@ -531,9 +699,14 @@ def _make_json_serializable(data: dict) -> dict:
             ret[key] = value
             continue
         if isinstance(value, dict):
-            ret[key] = _make_json_serializable(value)
+            ret[key] = _make_json_serializable(value, binary=binary, buffer=buffer)
         elif isinstance(value, np.ndarray):
-            ret[key] = np.asarray(value).tolist()
+            if binary and value.dtype.kind != "O":
+                ret[key] = _encode_ndarray(value, buffer)
+            else:
+                ret[key] = np.asarray(value).tolist()
+        elif isinstance(value, np.generic):
+            ret[key] = value.item()
         else:
             raise TypeError(
                 f"Value associated with variable `{type(value)}` is not JSON serializable."
@@ -1,19 +1,27 @@
 # pylint: disable=too-many-lines,too-many-public-methods
 """Data structure for using netcdf groups with xarray."""
+import hashlib
+import itertools
 import os
 import re
 import sys
 import uuid
 import warnings
-from collections import OrderedDict, defaultdict
+import weakref
+import zlib
+from collections import OrderedDict, defaultdict, deque
 from collections.abc import MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy as ccopy
 from copy import deepcopy
 import datetime
+from functools import partial
 from html import escape
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -26,12 +34,19 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 import xarray as xr
 from packaging import version
 
 from ..rcparams import rcParams
 from ..utils import HtmlTemplate, _subset_list, _var_names, either_dict_or_kwargs
-from .base import _extend_xr_method, _make_json_serializable, dict_to_dataset
+from .base import (
+    ARRAYS_JSON_KEY,
+    _decode_json_arrays,
+    _extend_xr_method,
+    _make_json_serializable,
+    dict_to_dataset,
+)
 
 if sys.version_info[:2] >= (3, 9):
     # As of 3.9, collections.abc types support generic parameters themselves.
@@ -91,6 +106,375 @@ def _compressible_dtype(dtype):
     return dtype.kind in {"b", "i", "u", "f", "c", "S"}
 
 
+# schema metadata key of the tables created by InferenceData.to_arrow_tables
+ARROW_METADATA_KEY = "arviz"
+
+# encoding keys that can be handled when compressing netcdf chunks with python's zlib
+_DIRECT_CHUNK_ENCODING_KEYS = {"zlib", "complevel", "shuffle", "chunksizes", "_FillValue", "dtype"}
+
+
+def _netcdf_encoding(dataset, compress, chunks=None, encoding=None):
+    """Build the netcdf encoding of ``dataset`` from the ``to_netcdf`` arguments."""
+    encoding_dict = {}
+    for var_name, values in dataset.variables.items():
+        var_encoding = {}
+        if compress and _compressible_dtype(values.dtype):
+            var_encoding = {"zlib": True} if compress is True else dict(compress)
+        if chunks is not None and values.ndim > 0 and values.size > 0:
+            var_encoding["chunksizes"] = tuple(
+                min(chunks.get(dim, length), length) for dim, length in values.sizes.items()
+            )
+        if encoding is not None:
+            var_encoding.update(encoding.get(var_name, {}))
+        if var_encoding:
+            encoding_dict[var_name] = var_encoding
+    return encoding_dict
+
+
+def _zarr_encoding(dataset, compressor=None, chunks=None, encoding=None):
+    """Build the zarr encoding of ``dataset`` from the ``to_zarr`` arguments."""
+    encoding_dict = {}
+    for var_name, values in dataset.variables.items():
+        var_encoding = {}
+        if compressor is not None and _compressible_dtype(values.dtype):
+            var_encoding["compressor"] = compressor
+        if chunks is not None and values.ndim > 0 and values.size > 0:
+            var_encoding["chunks"] = tuple(
+                min(chunks.get(dim, length), length) for dim, length in values.sizes.items()
+            )
+        if encoding is not None:
+            var_encoding.update(encoding.get(var_name, {}))
+        if var_encoding:
+            encoding_dict[var_name] = var_encoding
+    return encoding_dict
+
+
+def _get_group_chunks(group, chunks):
+    """Get the chunks of ``group`` from global or per group ``chunks``."""
+    if chunks is not None and any(isinstance(value, dict) for value in chunks.values()):
+        return chunks.get(group)
+    return chunks
+
+
+def _write_zarr_group(store, group, dataset, encoding):
+    """Write a single group to a zarr store without consolidating the metadata."""
+    if any(values.chunks is not None for values in dataset.variables.values()):
+        # dask chunks must match the zarr chunks that will be written
+        dask_chunks = {}
+        for var_name, var_encoding in encoding.items():
+            if "chunks" in var_encoding:
+                dask_chunks.update(zip(dataset[var_name].dims, var_encoding["chunks"]))
+        dataset = dataset.chunk(dask_chunks) if dask_chunks else dataset
+    dataset.to_zarr(store=store, group=group, mode="w", encoding=encoding, consolidated=False)
+
+
+def _default_chunksizes(shape, itemsize, max_bytes=2**22):
+    """Halve the largest dimensions of ``shape`` until the chunks are below ``max_bytes``."""
+    chunksizes = list(shape)
+    while np.prod(chunksizes) * itemsize > max_bytes and max(chunksizes) > 1:
+        idx = int(np.argmax(chunksizes))
+        chunksizes[idx] = int(np.ceil(chunksizes[idx] / 2))
+    return tuple(chunksizes)
+
+
+def _compress_chunk(variable, offset, chunksizes, dtype, shuffle, complevel):
+    """Read a chunk of ``variable`` and compress it like the HDF5 shuffle and deflate filters."""
+    slices = tuple(slice(start, start + size) for start, size in zip(offset, chunksizes))
+    chunk = np.asarray(variable[slices].values, dtype=dtype)
+    if chunk.shape != tuple(chunksizes):
+        # HDF5 always stores full chunks, edge chunks are padded
+        padded = np.zeros(chunksizes, dtype=dtype)
+        padded[tuple(slice(0, size) for size in chunk.shape)] = chunk
+        chunk = padded
+    buffer = np.ascontiguousarray(chunk).view(np.uint8)
+    if shuffle and dtype.itemsize > 1:
+        buffer = np.ascontiguousarray(buffer.reshape(-1, dtype.itemsize).T)
+    return offset, zlib.compress(buffer, complevel)
+
+
+def _write_netcdf_chunks_parallel(filename, group, dataset, encoding, n_jobs):
+    """Write the variables of ``dataset`` to an existing netcdf group compressing in parallel.
+
+    The variables are created with h5netcdf and then the chunks, compressed with
+    :func:`zlib.compress` in a thread pool, are written directly to the HDF5 datasets.
+    The result is identical to a file written with the ``zlib`` and ``shuffle`` encodings
+    and can be read by any netCDF library.
+    """
+    import h5netcdf
+    import h5py
+
+    group = "/".join(part for part in group.split("/") if part)
+    tasks = []
+    with h5netcdf.File(filename, mode="a") as file_handle:
+        h5group = file_handle[group]
+        for var_name, data_array in dataset.data_vars.items():
+            variable = data_array.variable
+            var_encoding = dict(encoding[var_name])
+            shuffle = var_encoding.pop("shuffle", True)
+            complevel = var_encoding.pop("complevel", 4)
+            chunksizes = var_encoding.pop("chunksizes", None)
+            variable = variable.copy(deep=False)
+            variable.encoding = {
+                key: value for key, value in var_encoding.items() if key in ("_FillValue", "dtype")
+            }
+            # the chunks are written from the encoded values, which have the requested
+            # dtype and the missing values replaced by the fill value
+            variable = xr.conventions.encode_cf_variable(variable, name=var_name)
+            dtype = variable.dtype.newbyteorder("=")
+            if chunksizes is None:
+                chunksizes = _default_chunksizes(variable.shape, dtype.itemsize)
+            for dim, length in variable.sizes.items():
+                if dim not in h5group.dimensions:
+                    h5group.dimensions[dim] = length
+            attrs = dict(variable.attrs)
+            fillvalue = attrs.pop("_FillValue", None)
+            h5var = h5group.create_variable(
+                var_name,
+                dimensions=variable.dims,
+                dtype=dtype,
+                chunks=tuple(chunksizes),
+                compression="gzip",
+                compression_opts=complevel,
+                shuffle=shuffle,
+                fillvalue=fillvalue,
+            )
+            h5var.attrs.update(attrs)
+            offsets = itertools.product(
+                *(range(0, length, size) for length, size in zip(variable.shape, chunksizes))
+            )
+            tasks.extend(
+                (var_name, (variable, offset, chunksizes, dtype, shuffle, complevel))
+                for offset in offsets
+            )
+
+    with h5py.File(filename, mode="a") as file_handle, ThreadPoolExecutor(n_jobs) as executor:
+        h5group = file_handle[group]
+
+        def write_chunk(var_name, future):
+            offset, chunk_bytes = future.result()
+            h5group[var_name].id.write_direct_chunk(offset, chunk_bytes)
+
+        # keep a bounded number of compressed chunks in memory
+        pending = deque()
+        for var_name, task_args in tasks:
+            pending.append((var_name, executor.submit(_compress_chunk, *task_args)))
+            if len(pending) >= 2 * n_jobs:
+                write_chunk(*pending.popleft())
+        while pending:
+            write_chunk(*pending.popleft())
+
+
+def _chunk_dataset(dataset, chunks):
+    """Convert the variables in ``dataset`` to dask arrays following ``chunks``.
+
+    ``"auto"`` lets dask choose the chunk sizes of all dimensions but ``chain`` and ``draw``,
+    which are always kept as a single chunk. Dimensions not present in a dict
+    of chunks are also kept as a single chunk.
+    """
+    if chunks is None:
+        return dataset
+    if chunks == "auto":
+        chunks = {dim: -1 if dim in ("chain", "draw") else "auto" for dim in dataset.dims}
+    else:
+        chunks = {dim: size for dim, size in chunks.items() if dim in dataset.dims}
+    return dataset.chunk(chunks)
+
+
+def _get_group_kwargs(group, group_kwargs, regex):
+    """Get the keyword arguments to open ``group`` from ``group_kwargs``."""
+    group_kws = {}
+    if group_kwargs is not None and regex is False:
+        group_kws = group_kwargs.get(group, {})
+    if group_kwargs is not None and regex is True:
+        for key, kws in group_kwargs.items():
+            if re.search(key, group):
+                group_kws = kws
+    return dict(group_kws)
+
+
+def _open_netcdf_group(filename, group, group_kws, eager, chunks=None):
+    """Open a single group of a netcdf file, used as deferred group loader."""
+    with xr.open_dataset(filename, group=group, **group_kws) as data:
+        dataset = _chunk_dataset(data.load() if eager else data, chunks)
+    if isinstance(filename, (str, os.PathLike)):
+        _register_source_fingerprint(dataset, filename, group)
+    return dataset
+
+
+def _open_zarr_group(store, group, eager, chunks=None, group_kws=None):
+    """Open a single group of a zarr store, used as deferred group loader."""
+    if group_kws is None:
+        group_kws = {}
+    if chunks is not None:
+        # chunk from the lazily indexed arrays instead of the default zarr chunks
+        group_kws = {**group_kws, "chunks": None}
+    # consolidated metadata stores wrap the directory store
+    store_path = getattr(getattr(store, "store", store), "path", None)
+    with xr.open_zarr(store=store, group=group, **group_kws) as data:
+        dataset = _chunk_dataset(data.load() if eager else data, chunks)
+    if isinstance(store_path, str):
+        _register_source_fingerprint(dataset, os.path.join(store_path, group), group)
+    return dataset
+
+
+# fingerprints of datasets by id, with the variables they were computed from to detect
+# changes, datasets are unhashable so entries are removed by a weakref callback.
+# The fingerprint of datasets read from disk is a function called when first needed
+_FINGERPRINTS: Dict[int, Tuple["weakref.ref[xr.Dataset]", tuple, Union[str, Callable[[], str]]]] = (
+    {}
+)
+_FINGERPRINT_BLOCK_NBYTES = 2**26
+
+
+def _source_signature(path):
+    """Get the path, modification time and size of a file or of all files in a directory."""
+    path = os.path.abspath(path)
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return [(path, stat.st_mtime_ns, stat.st_size)]
+    signature = [path]
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            stat = os.stat(file_path)
+            signature.append((os.path.relpath(file_path, path), stat.st_mtime_ns, stat.st_size))
+    return signature
+
+
+def _register_source_fingerprint(dataset, path, group):
+    """Store the fingerprint of a dataset just read from disk based on metadata only.
+
+    The fingerprint combines the signature of the files at ``path`` with the names,
+    dimensions, dtypes, shapes and encodings of the variables, so no data is read to
+    compute it. The files are only inspected when the fingerprint is first requested,
+    opening a group doesn't stat every chunk of a zarr store.
+    """
+    variables = [
+        (
+            str(var_name),
+            variable.dims,
+            variable.dtype.str,
+            variable.shape,
+            sorted((key, repr(value)) for key, value in variable.encoding.items()),
+        )
+        for var_name, variable in dataset.variables.items()
+    ]
+
+    def digest():
+        signature = _source_signature(path)
+        return hashlib.blake2b(
+            repr(("source", signature, group, variables)).encode(), digest_size=16
+        ).hexdigest()
+
+    _store_fingerprint(dataset, digest)
+
+
+def _store_fingerprint(dataset, digest):
+    """Memoize the fingerprint of a dataset while it is alive."""
+    key = id(dataset)
+    _FINGERPRINTS[key] = (
+        weakref.ref(dataset, lambda _: _FINGERPRINTS.pop(key, None)),
+        tuple(dataset.variables.values()),
+        digest,
+    )
+
+
+def _array_bytes(values):
+    """Get the bytes of an array to hash, converting object arrays to strings."""
+    if values.dtype.kind == "O":
+        return "\x00".join(map(str, values.ravel())).encode()
+    return np.ascontiguousarray(values).reshape(-1).view(np.uint8)
+
+
+def _dataset_fingerprint(dataset):
+    """Compute the hash of the variables in a dataset, memoized per dataset object.
+
+    Lazy and dask backed variables are read in blocks along their first dimension,
+    without loading the whole array at once nor caching the values read.
+    """
+    variables = tuple(dataset.variables.values())
+    memo = _FINGERPRINTS.get(id(dataset))
+    if (
+        memo is not None
+        and memo[0]() is dataset
+        and len(memo[1]) == len(variables)
+        and all(old is new for old, new in zip(memo[1], variables))
+    ):
+        if not callable(memo[2]):
+            return memo[2]
+        try:
+            digest = memo[2]()
+        except OSError:
+            # the source files are gone, hash the values instead
+            pass
+        else:
+            _store_fingerprint(dataset, digest)
+            return digest
+    hasher = hashlib.blake2b(digest_size=16)
+    for var_name, variable in sorted(dataset.variables.items(), key=lambda item: str(item[0])):
+        hasher.update(
+            repr((str(var_name), variable.dims, variable.dtype.str, variable.shape)).encode()
+        )
+        if variable._in_memory or variable.ndim == 0:  # pylint: disable=protected-access
+            hasher.update(_array_bytes(variable.values))
+            continue
+        length = variable.shape[0]
+        rows = max(1, _FINGERPRINT_BLOCK_NBYTES * length // max(variable.nbytes, 1))
+        for start in range(0, length, rows):
+            hasher.update(_array_bytes(variable[start : start + rows].values))
+    digest = hasher.hexdigest()
+    _store_fingerprint(dataset, digest)
+    return digest
+
+
+def _variable_storage(variable):
+    """Get where the data of a variable is stored without loading it.
+
+    Returns "dask" for dask backed variables, "memory" for variables loaded in memory and
+    "disk" for variables lazily read from a file or store on access.
+    """
+    if variable.chunks is not None:
+        return "dask"
+    if variable._in_memory:  # pylint: disable=protected-access
+        return "memory"
+    return "disk"
+
+
+def _format_nbytes(nbytes):
+    """Format a number of bytes as a human readable string."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} TiB"
+
+
+def _dataframe_labels(
+    var_name, data_array, sample_dims, include_coords, include_index, index_origin
+):
+    """Get the column labels of the flattened non sample dimensions of ``data_array``."""
+    dims = [dim for dim in data_array.dims if dim not in sample_dims]
+    if not dims:
+        return [var_name]
+    shape = [data_array.sizes[dim] for dim in dims]
+    positions = np.indices(shape).reshape(len(dims), -1)
+    coords = [data_array[dim].values[position].tolist() for dim, position in zip(dims, positions)]
+    if not include_index:
+        return list(zip(itertools.repeat(var_name), *coords))
+    index_labels = np.char.add(
+        np.char.add(var_name, "["), (positions[0] + index_origin).astype(str)
+    )
+    for position in positions[1:]:
+        index_labels = np.char.add(
+            np.char.add(index_labels, ","), (position + index_origin).astype(str)
+        )
+    index_labels = np.char.add(index_labels, "]").tolist()
+    if not include_coords:
+        return index_labels
+    return list(zip(index_labels, *coords))
+
+
 class InferenceData(Mapping[str, xr.Dataset]):
     """Container for inference data storage using xarray.
 
@@ -102,7 +486,12 @@ class InferenceData(Mapping[str, xr.Dataset]):
     def __init__(
         self,
         attrs: Union[None, Mapping[Any, Any]] = None,
-        **kwargs: Union[xr.Dataset, List[xr.Dataset], Tuple[xr.Dataset, xr.Dataset]],
+        **kwargs: Union[
+            xr.Dataset,
+            List[xr.Dataset],
+            Tuple[xr.Dataset, xr.Dataset],
+            Callable[[], xr.Dataset],
+        ],
     ) -> None:
         """Initialize InferenceData object from keyword xarray datasets.
 
@@ -111,7 +500,9 @@ class InferenceData(Mapping[str, xr.Dataset]):
         attrs : dict
             sets global attribute for InferenceData object.
         kwargs :
-            Keyword arguments of xarray datasets
+            Keyword arguments of xarray datasets. Callables taking no arguments and
+            returning a dataset are also accepted, in which case the group is deferred:
+            the callable is only called the first time the group is accessed.
 
         Examples
         --------
@@ -148,6 +539,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         """
         self._groups: List[str] = []
         self._groups_warmup: List[str] = []
+        self._lazy_groups: Dict[str, Callable[[], xr.Dataset]] = {}
         self._attrs: Union[None, dict] = dict(attrs) if attrs is not None else None
         save_warmup = kwargs.pop("save_warmup", False)
         key_list = [key for key in SUPPORTED_GROUPS_ALL if key in kwargs]
@@ -164,6 +556,13 @@ class InferenceData(Mapping[str, xr.Dataset]):
                 continue
             elif isinstance(dataset, (list, tuple)):
                 dataset, dataset_warmup = dataset
+            elif callable(dataset):
+                self._lazy_groups[key] = dataset
+                if key.startswith(WARMUP_TAG):
+                    self._groups_warmup.append(key)
+                else:
+                    self._groups.append(key)
+                continue
             elif not isinstance(dataset, xr.Dataset):
                 raise ValueError(
                     "Arguments to InferenceData must be xarray Datasets "
@@ -182,6 +581,26 @@ class InferenceData(Mapping[str, xr.Dataset]):
                 setattr(self, key, dataset_warmup)
                 self._groups_warmup.append(key)
 
+    def __getattr__(self, name: str) -> xr.Dataset:
+        """Load deferred groups the first time they are accessed."""
+        # use __dict__ directly, _lazy_groups may not exist yet when unpickling or copying
+        lazy_groups = self.__dict__.get("_lazy_groups", {})
+        if name in lazy_groups:
+            dataset = lazy_groups.pop(name)()
+            setattr(self, name, dataset)
+            return dataset
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _is_deferred(self, group: str) -> bool:
+        """Check if the group is deferred and has not been loaded yet."""
+        return group in self._lazy_groups and group not in self.__dict__
+
+    def _get_group_dataset(self, group: str) -> xr.Dataset:
+        """Get the dataset of a group without caching it if the group is deferred."""
+        if self._is_deferred(group):
+            return self._lazy_groups[group]()
+        return getattr(self, group)
+
     @property
     def attrs(self) -> dict:
         """Attributes of InferenceData object."""
@@ -211,14 +630,30 @@ class InferenceData(Mapping[str, xr.Dataset]):
             if display_style == "text":
                 html_repr = f"<pre>{escape(repr(self))}</pre>"
             else:
+                details = dict.fromkeys(self._groups_all, "")
+                if rcParams["data.repr_memory"]:
+                    usage = self.memory_usage()
+                    for group in details:
+                        group_usage = usage.loc[group]
+                        details[group] = (
+                            "deferred"
+                            if self._is_deferred(group)
+                            else f"{_format_nbytes(group_usage['nbytes'].sum())} "
+                            f"({_format_nbytes(group_usage['loaded_nbytes'].sum())} loaded)"
+                        )
                 elements = "".join(
                     [
                         HtmlTemplate.element_template.format(
                             group_id=group + str(uuid.uuid4()),
                             group=group,
-                            xr_data=getattr(  # pylint: disable=protected-access
-                                self, group
-                            )._repr_html_(),
+                            details=details[group],
+                            xr_data=(
+                                "<pre>Deferred group, loaded on first access</pre>"
+                                if self._is_deferred(group)
+                                else getattr(  # pylint: disable=protected-access
+                                    self, group
+                                )._repr_html_()
+                            ),
                         )
                         for group in self._groups_all
                     ]
@@ -238,6 +673,10 @@ class InferenceData(Mapping[str, xr.Dataset]):
             self._groups.remove(group)
         elif group in self._groups_warmup:
             self._groups_warmup.remove(group)
+        if self._is_deferred(group):
+            del self._lazy_groups[group]
+            return
+        self._lazy_groups.pop(group, None)
         object.__delattr__(self, group)
 
     def __delitem__(self, key: str) -> None:
@@ -343,6 +782,186 @@ class InferenceData(Mapping[str, xr.Dataset]):
         """Return a view over the groups and datasets present in the InferenceData object."""
         return InferenceData.InferenceDataItemsView(self)
 
+    @property
+    def nbytes(self) -> int:
+        """Total bytes of the data in all groups once loaded in memory.
+
+        Lazy and dask backed variables count with their full size without being loaded.
+        Deferred groups that have not been accessed yet are not included.
+        """
+        return sum(
+            getattr(self, group).nbytes
+            for group in self._groups_all
+            if not self._is_deferred(group)
+        )
+
+    def fingerprint(self, groups=None, filter_groups=None) -> str:
+        """Compute a hash of the content of the InferenceData to use as cache key.
+
+        The hash covers the names, dimensions, dtypes and values of all variables and
+        coordinates in the selected groups; attributes are not included. Arrays are
+        hashed with BLAKE2 directly from their buffers, lazy and dask backed arrays are
+        read in blocks without being kept in memory. The fingerprint of each group is
+        memoized while the dataset object and its variables stay the same, so arrays
+        modified in place are not detected.
+
+        Groups read with :meth:`from_netcdf` or :meth:`from_zarr` and not modified since
+        use the path, modification time and size of the files together with the
+        encoding of the variables instead, so no data is read. Their fingerprint
+        changes when the files are written again, but it is different from the
+        fingerprint of the same data in memory.
+
+        Parameters
+        ----------
+        groups : str or list of str, optional
+            Groups included in the fingerprint. Can either be group names or metagroup
+            names. Defaults to all groups.
+        filter_groups : {None, "like", "regex"}, optional, default=None
+            If `None` (default), interpret groups as the real group or metagroup names.
+            If "like", interpret groups as substrings of the real group or metagroup names.
+            If "regex", interpret groups as regular expressions on the real group or
+            metagroup names. A la `pandas.filter`.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest.
+
+        Examples
+        --------
+        Cache the result of an expensive computation:
+
+        .. code-block:: python
+
+            cache = {}
+            key = idata.fingerprint(groups=["posterior", "log_likelihood"])
+            if key not in cache:
+                cache[key] = az.loo(idata)
+
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for group in self._group_names(groups, filter_groups):
+            hasher.update(group.encode())
+            hasher.update(_dataset_fingerprint(self._get_group_dataset(group)).encode())
+        return hasher.hexdigest()
+
+    def memory_usage(self, groups=None, filter_groups=None) -> pd.DataFrame:
+        """Get the memory usage of each variable without loading any data.
+
+        Parameters
+        ----------
+        groups : str or list of str, optional
+            Groups where the memory usage is computed.
+        filter_groups : {None, "like", "regex"}, optional, default=None
+            If `None` (default), interpret groups as the real group or metagroup names.
+            If "like", interpret groups as substrings of the real group or metagroup names.
+            If "regex", interpret groups as regular expressions on the real group or
+            metagroup names. A la `pandas.filter`.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe indexed by group and variable, coordinates included, with columns:
+
+            - ``dtype`` and ``shape`` of the variable.
+            - ``storage``: "memory" for loaded numpy arrays, "dask" for dask arrays,
+              "disk" for variables read from a file or store when accessed and "deferred"
+              for groups that have not been opened yet, represented by a single row.
+            - ``nbytes``: bytes of the variable once loaded in memory, missing for deferred
+              groups.
+            - ``loaded_nbytes``: bytes currently held in memory.
+
+        See Also
+        --------
+        info : Print a summary of the groups, with their memory usage if requested.
+        """
+        rows = []
+        index = []
+        for group in self._group_names(groups, filter_groups):
+            if self._is_deferred(group):
+                index.append((group, ""))
+                rows.append((None, None, "deferred", pd.NA, 0))
+                continue
+            for var_name, variable in getattr(self, group).variables.items():
+                storage = _variable_storage(variable)
+                nbytes = variable.nbytes
+                index.append((group, var_name))
+                rows.append(
+                    (
+                        variable.dtype,
+                        variable.shape,
+                        storage,
+                        nbytes,
+                        nbytes if storage == "memory" else 0,
+                    )
+                )
+        memory = pd.DataFrame(
+            rows,
+            index=pd.MultiIndex.from_tuples(index, names=["group", "variable"]),
+            columns=["dtype", "shape", "storage", "nbytes", "loaded_nbytes"],
+        )
+        return memory.astype({"nbytes": "Int64", "loaded_nbytes": "int64"})
+
+    def info(self, memory=False, buf=None) -> None:
+        """Print a summary of the groups and variables in the InferenceData.
+
+        Parameters
+        ----------
+        memory : bool, default False
+            Include the memory usage of each group and variable, where its data is
+            stored and the size on disk of the files groups are read from. No data is
+            loaded to compute it.
+        buf : file-like, optional
+            Writable buffer, defaults to ``sys.stdout``.
+
+        See Also
+        --------
+        memory_usage : Get the memory usage of each variable as a DataFrame.
+        """
+        if buf is None:
+            buf = sys.stdout
+        lines = ["arviz.InferenceData"]
+        if memory:
+            usage = self.memory_usage()
+            nbytes = usage["nbytes"].sum()
+            loaded_nbytes = usage["loaded_nbytes"].sum()
+            lines.append(
+                f"memory: {_format_nbytes(nbytes)} ({_format_nbytes(loaded_nbytes)} loaded)"
+            )
+        sources = {}
+        for group in self._groups_all:
+            if self._is_deferred(group):
+                lines.append(f"{group}: deferred, loaded on first access")
+                continue
+            dataset = getattr(self, group)
+            sizes = ", ".join(f"{dim}: {size}" for dim, size in dataset.sizes.items())
+            header = f"{group}: {len(dataset.data_vars)} variables ({sizes})"
+            source = dataset.encoding.get("source")
+            if isinstance(source, str) and os.path.isfile(source):
+                sources[source] = os.path.getsize(source)
+            if not memory:
+                lines.append(header)
+                lines.extend(f"    {var_name}" for var_name in dataset.data_vars)
+                continue
+            group_usage = usage.loc[group]
+            lines.append(
+                f"{header}, {_format_nbytes(group_usage['nbytes'].sum())} "
+                f"({_format_nbytes(group_usage['loaded_nbytes'].sum())} loaded)"
+            )
+            width = max(len(str(var_name)) for var_name in group_usage.index)
+            for var_name, row in group_usage.iterrows():
+                lines.append(
+                    f"    {str(var_name):<{width}}  {str(row['dtype']):<8} "
+                    f"{str(row['shape']):<16} {_format_nbytes(row['nbytes']):>10}  "
+                    f"{row['storage']}"
+                )
+        if memory and sources:
+            lines.append("sources:")
+            lines.extend(
+                f"    {source}: {_format_nbytes(size)} on disk" for source, size in sources.items()
+            )
+        buf.write("\n".join(lines) + "\n")
+
     @staticmethod
     def from_netcdf(
         filename,
@@ -351,6 +970,8 @@ class InferenceData(Mapping[str, xr.Dataset]):
         group_kwargs=None,
         regex=False,
         base_group: str = "/",
+        defer_groups: bool = False,
+        chunks=None,
     ) -> "InferenceData":
         """Initialize object from a netcdf file.
 
@@ -369,13 +990,22 @@ class InferenceData(Mapping[str, xr.Dataset]):
             Keyword arguments to be passed into each call of :func:`xarray.open_dataset`.
             The keys of the higher level should be group names or regex matching group
             names, the inner dicts re passed to ``open_dataset``
-            This feature is currently experimental.
+            This feature is currently experimental. A ``chunks`` key in the inner
+            dicts overrides the ``chunks`` argument for the matching groups.
         regex : bool, default False
             Specifies where regex search should be used to extend the keyword arguments.
             This feature is currently experimental.
         base_group : str, default "/"
             The group in the netCDF file where the InferenceData is stored. By default,
             assumes that the file only contains an InferenceData object.
+        defer_groups : bool, default False
+            If True, groups are not opened until they are first accessed, so only the
+            groups that are used are read from the file.
+        chunks : "auto" or dict of {str: int}, optional
+            Dask chunks of the returned datasets. ``"auto"`` lets dask choose the chunks
+            of all dimensions but ``chain`` and ``draw``, which are never split. With a
+            dict, dimensions not present in it are kept as a single chunk.
+            Defaults to ``rcParams["data.chunks"]``, which by default disables chunking.
 
         Returns
         -------
@@ -383,6 +1013,8 @@ class InferenceData(Mapping[str, xr.Dataset]):
         """
         groups = {}
         attrs = {}
+        if chunks is None:
+            chunks = rcParams["data.chunks"]
 
         if engine == "h5netcdf":
             import h5netcdf
@@ -407,21 +1039,18 @@ class InferenceData(Mapping[str, xr.Dataset]):
                 data_groups = list(data.groups)
 
             for group in data_groups:
-                group_kws = {}
-
-                group_kws = {}
-                if group_kwargs is not None and regex is False:
-                    group_kws = group_kwargs.get(group, {})
-                if group_kwargs is not None and regex is True:
-                    for key, kws in group_kwargs.items():
-                        if re.search(key, group):
-                            group_kws = kws
+                group_kws = _get_group_kwargs(group, group_kwargs, regex)
                 group_kws.setdefault("engine", engine)
-                with xr.open_dataset(filename, group=f"{base_group}/{group}", **group_kws) as data:
-                    if rcParams["data.load"] == "eager":
-                        groups[group] = data.load()
-                    else:
-                        groups[group] = data
+                group_chunks = group_kws.pop("chunks", chunks)
+                group_loader = partial(
+                    _open_netcdf_group,
+                    filename,
+                    f"{base_group}/{group}",
+                    group_kws,
+                    rcParams["data.load"] == "eager",
+                    group_chunks,
+                )
+                groups[group] = group_loader if defer_groups else group_loader()
 
             with xr.open_dataset(filename, engine=engine, group=base_group) as data:
                 attrs.update(data.load().attrs)
@@ -449,6 +1078,9 @@ class InferenceData(Mapping[str, xr.Dataset]):
         engine: str = "h5netcdf",
         base_group: str = "/",
         overwrite_existing: bool = True,
+        encoding: Optional[Mapping[str, Mapping[str, dict]]] = None,
+        chunks: Optional[Mapping[str, int]] = None,
+        n_jobs: int = 1,
     ) -> str:
         """Write InferenceData to netcdf4 file.
 
@@ -456,9 +1088,12 @@ class InferenceData(Mapping[str, xr.Dataset]):
         ----------
         filename : str
             Location to write to
-        compress : bool, optional
+        compress : bool or dict, optional
             Whether to compress result. Note this saves disk space, but may make
-            saving and loading somewhat slower (default: True).
+            saving and loading somewhat slower (default: True). A dict is used as
+            encoding of all the compressible variables instead of ``{"zlib": True}``, e.g.
+            ``{"zlib": True, "complevel": 6, "shuffle": True}`` or, with h5netcdf,
+            ``{"compression": "lzf"}`` and the filters from ``hdf5plugin``.
         groups : list, optional
             Write only these groups to netcdf file.
         engine : {"h5netcdf", "netcdf4"}, default "h5netcdf"
@@ -468,6 +1103,17 @@ class InferenceData(Mapping[str, xr.Dataset]):
             By default, will write to the root of the netCDF file
         overwrite_existing : bool, default True
             Whether to overwrite the existing file or append to it.
+        encoding : dict of {str : dict of {str : dict}}, optional
+            Per group and per variable netcdf encoding, updating the encoding defined
+            by ``compress`` and ``chunks``. See :meth:`xarray.Dataset.to_netcdf`.
+        chunks : dict of {str : int}, optional
+            Size of the chunks of each dimension in the netcdf file. Dimensions not present
+            are stored as a single chunk.
+        n_jobs : int, default 1
+            Number of threads used to compress the variables. With ``n_jobs > 1``,
+            variables compressed with ``zlib`` (and optionally ``shuffle``) are compressed
+            chunk by chunk in parallel and written to the file directly, which requires h5py.
+            Other variables are written by xarray.
 
         Returns
         -------
@@ -495,15 +1141,42 @@ class InferenceData(Mapping[str, xr.Dataset]):
                 groups = [group for group in self._groups_all if group in groups]
 
             for group in groups:
-                data = getattr(self, group)
-                kwargs = {"engine": engine}
-                if compress:
-                    kwargs["encoding"] = {
-                        var_name: {"zlib": True}
-                        for var_name, values in data.variables.items()
-                        if _compressible_dtype(values.dtype)
-                    }
-                data.to_netcdf(filename, mode=mode, group=f"{base_group}/{group}", **kwargs)
+                data = self._get_group_dataset(group)
+                group_encoding = _netcdf_encoding(
+                    data,
+                    compress,
+                    chunks=chunks,
+                    encoding=None if encoding is None else encoding.get(group),
+                )
+                parallel_vars = []
+                if n_jobs > 1:
+                    parallel_vars = [
+                        var_name
+                        for var_name, values in data.data_vars.items()
+                        if values.dtype.kind in "iuf"
+                        and values.size > 0
+                        and group_encoding.get(var_name, {}).get("zlib", False)
+                        and set(group_encoding[var_name]).issubset(_DIRECT_CHUNK_ENCODING_KEYS)
+                    ]
+                data.drop_vars(parallel_vars).to_netcdf(
+                    filename,
+                    mode=mode,
+                    group=f"{base_group}/{group}",
+                    engine=engine,
+                    encoding={
+                        var_name: var_encoding
+                        for var_name, var_encoding in group_encoding.items()
+                        if var_name not in parallel_vars
+                    },
+                )
+                if parallel_vars:
+                    _write_netcdf_chunks_parallel(
+                        filename,
+                        f"{base_group}/{group}",
+                        data[parallel_vars],
+                        group_encoding,
+                        n_jobs,
+                    )
                 data.close()
                 mode = "a"
         elif not self._attrs:  # creates a netcdf file for an empty InferenceData object.
@@ -593,7 +1266,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         ret["attrs"] = self.attrs
         return ret
 
-    def to_json(self, filename, groups=None, filter_groups=None, **kwargs):
+    def to_json(self, filename, groups=None, filter_groups=None, array_format="list", **kwargs):
         """Write InferenceData to a json file.
 
         Parameters
@@ -608,6 +1281,12 @@ class InferenceData(Mapping[str, xr.Dataset]):
             If "like", interpret groups as substrings of the real group or metagroup names.
             If "regex", interpret groups as regular expressions on the real group or
             metagroup names. A la `pandas.filter`.
+        array_format : {"list", "base64", "binary"}, default "list"
+            How arrays are stored. "list" stores them as nested lists. "base64" stores
+            their little-endian buffers base64-encoded in the json file along with
+            their dtype and shape. "binary" writes the buffers to a side-car file
+            named ``filename + ".bin"`` and only stores their dtype, shape and offset
+            in the json file. :func:`arviz.from_json` detects the format automatically.
         kwargs : dict
             kwargs passed to json.dump()
 
@@ -616,9 +1295,25 @@ class InferenceData(Mapping[str, xr.Dataset]):
         str
             Location of json file
         """
-        idata_dict = _make_json_serializable(
-            self.to_dict(groups=groups, filter_groups=filter_groups)
-        )
+        if array_format not in ("list", "base64", "binary"):
+            raise ValueError(
+                f"Invalid value for array_format: {array_format}. "
+                "Valid options are: list, base64 or binary"
+            )
+        idata_dict = self.to_dict(groups=groups, filter_groups=filter_groups)
+        if array_format == "binary":
+            sidecar = f"{filename}.bin"
+            with open(sidecar, "wb") as buffer:
+                idata_dict = _make_json_serializable(idata_dict, binary=True, buffer=buffer)
+            idata_dict[ARRAYS_JSON_KEY] = {
+                "format": array_format,
+                "file": os.path.basename(sidecar),
+            }
+        elif array_format == "base64":
+            idata_dict = _make_json_serializable(idata_dict, binary=True)
+            idata_dict[ARRAYS_JSON_KEY] = {"format": array_format}
+        else:
+            idata_dict = _make_json_serializable(idata_dict)
 
         with open(filename, "w", encoding="utf8") as file:
             json.dump(idata_dict, file, **kwargs)
@@ -680,7 +1375,6 @@ class InferenceData(Mapping[str, xr.Dataset]):
         pandas.DataFrame
             A pandas DataFrame containing all selected groups of InferenceData object.
         """
-        # pylint: disable=too-many-nested-blocks
         if not include_coords and not include_index:
             raise TypeError("Both include_coords and include_index can not be False.")
         if index_origin is None:
@@ -695,7 +1389,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         if not group_names:
             raise TypeError(f"No valid groups found: {groups}")
 
-        dfs = {}
+        frames = []
         for group in group_names:
             dataset = self[group]
             group_var_names = _var_names(var_names, dataset, filter_vars, "ignore")
@@ -703,67 +1397,70 @@ class InferenceData(Mapping[str, xr.Dataset]):
                 continue
             if group_var_names is not None:
                 dataset = dataset[[var_name for var_name in group_var_names if var_name in dataset]]
-            df = None
-            coords_to_idx = {
-                name: dict(map(reversed, enumerate(dataset.coords[name].values, index_origin)))
-                for name in list(filter(lambda x: x not in ("chain", "draw"), dataset.coords))
-            }
-            for data_array in dataset.values():
-                dataframe = data_array.to_dataframe()
-                if list(filter(lambda x: x not in ("chain", "draw"), data_array.dims)):
-                    levels = [
-                        idx
-                        for idx, dim in enumerate(data_array.dims)
-                        if dim not in ("chain", "draw")
-                    ]
-                    dataframe = dataframe.unstack(level=levels)
-                    tuple_columns = []
-                    for name, *coords in dataframe.columns:
-                        if include_index:
-                            idxs = []
-                            for coordname, coorditem in zip(dataframe.columns.names[1:], coords):
-                                idxs.append(coords_to_idx[coordname][coorditem])
-                            if include_coords:
-                                tuple_columns.append(
-                                    (f"{name}[{','.join(map(str, idxs))}]", *coords)
-                                )
-                            else:
-                                tuple_columns.append(f"{name}[{','.join(map(str, idxs))}]")
-                        else:
-                            tuple_columns.append((name, *coords))
-
-                    dataframe.columns = tuple_columns
-                    dataframe.sort_index(axis=1, inplace=True)
-                if df is None:
-                    df = dataframe
-                    continue
-                df = df.join(dataframe, how="outer")
-            if df is not None:
-                df = df.reset_index()
-                dfs[group] = df
-        if not dfs:
-            raise ValueError("No data selected for the dataframe.")
-        if len(dfs) > 1:
-            for group, df in dfs.items():
-                df.columns = [
+            if not dataset.data_vars:
+                continue
+            sample_dims = [dim for dim in ("chain", "draw") if dim in dataset.dims]
+            sample_index = pd.MultiIndex.from_product(
+                [dataset[dim].values for dim in sample_dims], names=sample_dims
+            )
+            # consecutive variables with the same dtype are stored in a single 2d block
+            blocks = []
+            for var_name, data_array in dataset.data_vars.items():
+                if any(dim not in data_array.dims for dim in sample_dims):
+                    data_array = data_array.broadcast_like(dataset[sample_dims])
+                data_array = data_array.transpose(*sample_dims, ...)
+                values = data_array.values.reshape(len(sample_index), -1)
+                labels = _dataframe_labels(
+                    var_name, data_array, sample_dims, include_coords, include_index, index_origin
+                )
+                if blocks and blocks[-1][0] == values.dtype:
+                    blocks[-1][1].append(values)
+                    blocks[-1][2].extend(labels)
+                else:
+                    blocks.append((values.dtype, [values], labels))
+            for _, block_values, labels in blocks:
+                frames.append(
                     (
-                        col
-                        if col in ("draw", "chain")
-                        else (group, *col) if isinstance(col, tuple) else (group, col)
+                        group,
+                        labels,
+                        pd.DataFrame(
+                            (
+                                np.concatenate(block_values, axis=1)
+                                if len(block_values) > 1
+                                else block_values[0]
+                            ),
+                            index=sample_index,
+                            copy=False,
+                        ),
                     )
-                    for col in df.columns
+                )
+        if not frames:
+            raise ValueError("No data selected for the dataframe.")
+        columns = []
+        multiple_groups = len({group for group, _, _ in frames}) > 1
+        for group, labels, _ in frames:
+            if multiple_groups:
+                labels = [
+                    (group, *label) if isinstance(label, tuple) else (group, label)
+                    for label in labels
                 ]
-            dfs, *dfs_tail = list(dfs.values())
-            for df in dfs_tail:
-                dfs = dfs.merge(df, how="outer", copy=False)
+            columns.extend(labels)
+        # all groups are aligned on their (chain, draw) index in a single concatenation
+        if len(frames) > 1:
+            df = pd.concat([frame for _, _, frame in frames], axis=1, copy=False)
         else:
-            (dfs,) = dfs.values()  # pylint: disable=unbalanced-dict-unpacking
-        return dfs
+            df = frames[0][2]
+        df.columns = pd.Index(columns, dtype=object, tupleize_cols=False)
+        return df.reset_index()
 
-    def to_zarr(self, store=None):
+    def to_zarr(
+        self, store=None, groups=None, encoding=None, chunks=None, compressor=None, n_jobs=None
+    ):
         """Convert InferenceData to a :class:`zarr.hierarchy.Group`.
 
-        The zarr storage is using the same group names as the InferenceData.
+        The zarr storage is using the same group names as the InferenceData. The metadata
+        of all groups is consolidated once all groups have been written, so the store
+        can be opened with a single metadata read.
 
         Raises
         ------
@@ -774,6 +1471,22 @@ class InferenceData(Mapping[str, xr.Dataset]):
         ----------
         store: zarr.storage i.e MutableMapping or str, optional
             Zarr storage class or path to desired DirectoryStore.
+        groups : list, optional
+            Write only these groups to the store. Defaults to all groups.
+        encoding : dict of {str : dict of {str : dict}}, optional
+            Encoding of the variables of each group. The keys of the outer dict are group
+            names, the inner dicts are passed to :meth:`xarray.Dataset.to_zarr` and
+            take precedence over ``chunks`` and ``compressor``.
+        chunks : dict of {str : int}, optional
+            Chunk sizes of the zarr arrays for each dimension. Dimensions not present in
+            the dict are stored as a single chunk. Defaults to the zarr chunking.
+            A dict of {group name : dict of {str : int}} sets the chunks per group.
+        compressor : numcodecs.abc.Codec or dict of {str : numcodecs.abc.Codec}, optional
+            Compressor used for all numeric variables, or a dict of compressors per group.
+            Defaults to the zarr default compressor.
+        n_jobs : int, optional
+            Number of groups written concurrently. Defaults to the default number of
+            workers of :class:`concurrent.futures.ThreadPoolExecutor`.
 
         Returns
         -------
@@ -799,34 +1512,82 @@ class InferenceData(Mapping[str, xr.Dataset]):
         elif not isinstance(store, MutableMapping):
             raise TypeError(f"No valid store found: {store}")
 
-        groups = self.groups()
+        if groups is None:
+            groups = self.groups()
+        else:
+            groups = [group for group in self._groups_all if group in groups]
 
         if not groups:
             raise TypeError("No valid groups found!")
 
         # order matters here, saving attrs after the groups will erase the groups.
         if self.attrs:
-            xr.Dataset(attrs=self.attrs).to_zarr(store=store, mode="w")
+            xr.Dataset(attrs=self.attrs).to_zarr(store=store, mode="w", consolidated=False)
+        else:
+            zarr.open_group(store, mode="a")
 
+        write_kwargs = []
         for group in groups:
-            # Create zarr group in store with same group name
-            getattr(self, group).to_zarr(store=store, group=group, mode="w")
+            data = self._get_group_dataset(group)
+            group_encoding = _zarr_encoding(
+                data,
+                compressor=compressor.get(group) if isinstance(compressor, dict) else compressor,
+                chunks=_get_group_chunks(group, chunks),
+                encoding=None if encoding is None else encoding.get(group),
+            )
+            write_kwargs.append((group, data, group_encoding))
+
+        if n_jobs == 1:
+            for group, data, group_encoding in write_kwargs:
+                _write_zarr_group(store, group, data, group_encoding)
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(_write_zarr_group, store, group, data, group_encoding)
+                    for group, data, group_encoding in write_kwargs
+                ]
+                for future in futures:
+                    future.result()
 
+        zarr.consolidate_metadata(store)
         return zarr.open(store)  # Open store to get overarching group
 
     @staticmethod
-    def from_zarr(store) -> "InferenceData":
+    def from_zarr(
+        store, defer_groups=False, chunks=None, group_kwargs=None, regex=False, n_jobs=None
+    ) -> "InferenceData":
         """Initialize object from a zarr store or path.
 
         Expects that the zarr store will have groups, each of which can be loaded by xarray.
-        By default, the datasets of the InferenceData object will be lazily loaded instead
-        of being loaded into memory. This
+        If the store has consolidated metadata, it is used to open all groups with a
+        single metadata read. By default, the datasets of the InferenceData object will
+        be lazily loaded instead of being loaded into memory. This
         behaviour is regulated by the value of ``az.rcParams["data.load"]``.
 
         Parameters
         ----------
         store: MutableMapping or zarr.hierarchy.Group or str.
             Zarr storage class or path to desired Store.
+        defer_groups : bool, default False
+            If True, groups are not opened until they are first accessed, so only the
+            groups that are used are read from the store.
+        chunks : "auto" or dict of {str: int}, optional
+            Dask chunks of the returned datasets. ``"auto"`` lets dask choose the chunks
+            of all dimensions but ``chain`` and ``draw``, which are never split. With a
+            dict, dimensions not present in it are kept as a single chunk.
+            Defaults to ``rcParams["data.chunks"]``. If that is also None, the chunks
+            stored in the zarr arrays are used.
+        group_kwargs : dict of {str: dict}, optional
+            Keyword arguments to be passed into each call of :func:`xarray.open_zarr`.
+            The keys of the higher level should be group names or regex matching group
+            names, the inner dicts re passed to ``open_zarr``. A ``chunks`` key in the
+            inner dicts overrides the ``chunks`` argument for the matching groups.
+        regex : bool, default False
+            Specifies where regex search should be used to extend the keyword arguments.
+        n_jobs : int, optional
+            Number of groups opened concurrently. Defaults to the default number of
+            workers of :class:`concurrent.futures.ThreadPoolExecutor`. Ignored if
+            ``defer_groups`` is True.
 
         Returns
         -------
@@ -851,19 +1612,262 @@ class InferenceData(Mapping[str, xr.Dataset]):
         elif not isinstance(store, MutableMapping):
             raise TypeError(f"No valid store found: {store}")
 
-        groups = {}
-        zarr_handle = zarr.open(store, mode="r")
+        # read the metadata of all groups at once if it has been consolidated
+        if ".zmetadata" in store:
+            zarr_handle = zarr.open_consolidated(store, mode="r")
+        else:
+            zarr_handle = zarr.open(store, mode="r")
+        if chunks is None:
+            chunks = rcParams["data.chunks"]
 
         # Open each group via xarray method
-        for key_group, _ in zarr_handle.groups():
-            with xr.open_zarr(store=store, group=key_group) as data:
-                groups[key_group] = data.load() if rcParams["data.load"] == "eager" else data
+        group_loaders = {}
+        for key_group in zarr_handle.group_keys():
+            group_kws = _get_group_kwargs(key_group, group_kwargs, regex)
+            group_chunks = group_kws.pop("chunks", chunks)
+            group_kws = {
+                "chunk_store": zarr_handle.chunk_store,
+                "consolidated": False,
+                **group_kws,
+            }
+            group_loaders[key_group] = partial(
+                _open_zarr_group,
+                zarr_handle.store,
+                key_group,
+                rcParams["data.load"] == "eager",
+                group_chunks,
+                group_kws,
+            )
+
+        if defer_groups:
+            groups = group_loaders
+        elif n_jobs == 1 or len(group_loaders) < 2:
+            groups = {key_group: loader() for key_group, loader in group_loaders.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                futures = {
+                    key_group: executor.submit(loader)
+                    for key_group, loader in group_loaders.items()
+                }
+                groups = {key_group: future.result() for key_group, future in futures.items()}
+
+        attrs = zarr_handle.attrs.asdict()
+
+        return InferenceData(attrs=attrs, **groups)
+
+    def to_arrow_tables(self, groups=None, filter_groups=None):
+        """Convert the groups of the InferenceData to :class:`pyarrow.Table` objects.
+
+        Each table has ``chain`` and ``draw`` columns followed by one column per variable.
+        Variables with more dimensions than ``chain`` and ``draw`` are stored as
+        fixed size list columns with their flattened values. The dimensions and
+        coordinates of the group, its attributes and the global attributes are stored
+        in the schema metadata. Numeric arrays whose ``chain`` and ``draw`` dimensions
+        are contiguous are shared with the tables without copying.
 
-        with xr.open_zarr(store=store) as root:
-            attrs = root.attrs
+        Parameters
+        ----------
+        groups : list, optional
+            Groups where the transformation is to be applied. Can either be group names
+            or metagroup names.
+        filter_groups: {None, "like", "regex"}, optional, default=None
+            If `None` (default), interpret groups as the real group or metagroup names.
+            If "like", interpret groups as substrings of the real group or metagroup names.
+            If "regex", interpret groups as regular expressions on the real group or
+            metagroup names. A la `pandas.filter`.
 
+        Returns
+        -------
+        dict of {str : pyarrow.Table}
+        """
+        try:
+            import pyarrow as pa
+        except ModuleNotFoundError as err:
+            raise ModuleNotFoundError(
+                "pyarrow must be installed in order to use InferenceData.to_arrow_tables"
+            ) from err
+
+        tables = {}
+        for group in self._group_names(groups, filter_groups):
+            dataset = self._get_group_dataset(group)
+            sample_dims = [dim for dim in ("chain", "draw") if dim in dataset.dims]
+            sample_shape = [dataset.sizes[dim] for dim in sample_dims]
+            n_rows = int(np.prod(sample_shape))
+            columns = {}
+            if "chain" in dataset.dims:
+                columns["chain"] = pa.array(
+                    np.repeat(dataset["chain"].values, n_rows // sample_shape[0])
+                )
+            if "draw" in dataset.dims:
+                columns["draw"] = pa.array(
+                    np.tile(dataset["draw"].values, n_rows // sample_shape[-1])
+                )
+            variables = {}
+            for var_name, data_array in dataset.data_vars.items():
+                variables[var_name] = {
+                    "dims": list(data_array.dims),
+                    "attrs": data_array.attrs,
+                }
+                if any(dim not in data_array.dims for dim in sample_dims):
+                    data_array = data_array.broadcast_like(dataset[sample_dims])
+                data_array = data_array.transpose(*sample_dims, ...)
+                values = data_array.values
+                shape = values.shape[len(sample_dims) :]
+                variables[var_name]["shape"] = list(shape)
+                flat_values = pa.array(values.reshape(-1))
+                if shape:
+                    columns[var_name] = pa.FixedSizeListArray.from_arrays(
+                        flat_values, int(np.prod(shape))
+                    )
+                else:
+                    columns[var_name] = flat_values
+            coords = {
+                coord_name: {"dims": list(coord.dims), "data": coord.values}
+                for coord_name, coord in dataset.coords.items()
+            }
+            metadata = {
+                "group": group,
+                "sample_dims": sample_dims,
+                "coords": coords,
+                "variables": variables,
+                "attrs": dataset.attrs,
+                "inference_data_attrs": self.attrs,
+            }
+            metadata = _make_json_serializable(metadata, binary=True)
+            tables[group] = pa.table(columns, metadata={ARROW_METADATA_KEY: json.dumps(metadata)})
+        return tables
+
+    @staticmethod
+    def from_arrow_tables(tables, var_names=None) -> "InferenceData":
+        """Initialize object from :class:`pyarrow.Table` objects.
+
+        Tables must have been created with :meth:`~arviz.InferenceData.to_arrow_tables`.
+
+        Parameters
+        ----------
+        tables : dict of {str : pyarrow.Table}
+            Tables of each group, keys are the group names.
+        var_names : list of str, optional
+            Variables to keep. Defaults to all variables in the tables.
+
+        Returns
+        -------
+        InferenceData object
+        """
+        groups = {}
+        attrs = None
+        for group, table in tables.items():
+            metadata = json.loads(table.schema.metadata[ARROW_METADATA_KEY.encode()])
+            metadata = _decode_json_arrays(metadata)
+            if attrs is None:
+                attrs = metadata["inference_data_attrs"]
+            sample_dims = metadata["sample_dims"]
+            coords = {
+                coord_name: (coord["dims"], coord["data"])
+                for coord_name, coord in metadata["coords"].items()
+            }
+            sample_shape = [len(coords[dim][1]) for dim in sample_dims]
+            data_vars = {}
+            for var_name, var_metadata in metadata["variables"].items():
+                if var_name not in table.column_names or (
+                    var_names is not None and var_name not in var_names
+                ):
+                    continue
+                column = table.column(var_name)
+                column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+                if var_metadata["shape"]:
+                    column = column.flatten()
+                values = column.to_numpy(zero_copy_only=False)
+                values = values.reshape(*sample_shape, *var_metadata["shape"])
+                # undo the broadcasting of variables without sample dimensions
+                values = values[
+                    tuple(slice(None) if dim in var_metadata["dims"] else 0 for dim in sample_dims)
+                ]
+                dims = [dim for dim in sample_dims if dim in var_metadata["dims"]] + [
+                    dim for dim in var_metadata["dims"] if dim not in sample_dims
+                ]
+                data_vars[var_name] = xr.Variable(dims, values, var_metadata["attrs"]).transpose(
+                    *var_metadata["dims"]
+                )
+            groups[group] = xr.Dataset(data_vars, coords=coords, attrs=metadata["attrs"])
         return InferenceData(attrs=attrs, **groups)
 
+    def to_parquet(self, path, groups=None, filter_groups=None, **kwargs):
+        """Write InferenceData to a directory of parquet files, one per group.
+
+        Groups are converted to tables with :meth:`~arviz.InferenceData.to_arrow_tables`
+        and written to ``<path>/<group>.parquet``.
+
+        Parameters
+        ----------
+        path : str
+            Directory to write to. It is created if it does not exist.
+        groups : list, optional
+            Groups where the transformation is to be applied. Can either be group names
+            or metagroup names.
+        filter_groups: {None, "like", "regex"}, optional, default=None
+            If `None` (default), interpret groups as the real group or metagroup names.
+            If "like", interpret groups as substrings of the real group or metagroup names.
+            If "regex", interpret groups as regular expressions on the real group or
+            metagroup names. A la `pandas.filter`.
+        kwargs : dict
+            kwargs passed to :func:`pyarrow.parquet.write_table`
+
+        Returns
+        -------
+        str
+            Location of the parquet directory
+        """
+        tables = self.to_arrow_tables(groups=groups, filter_groups=filter_groups)
+        import pyarrow.parquet as pq
+
+        os.makedirs(path, exist_ok=True)
+        for group, table in tables.items():
+            pq.write_table(table, os.path.join(path, f"{group}.parquet"), **kwargs)
+        return path
+
+    @staticmethod
+    def from_parquet(path, groups=None, var_names=None) -> "InferenceData":
+        """Initialize object from a directory of parquet files.
+
+        Expects a directory written by :meth:`~arviz.InferenceData.to_parquet`.
+        Only the columns of the requested variables are read from the files.
+
+        Parameters
+        ----------
+        path : str
+            Directory with one parquet file per group.
+        groups : list of str, optional
+            Groups to read. Defaults to all groups in the directory.
+        var_names : list of str, optional
+            Variables to read. Defaults to all variables.
+
+        Returns
+        -------
+        InferenceData object
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ModuleNotFoundError as err:
+            raise ModuleNotFoundError(
+                "pyarrow must be installed in order to use InferenceData.from_parquet"
+            ) from err
+
+        tables = {}
+        for filename in sorted(os.listdir(path)):
+            group, extension = os.path.splitext(filename)
+            if extension != ".parquet" or (groups is not None and group not in groups):
+                continue
+            filepath = os.path.join(path, filename)
+            columns = None
+            if var_names is not None:
+                schema = pq.read_schema(filepath)
+                columns = [
+                    name for name in schema.names if name in ("chain", "draw") or name in var_names
+                ]
+            tables[group] = pq.read_table(filepath, columns=columns)
+        return InferenceData.from_arrow_tables(tables, var_names=var_names)
+
     def __add__(self, other: "InferenceData") -> "InferenceData":
         """Concatenate two InferenceData objects."""
         return concat(self, other, copy=True, inplace=False)
@@ -945,7 +1949,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
             chain_prior = False
         group_names = self._group_names(groups, filter_groups)
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in group_names:
             dataset = getattr(self, group)
             valid_keys = set(kwargs.keys()).intersection(dataset.dims)
@@ -1027,7 +2031,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         """
         group_names = self._group_names(groups, filter_groups)
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in group_names:
             dataset = getattr(self, group)
             valid_keys = set(kwargs.keys()).intersection(dataset.dims)
@@ -1038,6 +2042,106 @@ class InferenceData(Mapping[str, xr.Dataset]):
         else:
             return out
 
+    def thin(
+        self: InferenceDataT,
+        factor: Optional[int] = None,
+        target_ess: Optional[float] = None,
+        groups: Optional[Union[str, List[str]]] = None,
+        filter_groups: Optional["Literal['like', 'regex']"] = None,
+        inplace: bool = False,
+    ) -> Optional[InferenceDataT]:
+        """Thin the draws of all groups, keeping one every ``factor`` draws.
+
+        The thinning factor can be given or computed from the effective sample size
+        (ESS) of the posterior. The same factor is applied to all chains and groups, and
+        the draws are selected with a slice, so the data of the thinned groups are views
+        of the original arrays.
+
+        Parameters
+        ----------
+        factor : int, optional
+            Keep one every ``factor`` draws.
+        target_ess : float, optional
+            Thin as much as possible while keeping enough draws for ``target_ess``
+            effective samples. Ignored if ``factor`` is given.
+        groups : str or list of str, optional
+            Groups where the thinning is to be applied. Can either be group names
+            or metagroup names. Groups without a ``draw`` dimension are not modified.
+        filter_groups : {None, "like", "regex"}, optional
+            If `None` (default), interpret groups as the real group or metagroup names.
+            If "like", interpret groups as substrings of the real group or metagroup names.
+            If "regex", interpret groups as regular expressions on the real group or
+            metagroup names. A la `pandas.filter`.
+        inplace : bool, optional
+            If ``True``, modify the InferenceData object inplace,
+            otherwise, return the modified copy.
+
+        Returns
+        -------
+        InferenceData
+            A new InferenceData object by default.
+            When `inplace==True` perform thinning in-place and return `None`
+
+        Notes
+        -----
+        When ``factor`` is not given, it is computed from the lowest bulk ESS of all
+        variables in the posterior, or in the first selected group with a ``draw``
+        dimension if there is no posterior. With ``n`` draws in total, the factor is
+        ``n // min(ess, target_ess)``. Without ``target_ess`` this is the
+        autocorrelation time, which keeps approximately independent draws. A
+        ``target_ess`` smaller than the ESS thins further, keeping about ``target_ess``
+        of those independent draws. Thinning can not increase the ESS, so a
+        ``target_ess`` larger than the ESS of the posterior can not be achieved and the
+        autocorrelation time is used instead.
+
+        Examples
+        --------
+        Thin the posterior and sample stats, keeping about 50 effective samples:
+
+        .. jupyter-execute::
+
+            import arviz as az
+            idata = az.load_arviz_data("centered_eight")
+            idata.thin(target_ess=50, groups="posterior_groups")
+
+        See Also
+        --------
+        isel : Perform an xarray selection on all groups.
+        arviz.ess : Calculate the effective sample size.
+        """
+        if factor is None:
+            factor = self._thinning_factor(target_ess, self._group_names(groups, filter_groups))
+        elif not isinstance(factor, (int, np.integer)) or factor < 1:
+            raise ValueError(f"factor must be a positive integer, got {factor}")
+        return self.isel(
+            groups=groups,
+            filter_groups=filter_groups,
+            inplace=inplace,
+            draw=slice(None, None, int(factor)),
+        )
+
+    def _thinning_factor(self, target_ess: Optional[float], group_names: List[str]) -> int:
+        """Compute the thinning factor from the bulk ESS, see :meth:`thin`."""
+        # pylint: disable=import-outside-toplevel
+        from ..stats.diagnostics import ess
+
+        if target_ess is not None and target_ess <= 0:
+            raise ValueError(f"target_ess must be positive, got {target_ess}")
+        sample_groups = [
+            group for group in group_names if {"chain", "draw"}.issubset(getattr(self, group).dims)
+        ]
+        if not sample_groups:
+            raise ValueError("None of the selected groups has chain and draw dimensions")
+        dataset = getattr(self, "posterior" if "posterior" in sample_groups else sample_groups[0])
+        n_samples = dataset.sizes["chain"] * dataset.sizes["draw"]
+        ess_dataset = ess(dataset, method="bulk")
+        ess_values = [ess_da.values.ravel() for ess_da in ess_dataset.data_vars.values()]
+        ess_values = np.concatenate(ess_values) if ess_values else np.array([])
+        ess_min = np.nanmin(ess_values) if np.isfinite(ess_values).any() else n_samples
+        if target_ess is not None:
+            ess_min = min(ess_min, target_ess)
+        return max(1, int(n_samples // ess_min))
+
     def stack(
         self,
         dimensions=None,
@@ -1135,7 +2239,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
 
         dimensions = {} if dimensions is None else dimensions
         dimensions.update(kwargs)
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             kwarg_dict = {}
@@ -1226,7 +2330,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         if isinstance(dim, str):
             dim = [dim]
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             valid_dims = set(dim).intersection(dataset.dims) if dim is not None else dim
@@ -1298,7 +2402,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         groups = self._group_names(groups, filter_groups)
         if "chain" in name_dict.keys() or "draw" in name_dict.keys():
             raise KeyError("'chain' or 'draw' dimensions can't be renamed")
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
 
         for group in groups:
             dataset = getattr(self, group)
@@ -1373,7 +2477,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         """
         groups = self._group_names(groups, filter_groups)
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             valid_keys = set(name_dict.keys()).intersection(dataset.data_vars)
@@ -1448,7 +2552,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
         if "chain" in name_dict.keys() or "draw" in name_dict.keys():
             raise KeyError("'chain' or 'draw' dimensions can't be renamed")
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             valid_keys = set(name_dict.keys()).intersection(dataset.dims)
@@ -1835,7 +2939,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
             args = []
         groups = self._group_names(groups, filter_groups)
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             dataset = fun(dataset, *args, **kwargs)
@@ -1899,7 +3003,7 @@ class InferenceData(Mapping[str, xr.Dataset]):
 
         method = getattr(xr.Dataset, method)
 
-        out = self if inplace else deepcopy(self)
+        out = self if inplace else self.copy(deep=False)
         for group in groups:
             dataset = getattr(self, group)
             dataset = method(dataset, *args, **kwargs)
@@ -1909,9 +3013,74 @@ class InferenceData(Mapping[str, xr.Dataset]):
         else:
             return out
 
-    def copy(self) -> "InferenceData":
-        """Return a fresh copy of the ``InferenceData`` object."""
-        return deepcopy(self)
+    def copy(self: InferenceDataT, deep: bool = True) -> InferenceDataT:
+        """Return a fresh copy of the ``InferenceData`` object.
+
+        Parameters
+        ----------
+        deep : bool, default True
+            If ``True``, the data of all groups is copied. Otherwise, the groups of the
+            new object are shallow copies of the original datasets (see
+            :meth:`xarray.Dataset.copy`): groups, variables and attributes can be added,
+            replaced or removed in either object without affecting the other, but the
+            underlying arrays are shared, only variables that are replaced get new
+            memory. Deferred groups are also shared and stay deferred.
+
+        Returns
+        -------
+        InferenceData
+        """
+        if deep:
+            return deepcopy(self)
+        out = ccopy(self)
+        # pylint: disable=protected-access
+        out._groups = list(self._groups)
+        out._groups_warmup = list(self._groups_warmup)
+        out._lazy_groups = dict(self._lazy_groups)
+        out._attrs = None if self._attrs is None else dict(self._attrs)
+        for group in self._groups_all:
+            if not self._is_deferred(group):
+                setattr(out, group, getattr(self, group).copy(deep=False))
+        return out
+
+
+_CONCAT_DATA_GROUPS = ("observed_data", "constant_data", "predictions_constant_data")
+
+
+def _concat_group_attrs(group0_attrs, group_attrs, current_time):
+    """Gather the attributes of a concatenated group into ``group0_attrs`` inplace."""
+    for attr_key, attr_values in group_attrs.items():
+        group0_attr_values = group0_attrs.get(attr_key, None)
+        equality = attr_values == group0_attr_values
+        if hasattr(equality, "__iter__"):
+            equality = np.all(equality)
+        if equality:
+            continue
+        # handle special cases:
+        if attr_key in ("created_at", "previous_created_at"):
+            # check the defaults
+            if not hasattr(group0_attrs, "previous_created_at"):
+                group0_attrs["previous_created_at"] = []
+                if group0_attr_values is not None:
+                    group0_attrs["previous_created_at"].append(group0_attr_values)
+            # check previous values
+            if attr_key == "previous_created_at":
+                if not isinstance(attr_values, list):
+                    attr_values = [attr_values]
+                group0_attrs["previous_created_at"].extend(attr_values)
+                continue
+            # update "created_at"
+            if group0_attr_values != current_time:
+                group0_attrs[attr_key] = current_time
+            group0_attrs["previous_created_at"].append(attr_values)
+
+        elif attr_key in group0_attrs:
+            combined_key = f"combined_{attr_key}"
+            if combined_key not in group0_attrs:
+                group0_attrs[combined_key] = [group0_attr_values]
+            group0_attrs[combined_key].append(attr_values)
+        else:
+            group0_attrs[attr_key] = attr_values
 
 
 @overload
@@ -1974,7 +3143,8 @@ def concat(*args, dim=None, copy=True, inplace=False, reset_dim=True):
     Concatenates over `group`, `chain` or `draw`.
     By default concatenates over unique groups.
     To concatenate over `chain` or `draw` function
-    needs identical groups and variables.
+    needs identical groups and variables. In that case, the datasets of each
+    group are concatenated from all objects at once.
 
     The `variables` in the `data` -group are merged if `dim` are not found.
 
@@ -1990,7 +3160,9 @@ def concat(*args, dim=None, copy=True, inplace=False, reset_dim=True):
         unique groups.
     copy : bool
         If True, groups are copied to the new InferenceData object.
-        Used only if `dim` is None.
+        If False, no data is deep copied: when `dim` is None the groups are shared with
+        the original objects, and when concatenating over `chain` or `draw` the data
+        groups are only shallow copied.
     inplace : bool
         If True, merge args to first object.
     reset_dim : bool
@@ -2157,6 +3329,7 @@ def concat(*args, dim=None, copy=True, inplace=False, reset_dim=True):
     else:
         arg0 = args[0]
         arg0_groups = arg0._groups_all
+        # check all groups and variables before concatenating
         for arg in args[1:]:
             for group0 in arg0_groups:
                 if group0 not in arg._groups_all:
@@ -2166,176 +3339,101 @@ def concat(*args, dim=None, copy=True, inplace=False, reset_dim=True):
                     raise TypeError(msg)
             for group in arg._groups_all:
                 # handle data groups separately
-                if group not in ["observed_data", "constant_data", "predictions_constant_data"]:
-                    # assert that groups are equal
-                    if group not in arg0_groups:
-                        msg = "Mismatch between the groups."
+                if group in _CONCAT_DATA_GROUPS:
+                    continue
+                # assert that groups are equal
+                if group not in arg0_groups:
+                    msg = "Mismatch between the groups."
+                    raise TypeError(msg)
+
+                # assert that variables are equal
+                group_data = getattr(arg, group)
+                group_vars = group_data.data_vars
+                group0_data = getattr(arg0, group)
+                group0_vars = group0_data.data_vars
+
+                for var in group0_vars:
+                    if var not in group_vars:
+                        msg = "Mismatch between the variables."
                         raise TypeError(msg)
 
-                    # assert that variables are equal
-                    group_data = getattr(arg, group)
-                    group_vars = group_data.data_vars
+                for var in group_vars:
+                    if var not in group0_vars:
+                        msg = "Mismatch between the variables."
+                        raise TypeError(msg)
+                    var_dims = group_data[var].dims
+                    var0_dims = group0_data[var].dims
+                    if var_dims != var0_dims:
+                        msg = "Mismatch between the dimensions."
+                        raise TypeError(msg)
 
-                    if not inplace and group in inference_data_dict:
-                        group0_data = inference_data_dict[group]
-                    else:
-                        group0_data = getattr(arg0, group)
-                    group0_vars = group0_data.data_vars
-
-                    for var in group0_vars:
-                        if var not in group_vars:
-                            msg = "Mismatch between the variables."
-                            raise TypeError(msg)
-
-                    for var in group_vars:
-                        if var not in group0_vars:
-                            msg = "Mismatch between the variables."
-                            raise TypeError(msg)
-                        var_dims = group_data[var].dims
-                        var0_dims = group0_data[var].dims
-                        if var_dims != var0_dims:
-                            msg = "Mismatch between the dimensions."
-                            raise TypeError(msg)
-
-                        if dim not in var_dims or dim not in var0_dims:
-                            msg = f"Dimension {dim} missing."
-                            raise TypeError(msg)
-
-                    # xr.concat
-                    concatenated_group = xr.concat((group0_data, group_data), dim=dim)
-                    if reset_dim:
-                        concatenated_group[dim] = range(concatenated_group[dim].size)
-
-                    # handle attrs
-                    if hasattr(group0_data, "attrs"):
-                        group0_attrs = deepcopy(getattr(group0_data, "attrs"))
-                    else:
-                        group0_attrs = OrderedDict()
+                    if dim not in var_dims or dim not in var0_dims:
+                        msg = f"Dimension {dim} missing."
+                        raise TypeError(msg)
 
-                    if hasattr(group_data, "attrs"):
-                        group_attrs = getattr(group_data, "attrs")
-                    else:
-                        group_attrs = {}
-
-                    # gather attrs results to group0_attrs
-                    for attr_key, attr_values in group_attrs.items():
-                        group0_attr_values = group0_attrs.get(attr_key, None)
-                        equality = attr_values == group0_attr_values
-                        if hasattr(equality, "__iter__"):
-                            equality = np.all(equality)
-                        if equality:
-                            continue
-                        # handle special cases:
-                        if attr_key in ("created_at", "previous_created_at"):
-                            # check the defaults
-                            if not hasattr(group0_attrs, "previous_created_at"):
-                                group0_attrs["previous_created_at"] = []
-                                if group0_attr_values is not None:
-                                    group0_attrs["previous_created_at"].append(group0_attr_values)
-                            # check previous values
-                            if attr_key == "previous_created_at":
-                                if not isinstance(attr_values, list):
-                                    attr_values = [attr_values]
-                                group0_attrs["previous_created_at"].extend(attr_values)
-                                continue
-                            # update "created_at"
-                            if group0_attr_values != current_time:
-                                group0_attrs[attr_key] = current_time
-                            group0_attrs["previous_created_at"].append(attr_values)
-
-                        elif attr_key in group0_attrs:
-                            combined_key = f"combined_{attr_key}"
-                            if combined_key not in group0_attrs:
-                                group0_attrs[combined_key] = [group0_attr_values]
-                            group0_attrs[combined_key].append(attr_values)
-                        else:
-                            group0_attrs[attr_key] = attr_values
-                    # update attrs
-                    setattr(concatenated_group, "attrs", group0_attrs)
-
-                    if inplace:
-                        setattr(arg0, group, concatenated_group)
-                    else:
-                        inference_data_dict[group] = concatenated_group
-                else:
-                    # observed_data, "constant_data", "predictions_constant_data",
-                    if group not in arg0_groups:
-                        setattr(arg0, group, deepcopy(group_data) if copy else group_data)
-                        arg0._groups.append(group)
-                        continue
+        # concatenate the datasets of all args with a single xr.concat per group
+        for group in arg0_groups:
+            if group in _CONCAT_DATA_GROUPS:
+                continue
+            datasets = [getattr(arg, group) for arg in args]
+            concatenated_group = xr.concat(datasets, dim=dim)
+            if reset_dim:
+                concatenated_group[dim] = range(concatenated_group[dim].size)
 
-                    # assert that variables are equal
-                    group_data = getattr(arg, group)
-                    group_vars = group_data.data_vars
-
-                    group0_data = getattr(arg0, group)
-                    if not inplace:
-                        group0_data = deepcopy(group0_data)
-                    group0_vars = group0_data.data_vars
-
-                    for var in group_vars:
-                        if var not in group0_vars:
-                            var_data = group_data[var]
-                            getattr(arg0, group)[var] = var_data
-                        else:
-                            var_data = group_data[var]
-                            var0_data = group0_data[var]
-                            if dim in var_data.dims and dim in var0_data.dims:
-                                concatenated_var = xr.concat((group_data, group0_data), dim=dim)
-                                group0_data[var] = concatenated_var
-
-                    # handle attrs
-                    if hasattr(group0_data, "attrs"):
-                        group0_attrs = getattr(group0_data, "attrs")
-                    else:
-                        group0_attrs = OrderedDict()
+            # handle attrs
+            group0_attrs = deepcopy(datasets[0].attrs)
+            for group_data in datasets[1:]:
+                _concat_group_attrs(group0_attrs, group_data.attrs, current_time)
+            setattr(concatenated_group, "attrs", group0_attrs)
 
-                    if hasattr(group_data, "attrs"):
-                        group_attrs = getattr(group_data, "attrs")
-                    else:
-                        group_attrs = {}
-
-                    # gather attrs results to group0_attrs
-                    for attr_key, attr_values in group_attrs.items():
-                        group0_attr_values = group0_attrs.get(attr_key, None)
-                        equality = attr_values == group0_attr_values
-                        if hasattr(equality, "__iter__"):
-                            equality = np.all(equality)
-                        if equality:
-                            continue
-                        # handle special cases:
-                        if attr_key in ("created_at", "previous_created_at"):
-                            # check the defaults
-                            if not hasattr(group0_attrs, "previous_created_at"):
-                                group0_attrs["previous_created_at"] = []
-                                if group0_attr_values is not None:
-                                    group0_attrs["previous_created_at"].append(group0_attr_values)
-                            # check previous values
-                            if attr_key == "previous_created_at":
-                                if not isinstance(attr_values, list):
-                                    attr_values = [attr_values]
-                                group0_attrs["previous_created_at"].extend(attr_values)
-                                continue
-                            # update "created_at"
-                            if group0_attr_values != current_time:
-                                group0_attrs[attr_key] = current_time
-                            group0_attrs["previous_created_at"].append(attr_values)
-
-                        elif attr_key in group0_attrs:
-                            combined_key = f"combined_{attr_key}"
-                            if combined_key not in group0_attrs:
-                                group0_attrs[combined_key] = [group0_attr_values]
-                            group0_attrs[combined_key].append(attr_values)
-
-                        else:
-                            group0_attrs[attr_key] = attr_values
-                    # update attrs
-                    setattr(group0_data, "attrs", group0_attrs)
-
-                    if inplace:
-                        setattr(arg0, group, group0_data)
+            if inplace:
+                setattr(arg0, group, concatenated_group)
+            else:
+                inference_data_dict[group] = concatenated_group
+
+        for arg in args[1:]:
+            for group in arg._groups_all:
+                if group not in _CONCAT_DATA_GROUPS:
+                    continue
+                # observed_data, "constant_data", "predictions_constant_data",
+                group_data = getattr(arg, group)
+                if group not in arg0_groups:
+                    setattr(arg0, group, deepcopy(group_data) if copy else group_data)
+                    arg0._groups.append(group)
+                    continue
+
+                # assert that variables are equal
+                group_vars = group_data.data_vars
+
+                group0_data = getattr(arg0, group)
+                if not inplace:
+                    group0_data = deepcopy(group0_data) if copy else group0_data.copy(deep=False)
+                group0_vars = group0_data.data_vars
+
+                for var in group_vars:
+                    if var not in group0_vars:
+                        var_data = group_data[var]
+                        getattr(arg0, group)[var] = var_data
                     else:
-                        inference_data_dict[group] = group0_data
+                        var_data = group_data[var]
+                        var0_data = group0_data[var]
+                        if dim in var_data.dims and dim in var0_data.dims:
+                            concatenated_var = xr.concat((group_data, group0_data), dim=dim)
+                            group0_data[var] = concatenated_var
+
+                # handle attrs
+                if hasattr(group0_data, "attrs"):
+                    group0_attrs = getattr(group0_data, "attrs")
+                else:
+                    group0_attrs = OrderedDict()
+                _concat_group_attrs(group0_attrs, getattr(group_data, "attrs", {}), current_time)
+                # update attrs
+                setattr(group0_data, "attrs", group0_attrs)
+
+                if inplace:
+                    setattr(arg0, group, group0_data)
+                else:
+                    inference_data_dict[group] = group0_data
 
     if not inplace:
         inference_data_dict["attrs"] = combined_attr
@@ -19,7 +19,14 @@ import numpy as np
 
 from .. import utils
 from ..rcparams import rcParams
-from .base import CoordSpec, DimSpec, dict_to_dataset, infer_stan_dtypes, requires
+from .base import (
+    CoordSpec,
+    DimSpec,
+    _group_float_dtype,
+    dict_to_dataset,
+    infer_stan_dtypes,
+    requires,
+)
 from .inference_data import InferenceData
 
 _log = logging.getLogger(__name__)
@@ -63,6 +70,7 @@ class CmdStanConverter:
         disable_glob=False,
         save_warmup=None,
         dtypes=None,
+        dtype=None,
     ):
         self.posterior_ = check_glob(posterior, "posterior", disable_glob)
         self.posterior_predictive = check_glob(
@@ -102,6 +110,7 @@ class CmdStanConverter:
             dtypes = infer_stan_dtypes(model_code)
 
         self.dtypes = dtypes
+        self.dtype = dtype
 
         # populate posterior and sample_stats
         self._parse_posterior()
@@ -176,6 +185,10 @@ class CmdStanConverter:
                 attrs[key].append(value)
         self.attrs_prior = attrs
 
+    def _float_dtype(self, group):
+        """Get the dtype the float arrays of ``group`` are allocated with."""
+        return _group_float_dtype(self.dtype, group) or rcParams["data.float_dtype"] or np.float64
+
     @requires("posterior")
     def posterior_to_xarray(self):
         """Extract posterior samples from output csv."""
@@ -230,8 +243,12 @@ class CmdStanConverter:
 
         invalid_cols = posterior_predictive + predictions + log_likelihood
         valid_cols = {col: idx for col, idx in columns.items() if col not in invalid_cols}
-        data = _unpack_ndarrays(self.posterior[0], valid_cols, self.dtypes)
-        data_warmup = _unpack_ndarrays(self.posterior[1], valid_cols, self.dtypes)
+        data = _unpack_ndarrays(
+            self.posterior[0], valid_cols, self.dtypes, self._float_dtype("posterior")
+        )
+        data_warmup = _unpack_ndarrays(
+            self.posterior[1], valid_cols, self.dtypes, self._float_dtype("warmup_posterior")
+        )
         return (
             dict_to_dataset(
                 data,
@@ -239,6 +256,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=self.attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "posterior"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -246,6 +264,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=self.attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_posterior"),
             ),
         )
 
@@ -268,8 +287,12 @@ class CmdStanConverter:
             name = rename_dict.get(name, name)
             columns_new[name] = idx
 
-        data = _unpack_ndarrays(self.posterior[0], columns_new, dtypes)
-        data_warmup = _unpack_ndarrays(self.posterior[1], columns_new, dtypes)
+        data = _unpack_ndarrays(
+            self.posterior[0], columns_new, dtypes, self._float_dtype("sample_stats")
+        )
+        data_warmup = _unpack_ndarrays(
+            self.posterior[1], columns_new, dtypes, self._float_dtype("warmup_sample_stats")
+        )
         return (
             dict_to_dataset(
                 data,
@@ -277,6 +300,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs={item: key for key, item in rename_dict.items()},
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "sample_stats"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -284,6 +308,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs={item: key for key, item in rename_dict.items()},
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_sample_stats"),
             ),
         )
 
@@ -315,8 +340,15 @@ class CmdStanConverter:
                         attrs[key] = []
                     attrs[key].append(value)
 
-            data = _unpack_ndarrays(chain_data, columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(chain_data_warmup, columns, self.dtypes)
+            data = _unpack_ndarrays(
+                chain_data, columns, self.dtypes, self._float_dtype("posterior_predictive")
+            )
+            data_warmup = _unpack_ndarrays(
+                chain_data_warmup,
+                columns,
+                self.dtypes,
+                self._float_dtype("warmup_posterior_predictive"),
+            )
 
         else:
             if isinstance(posterior_predictive, str):
@@ -326,8 +358,15 @@ class CmdStanConverter:
                 for col, idx in self.posterior_columns.items()
                 if any(item == col.split(".")[0] for item in posterior_predictive)
             }
-            data = _unpack_ndarrays(self.posterior[0], columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(self.posterior[1], columns, self.dtypes)
+            data = _unpack_ndarrays(
+                self.posterior[0], columns, self.dtypes, self._float_dtype("posterior_predictive")
+            )
+            data_warmup = _unpack_ndarrays(
+                self.posterior[1],
+                columns,
+                self.dtypes,
+                self._float_dtype("warmup_posterior_predictive"),
+            )
 
             attrs = None
         return (
@@ -337,6 +376,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "posterior_predictive"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -344,6 +384,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_posterior_predictive"),
             ),
         )
 
@@ -374,8 +415,12 @@ class CmdStanConverter:
                         attrs[key] = []
                     attrs[key].append(value)
 
-            data = _unpack_ndarrays(chain_data, columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(chain_data_warmup, columns, self.dtypes)
+            data = _unpack_ndarrays(
+                chain_data, columns, self.dtypes, self._float_dtype("predictions")
+            )
+            data_warmup = _unpack_ndarrays(
+                chain_data_warmup, columns, self.dtypes, self._float_dtype("warmup_predictions")
+            )
         else:
             if isinstance(predictions, str):
                 predictions = [predictions]
@@ -384,8 +429,12 @@ class CmdStanConverter:
                 for col, idx in self.posterior_columns.items()
                 if any(item == col.split(".")[0] for item in predictions)
             }
-            data = _unpack_ndarrays(self.posterior[0], columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(self.posterior[1], columns, self.dtypes)
+            data = _unpack_ndarrays(
+                self.posterior[0], columns, self.dtypes, self._float_dtype("predictions")
+            )
+            data_warmup = _unpack_ndarrays(
+                self.posterior[1], columns, self.dtypes, self._float_dtype("warmup_predictions")
+            )
 
             attrs = None
         return (
@@ -395,6 +444,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "predictions"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -402,6 +452,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_predictions"),
             ),
         )
 
@@ -433,8 +484,12 @@ class CmdStanConverter:
                     if key not in attrs:
                         attrs[key] = []
                     attrs[key].append(value)
-            data = _unpack_ndarrays(chain_data, columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(chain_data_warmup, columns, self.dtypes)
+            data = _unpack_ndarrays(
+                chain_data, columns, self.dtypes, self._float_dtype("log_likelihood")
+            )
+            data_warmup = _unpack_ndarrays(
+                chain_data_warmup, columns, self.dtypes, self._float_dtype("warmup_log_likelihood")
+            )
         else:
             if isinstance(log_likelihood, dict):
                 log_lik_to_obs_name = {v: k for k, v in log_likelihood.items()}
@@ -453,8 +508,12 @@ class CmdStanConverter:
                     for col, idx in self.posterior_columns.items()
                     if any(item == col.split(".")[0] for item in log_likelihood)
                 }
-            data = _unpack_ndarrays(self.posterior[0], columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(self.posterior[1], columns, self.dtypes)
+            data = _unpack_ndarrays(
+                self.posterior[0], columns, self.dtypes, self._float_dtype("log_likelihood")
+            )
+            data_warmup = _unpack_ndarrays(
+                self.posterior[1], columns, self.dtypes, self._float_dtype("warmup_log_likelihood")
+            )
             attrs = None
         return (
             dict_to_dataset(
@@ -464,6 +523,7 @@ class CmdStanConverter:
                 attrs=attrs,
                 index_origin=self.index_origin,
                 skip_event_dims=True,
+                dtype=_group_float_dtype(self.dtype, "log_likelihood"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -472,6 +532,7 @@ class CmdStanConverter:
                 attrs=attrs,
                 index_origin=self.index_origin,
                 skip_event_dims=True,
+                dtype=_group_float_dtype(self.dtype, "warmup_log_likelihood"),
             ),
         )
 
@@ -498,8 +559,10 @@ class CmdStanConverter:
 
         invalid_cols = prior_predictive
         valid_cols = {col: idx for col, idx in columns.items() if col not in invalid_cols}
-        data = _unpack_ndarrays(self.prior[0], valid_cols, self.dtypes)
-        data_warmup = _unpack_ndarrays(self.prior[1], valid_cols, self.dtypes)
+        data = _unpack_ndarrays(self.prior[0], valid_cols, self.dtypes, self._float_dtype("prior"))
+        data_warmup = _unpack_ndarrays(
+            self.prior[1], valid_cols, self.dtypes, self._float_dtype("warmup_prior")
+        )
         return (
             dict_to_dataset(
                 data,
@@ -507,6 +570,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=self.attrs_prior,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "prior"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -514,6 +578,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=self.attrs_prior,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_prior"),
             ),
         )
 
@@ -536,8 +601,12 @@ class CmdStanConverter:
             name = rename_dict.get(name, name)
             columns_new[name] = idx
 
-        data = _unpack_ndarrays(self.posterior[0], columns_new, dtypes)
-        data_warmup = _unpack_ndarrays(self.posterior[1], columns_new, dtypes)
+        data = _unpack_ndarrays(
+            self.posterior[0], columns_new, dtypes, self._float_dtype("sample_stats_prior")
+        )
+        data_warmup = _unpack_ndarrays(
+            self.posterior[1], columns_new, dtypes, self._float_dtype("warmup_sample_stats_prior")
+        )
         return (
             dict_to_dataset(
                 data,
@@ -545,6 +614,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs={item: key for key, item in rename_dict.items()},
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "sample_stats_prior"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -552,6 +622,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs={item: key for key, item in rename_dict.items()},
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_sample_stats_prior"),
             ),
         )
 
@@ -580,8 +651,15 @@ class CmdStanConverter:
                     if key not in attrs:
                         attrs[key] = []
                     attrs[key].append(value)
-            data = _unpack_ndarrays(chain_data, columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(chain_data_warmup, columns, self.dtypes)
+            data = _unpack_ndarrays(
+                chain_data, columns, self.dtypes, self._float_dtype("prior_predictive")
+            )
+            data_warmup = _unpack_ndarrays(
+                chain_data_warmup,
+                columns,
+                self.dtypes,
+                self._float_dtype("warmup_prior_predictive"),
+            )
         else:
             if isinstance(prior_predictive, str):
                 prior_predictive = [prior_predictive]
@@ -590,8 +668,12 @@ class CmdStanConverter:
                 for col, idx in self.prior_columns.items()
                 if any(item == col.split(".")[0] for item in prior_predictive)
             }
-            data = _unpack_ndarrays(self.prior[0], columns, self.dtypes)
-            data_warmup = _unpack_ndarrays(self.prior[1], columns, self.dtypes)
+            data = _unpack_ndarrays(
+                self.prior[0], columns, self.dtypes, self._float_dtype("prior_predictive")
+            )
+            data_warmup = _unpack_ndarrays(
+                self.prior[1], columns, self.dtypes, self._float_dtype("warmup_prior_predictive")
+            )
             attrs = None
         return (
             dict_to_dataset(
@@ -600,6 +682,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "prior_predictive"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -607,6 +690,7 @@ class CmdStanConverter:
                 dims=self.dims,
                 attrs=attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_prior_predictive"),
             ),
         )
 
@@ -628,6 +712,7 @@ class CmdStanConverter:
             dims=self.dims,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "observed_data"),
         )
 
     @requires("constant_data")
@@ -648,6 +733,7 @@ class CmdStanConverter:
             dims=self.dims,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "constant_data"),
         )
 
     @requires("predictions_constant_data")
@@ -669,6 +755,7 @@ class CmdStanConverter:
             dims=self.dims,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "predictions_constant_data"),
         )
 
     def to_inference_data(self):
@@ -890,7 +977,7 @@ def _read_data(path):
     return data
 
 
-def _unpack_ndarrays(arrays, columns, dtypes=None):
+def _unpack_ndarrays(arrays, columns, dtypes=None, float_dtype=None):
     """Transform a list of ndarrays to dictionary containing ndarrays.
 
     Parameters
@@ -898,6 +985,9 @@ def _unpack_ndarrays(arrays, columns, dtypes=None):
     arrays : List[np.ndarray]
     columns: Dict[str, int]
     dtypes: Dict[str, Any]
+    float_dtype: numpy.dtype, optional
+        Dtype of the variables not in ``dtypes``. Defaults to ``rcParams["data.float_dtype"]``
+        or float64 if that is None.
 
     Returns
     -------
@@ -910,13 +1000,17 @@ def _unpack_ndarrays(arrays, columns, dtypes=None):
         loc = tuple(int(i) - 1 for i in loc)
         col_groups[key].append((col_idx, loc))
 
+    if dtypes is None:
+        dtypes = {}
+    if float_dtype is None:
+        float_dtype = rcParams["data.float_dtype"] or np.float64
     chains = len(arrays)
     draws = len(arrays[0])
     sample = {}
     if draws:
         for key, cols_locs in col_groups.items():
             ndim = np.array([loc for _, loc in cols_locs]).max(0) + 1
-            dtype = dtypes.get(key, np.float64)
+            dtype = dtypes.get(key, float_dtype)
             sample[key] = np.zeros((chains, draws, *ndim), dtype=dtype)
             for col, loc in cols_locs:
                 for chain_id, arr in enumerate(arrays):
@@ -950,6 +1044,7 @@ def from_cmdstan(
     disable_glob: Optional[bool] = False,
     save_warmup: Optional[bool] = None,
     dtypes: Optional[Dict] = None,
+    dtype=None,
 ) -> InferenceData:
     """Convert CmdStan data into an InferenceData object.
 
@@ -1009,6 +1104,9 @@ def from_cmdstan(
     dtypes : dict or str
         A dictionary containing dtype information (int, float) for parameters.
         If input is a string, it is assumed to be a model code or path to model code file.
+    dtype : str, numpy.dtype or dict of {str : str or numpy.dtype}, optional
+        Dtype floating point arrays are converted to, for all groups or per group.
+        Defaults to ``rcParams["data.float_dtype"]``.
 
     Returns
     -------
@@ -1033,4 +1131,5 @@ def from_cmdstan(
         disable_glob=disable_glob,
         save_warmup=save_warmup,
         dtypes=dtypes,
+        dtype=dtype,
     ).to_inference_data()
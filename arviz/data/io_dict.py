@@ -4,7 +4,7 @@ import warnings
 from typing import Optional
 
 from ..rcparams import rcParams
-from .base import dict_to_dataset, requires
+from .base import _group_float_dtype, dict_to_dataset, requires
 from .inference_data import WARMUP_TAG, InferenceData
 
 
@@ -38,6 +38,7 @@ class DictConverter:
         pred_dims=None,
         pred_coords=None,
         attrs=None,
+        dtype=None,
         **kwargs,
     ):
         self.posterior = posterior
@@ -69,6 +70,7 @@ class DictConverter:
         self.attrs = {} if attrs is None else attrs
         self.attrs.pop("created_at", None)
         self.attrs.pop("arviz_version", None)
+        self.dtype = dtype
         self._kwargs = kwargs
 
     def _init_dict(self, attr_name):
@@ -101,6 +103,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=posterior_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "posterior"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -109,6 +112,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=posterior_warmup_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_posterior"),
             ),
         )
 
@@ -139,6 +143,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=sample_stats_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "sample_stats"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -147,6 +152,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=sample_stats_warmup_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_sample_stats"),
             ),
         )
 
@@ -170,6 +176,7 @@ class DictConverter:
                 attrs=log_likelihood_attrs,
                 index_origin=self.index_origin,
                 skip_event_dims=True,
+                dtype=_group_float_dtype(self.dtype, "log_likelihood"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -179,6 +186,7 @@ class DictConverter:
                 attrs=log_likelihood_warmup_attrs,
                 index_origin=self.index_origin,
                 skip_event_dims=True,
+                dtype=_group_float_dtype(self.dtype, "warmup_log_likelihood"),
             ),
         )
 
@@ -201,6 +209,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=posterior_predictive_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "posterior_predictive"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -209,6 +218,7 @@ class DictConverter:
                 dims=self.dims,
                 attrs=posterior_predictive_warmup_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_posterior_predictive"),
             ),
         )
 
@@ -231,6 +241,7 @@ class DictConverter:
                 dims=self.pred_dims,
                 attrs=predictions_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "predictions"),
             ),
             dict_to_dataset(
                 data_warmup,
@@ -239,6 +250,7 @@ class DictConverter:
                 dims=self.pred_dims,
                 attrs=predictions_warmup_attrs,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, "warmup_predictions"),
             ),
         )
 
@@ -256,6 +268,7 @@ class DictConverter:
             dims=self.dims,
             attrs=prior_attrs,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "prior"),
         )
 
     @requires("sample_stats_prior")
@@ -272,6 +285,7 @@ class DictConverter:
             dims=self.dims,
             attrs=sample_stats_prior_attrs,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "sample_stats_prior"),
         )
 
     @requires("prior_predictive")
@@ -288,6 +302,7 @@ class DictConverter:
             dims=self.dims,
             attrs=prior_predictive_attrs,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "prior_predictive"),
         )
 
     def data_to_xarray(self, data, group, dims=None):
@@ -304,6 +319,7 @@ class DictConverter:
             default_dims=[],
             attrs=self.attrs,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, group),
         )
 
     @requires("observed_data")
@@ -374,6 +390,7 @@ def from_dict(
     pred_dims=None,
     pred_coords=None,
     attrs=None,
+    dtype=None,
     **kwargs,
 ):
     """Convert Dictionary data into an InferenceData object.
@@ -414,6 +431,9 @@ def from_dict(
         A mapping from variables to a list of coordinate values for predictions.
     attrs : dict, optional
         A dictionary containing attributes for different groups.
+    dtype : str, numpy.dtype or dict of {str : str or numpy.dtype}, optional
+        Dtype floating point arrays are converted to, for all groups or per group.
+        Defaults to ``rcParams["data.float_dtype"]``.
     kwargs : dict, optional
         A dictionary containing group attrs. Accepted kwargs are:
 
@@ -455,6 +475,7 @@ def from_dict(
         pred_dims=pred_dims,
         pred_coords=pred_coords,
         attrs=attrs,
+        dtype=dtype,
         **kwargs,
     ).to_inference_data()
 
@@ -7,7 +7,7 @@ import numpy as np
 import xarray as xr
 
 from .. import utils
-from .base import dict_to_dataset, generate_dims_coords, make_attrs
+from .base import _group_float_dtype, dict_to_dataset, generate_dims_coords, make_attrs
 from .inference_data import InferenceData
 
 
@@ -98,6 +98,7 @@ class EmceeConverter:
         index_origin=None,
         coords=None,
         dims=None,
+        dtype=None,
     ):
         var_names, arg_names, slices = _verify_names(sampler, var_names, arg_names, slices)
         self.sampler = sampler
@@ -110,6 +111,7 @@ class EmceeConverter:
         self.index_origin = index_origin
         self.coords = coords
         self.dims = dims
+        self.dtype = dtype
         import emcee
 
         self.emcee = emcee
@@ -132,6 +134,7 @@ class EmceeConverter:
             coords=self.coords,
             dims=self.dims,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "posterior"),
         )
 
     def args_to_xarray(self):
@@ -240,6 +243,7 @@ class EmceeConverter:
                 coords=self.coords,
                 dims=self.dims,
                 index_origin=self.index_origin,
+                dtype=_group_float_dtype(self.dtype, key),
             )
         return blob_dict
 
@@ -263,6 +267,7 @@ def from_emcee(
     index_origin=None,
     coords=None,
     dims=None,
+    dtype=None,
 ):
     """Convert emcee data into an InferenceData object.
 
@@ -297,6 +302,9 @@ def from_emcee(
         Map of dimensions to coordinates
     dims : dict of {str : list of str}, optional
         Map variable names to their coordinates
+    dtype : str, numpy.dtype or dict of {str : str or numpy.dtype}, optional
+        Dtype floating point arrays of the posterior and blob groups are converted to,
+        for all groups or per group. Defaults to ``rcParams["data.float_dtype"]``.
 
     Returns
     -------
@@ -314,4 +322,5 @@ def from_emcee(
         index_origin=index_origin,
         coords=coords,
         dims=dims,
+        dtype=dtype,
     ).to_inference_data()
@@ -1,5 +1,8 @@
 """Input and output support for data."""
 
+import os
+
+from .base import ARRAYS_JSON_KEY, _decode_json_arrays
 from .io_dict import from_dict
 
 try:
@@ -15,6 +18,10 @@ def from_json(filename):
     """Initialize object from a json file.
 
     Will use the faster `ujson` (https://github.com/ultrajson/ultrajson) if it is available.
+    Files with binary encoded arrays written with ``array_format="base64"`` or
+    ``array_format="binary"`` are detected automatically. Their arrays are created
+    from the decoded buffers without copying; arrays decoded from base64 payloads
+    are read-only.
 
     Parameters
     ----------
@@ -28,10 +35,20 @@ def from_json(filename):
     with open(filename, "rb") as file:
         idata_dict = json.load(file)
 
+    arrays_format = idata_dict.pop(ARRAYS_JSON_KEY, None)
+    if arrays_format is not None:
+        buffer = None
+        if arrays_format["format"] == "binary":
+            sidecar = os.path.join(os.path.dirname(filename), arrays_format["file"])
+            buffer = bytearray(os.path.getsize(sidecar))
+            with open(sidecar, "rb") as file:
+                file.readinto(buffer)
+        idata_dict = _decode_json_arrays(idata_dict, buffer)
+
     return from_dict(**idata_dict, save_warmup=True)
 
 
-def to_json(idata, filename):
+def to_json(idata, filename, array_format="list"):
     """Save dataset as a json file.
 
     Will use the faster `ujson` (https://github.com/ultrajson/ultrajson) if it is available.
@@ -44,11 +61,13 @@ def to_json(idata, filename):
         Object to be saved
     filename : str
         name or path of the file to load trace
+    array_format : {"list", "base64", "binary"}, default "list"
+        How arrays are stored, see :meth:`arviz.InferenceData.to_json`.
 
     Returns
     -------
     str
         filename saved to
     """
-    file_name = idata.to_json(filename)
+    file_name = idata.to_json(filename, array_format=array_format)
     return file_name
@@ -4,7 +4,15 @@ from .converters import convert_to_inference_data
 from .inference_data import InferenceData
 
 
-def from_netcdf(filename, *, engine="h5netcdf", group_kwargs=None, regex=False):
+def from_netcdf(
+    filename,
+    *,
+    engine="h5netcdf",
+    group_kwargs=None,
+    regex=False,
+    defer_groups=False,
+    chunks=None,
+):
     """Load netcdf file back into an arviz.InferenceData.
 
     Parameters
@@ -17,9 +25,17 @@ def from_netcdf(filename, *, engine="h5netcdf", group_kwargs=None, regex=False):
         Keyword arguments to be passed into each call of :func:`xarray.open_dataset`.
         The keys of the higher level should be group names or regex matching group
         names, the inner dicts re passed to ``open_dataset``.
-        This feature is currently experimental
+        This feature is currently experimental. A ``chunks`` key in the inner
+        dicts overrides the ``chunks`` argument for the matching groups.
     regex : str
         Specifies where regex search should be used to extend the keyword arguments.
+    defer_groups : bool, default False
+        If True, groups are not opened until they are first accessed, so only the
+        groups that are used are read from the file.
+    chunks : "auto" or dict of {str: int}, optional
+        Dask chunks of the returned datasets. ``"auto"`` lets dask choose the chunks
+        of all dimensions but ``chain`` and ``draw``, which are never split.
+        Defaults to ``rcParams["data.chunks"]``.
 
     Returns
     -------
@@ -34,7 +50,12 @@ def from_netcdf(filename, *, engine="h5netcdf", group_kwargs=None, regex=False):
     if group_kwargs is None:
         group_kwargs = {}
     return InferenceData.from_netcdf(
-        filename, engine=engine, group_kwargs=group_kwargs, regex=regex
+        filename,
+        engine=engine,
+        group_kwargs=group_kwargs,
+        regex=regex,
+        defer_groups=defer_groups,
+        chunks=chunks,
     )
 
 
@@ -7,7 +7,7 @@ import numpy as np
 
 from .. import utils
 from ..rcparams import rcParams
-from .base import dict_to_dataset, requires
+from .base import _group_float_dtype, dict_to_dataset, requires
 from .inference_data import InferenceData
 
 _log = logging.getLogger(__name__)
@@ -37,6 +37,7 @@ class NumPyroConverter:
         dims=None,
         pred_dims=None,
         num_chains=1,
+        dtype=None,
     ):
         """Convert NumPyro data into an InferenceData object.
 
@@ -63,6 +64,8 @@ class NumPyroConverter:
             Dims for predictions data. Map variable names to their coordinates.
         num_chains: int
             Number of chains used for sampling. Ignored if posterior is present.
+        dtype : str, numpy.dtype or dict of {str : str or numpy.dtype}, optional
+            Dtype floating point arrays are converted to, for all groups or per group.
         """
         import jax
         import numpyro
@@ -77,6 +80,7 @@ class NumPyroConverter:
             rcParams["data.log_likelihood"] if log_likelihood is None else log_likelihood
         )
         self.index_origin = rcParams["data.index_origin"] if index_origin is None else index_origin
+        self.dtype = dtype
         self.coords = coords
         self.dims = dims
         self.pred_dims = pred_dims
@@ -150,6 +154,7 @@ class NumPyroConverter:
             coords=self.coords,
             dims=self.dims,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "posterior"),
         )
 
     @requires("posterior")
@@ -176,6 +181,7 @@ class NumPyroConverter:
             dims=None,
             coords=self.coords,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "sample_stats"),
         )
 
     @requires("posterior")
@@ -202,9 +208,12 @@ class NumPyroConverter:
             coords=self.coords,
             index_origin=self.index_origin,
             skip_event_dims=True,
+            dtype=_group_float_dtype(self.dtype, "log_likelihood"),
         )
 
-    def translate_posterior_predictive_dict_to_xarray(self, dct, dims):
+    def translate_posterior_predictive_dict_to_xarray(
+        self, dct, dims, group="posterior_predictive"
+    ):
         """Convert posterior_predictive or prediction samples to xarray."""
         data = {}
         for k, ary in dct.items():
@@ -225,19 +234,22 @@ class NumPyroConverter:
             coords=self.coords,
             dims=dims,
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, group),
         )
 
     @requires("posterior_predictive")
     def posterior_predictive_to_xarray(self):
         """Convert posterior_predictive samples to xarray."""
         return self.translate_posterior_predictive_dict_to_xarray(
-            self.posterior_predictive, self.dims
+            self.posterior_predictive, self.dims, "posterior_predictive"
         )
 
     @requires("predictions")
     def predictions_to_xarray(self):
         """Convert predictions to xarray."""
-        return self.translate_posterior_predictive_dict_to_xarray(self.predictions, self.pred_dims)
+        return self.translate_posterior_predictive_dict_to_xarray(
+            self.predictions, self.pred_dims, "predictions"
+        )
 
     def priors_to_xarray(self):
         """Convert prior samples (and if possible prior predictive too) to xarray."""
@@ -259,6 +271,7 @@ class NumPyroConverter:
                     coords=self.coords,
                     dims=self.dims,
                     index_origin=self.index_origin,
+                    dtype=_group_float_dtype(self.dtype, group),
                 )
             )
             for group, var_names in zip(
@@ -278,6 +291,7 @@ class NumPyroConverter:
             coords=self.coords,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "observed_data"),
         )
 
     @requires("constant_data")
@@ -290,6 +304,7 @@ class NumPyroConverter:
             coords=self.coords,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "constant_data"),
         )
 
     @requires("predictions_constant_data")
@@ -302,6 +317,7 @@ class NumPyroConverter:
             coords=self.coords,
             default_dims=[],
             index_origin=self.index_origin,
+            dtype=_group_float_dtype(self.dtype, "predictions_constant_data"),
         )
 
     def to_inference_data(self):
@@ -340,6 +356,7 @@ def from_numpyro(
     dims=None,
     pred_dims=None,
     num_chains=1,
+    dtype=None,
 ):
     """Convert NumPyro data into an InferenceData object.
 
@@ -369,6 +386,9 @@ def from_numpyro(
         Dims for predictions data. Map variable names to their coordinates.
     num_chains: int
         Number of chains used for sampling. Ignored if posterior is present.
+    dtype : str, numpy.dtype or dict of {str : str or numpy.dtype}, optional
+        Dtype floating point arrays are converted to, for all groups or per group.
+        Defaults to ``rcParams["data.float_dtype"]``.
     """
     return NumPyroConverter(
         posterior=posterior,
@@ -383,4 +403,5 @@ def from_numpyro(
         dims=dims,
         pred_dims=pred_dims,
         num_chains=num_chains,
+        dtype=dtype,
     ).to_inference_data()
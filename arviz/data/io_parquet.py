@@ -0,0 +1,32 @@
+"""Input and output support for parquet files."""
+
+from .converters import convert_to_inference_data
+from .inference_data import InferenceData
+
+
+def from_parquet(path, groups=None, var_names=None):
+    return InferenceData.from_parquet(path, groups=groups, var_names=var_names)
+
+
+from_parquet.__doc__ = InferenceData.from_parquet.__doc__
+
+
+def to_parquet(data, path, **kwargs):
+    """Save dataset as a directory of parquet files, one per group.
+
+    Parameters
+    ----------
+    data : InferenceData, or any object accepted by `convert_to_inference_data`
+        Object to be saved
+    path : str
+        Directory to write to.
+    **kwargs : dict, optional
+        Passed to :meth:`arviz.InferenceData.to_parquet`.
+
+    Returns
+    -------
+    str
+        Location of the parquet directory
+    """
+    inference_data = convert_to_inference_data(data)
+    return inference_data.to_parquet(path, **kwargs)
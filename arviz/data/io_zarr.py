@@ -4,14 +4,23 @@ from .converters import convert_to_inference_data
 from .inference_data import InferenceData
 
 
-def from_zarr(store):
-    return InferenceData.from_zarr(store)
+def from_zarr(store, defer_groups=False, chunks=None, group_kwargs=None, regex=False, n_jobs=None):
+    return InferenceData.from_zarr(
+        store,
+        defer_groups=defer_groups,
+        chunks=chunks,
+        group_kwargs=group_kwargs,
+        regex=regex,
+        n_jobs=n_jobs,
+    )
 
 
 from_zarr.__doc__ = InferenceData.from_zarr.__doc__
 
 
-def to_zarr(data, store=None, **kwargs):
+def to_zarr(
+    data, store=None, *, encoding=None, chunks=None, compressor=None, n_jobs=None, **kwargs
+):
     """
     Convert data to zarr, optionally saving to disk if ``store`` is provided.
 
@@ -22,6 +31,14 @@ def to_zarr(data, store=None, **kwargs):
     store : zarr.storage, MutableMapping or str, optional
         Zarr storage class or path to desired DirectoryStore.
         Default (None) a store is created in a temporary directory.
+    encoding : dict of {str : dict of {str : dict}}, optional
+        Encoding of the variables of each group, see :meth:`arviz.InferenceData.to_zarr`.
+    chunks : dict, optional
+        Chunk sizes of the zarr arrays, globally or per group.
+    compressor : numcodecs.abc.Codec or dict, optional
+        Compressor of the numeric variables, globally or per group.
+    n_jobs : int, optional
+        Number of groups written concurrently.
     **kwargs : dict, optional
         Passed to :py:func:`convert_to_inference_data`.
 
@@ -42,5 +59,7 @@ def to_zarr(data, store=None, **kwargs):
 
     """
     inference_data = convert_to_inference_data(data, **kwargs)
-    zarr_group = inference_data.to_zarr(store=store)
+    zarr_group = inference_data.to_zarr(
+        store=store, encoding=encoding, chunks=chunks, compressor=compressor, n_jobs=n_jobs
+    )
     return zarr_group
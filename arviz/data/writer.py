@@ -0,0 +1,240 @@
+"""Incremental writing of InferenceData to zarr stores and netcdf files."""
+
+import warnings
+from collections.abc import MutableMapping
+
+import numpy as np
+import xarray as xr
+from packaging import version
+
+from ..rcparams import rcParams
+from .base import dict_to_dataset
+from .inference_data import InferenceData
+
+
+class InferenceDataWriter:
+    """Write InferenceData to disk incrementally, appending draws as they are generated.
+
+    The layout of all groups and variables is created when initializing the writer.
+    Draws are then appended along the ``draw`` dimension with :meth:`append`, and
+    :meth:`finalize` writes the global attributes and, for zarr stores, the consolidated
+    metadata. The store can be opened with :func:`arviz.from_zarr` or
+    :func:`arviz.from_netcdf` at any time between calls to :meth:`append` to read the
+    draws written so far.
+
+    Parameters
+    ----------
+    store : str or MutableMapping
+        Path to the zarr store or netcdf file, or zarr storage class.
+    groups : dict of {str : dict of {str : tuple}}
+        Layout of the groups to write. Keys are group names and values are dictionaries
+        mapping variable names to the shape of the variable without the ``chain`` and
+        ``draw`` dimensions, or to a ``(shape, dtype)`` tuple. The default dtype is float64.
+    chains : int
+        Number of chains.
+    coords : dict of {str : array_like}, optional
+        Coordinates for the datasets.
+    dims : dict of {str : list of str}, optional
+        Dimensions of each variable. The keys are variable names, values are lists of
+        coordinates.
+    attrs : dict, optional
+        Global attributes of the InferenceData, written by :meth:`finalize`.
+    backend : {"zarr", "netcdf"}, optional
+        Format to write. Defaults to "netcdf" for paths ending in ``.nc`` and to "zarr"
+        otherwise. The netcdf backend requires h5netcdf and stores ``draw`` as an
+        unlimited dimension.
+    draws_per_chunk : int, default 100
+        Size of the chunks along the ``draw`` dimension.
+
+    Examples
+    --------
+    Write the draws of a sampler 100 at a time:
+
+    .. code-block:: python
+
+        import arviz as az
+        import numpy as np
+
+        writer = az.InferenceDataWriter(
+            "trace.zarr", {"posterior": {"mu": (), "theta": (8,)}}, chains=4
+        )
+        for _ in range(10):
+            writer.append({"mu": np.random.randn(4, 100), "theta": np.random.randn(4, 100, 8)})
+        idata = writer.finalize()
+
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        store,
+        groups,
+        chains,
+        *,
+        coords=None,
+        dims=None,
+        attrs=None,
+        backend=None,
+        draws_per_chunk=100,
+    ):
+        if backend is None:
+            backend = "netcdf" if isinstance(store, str) and store.endswith(".nc") else "zarr"
+        if backend not in ("zarr", "netcdf"):
+            raise ValueError(
+                f"Invalid value for backend: {backend}. Valid options are: zarr or netcdf"
+            )
+        self.backend = backend
+        self.chains = chains
+        self.coords = {} if coords is None else coords
+        self.dims = {} if dims is None else dims
+        self.attrs = {} if attrs is None else dict(attrs)
+        self.draws = {group: 0 for group in groups}
+        self.index_origin = rcParams["data.index_origin"]
+        self._layout = {
+            group: {
+                var_name: (
+                    (tuple(spec[0]), np.dtype(spec[1]))
+                    if len(spec) == 2 and isinstance(spec[0], (tuple, list))
+                    else (tuple(spec), np.dtype("float64"))
+                )
+                for var_name, spec in variables.items()
+            }
+            for group, variables in groups.items()
+        }
+        self._finalized = False
+
+        if backend == "zarr":
+            try:
+                import zarr
+
+                assert version.parse(zarr.__version__) >= version.parse("2.5.0")
+            except (ImportError, AssertionError) as err:
+                raise ImportError("'InferenceDataWriter' needs Zarr (2.5.0+) installed.") from err
+            if isinstance(store, str):
+                store = zarr.storage.DirectoryStore(path=store)
+            elif not isinstance(store, MutableMapping):
+                raise TypeError(f"No valid store found: {store}")
+            zarr.open_group(store, mode="w")
+        else:
+            xr.Dataset().to_netcdf(store, mode="w", engine="h5netcdf")
+        self.store = store
+
+        self._group_attrs = {}
+        for group, variables in self._layout.items():
+            dataset = self._to_dataset(
+                {
+                    var_name: np.zeros((chains, 1, *shape), dtype=dtype)
+                    for var_name, (shape, dtype) in variables.items()
+                },
+            ).isel(draw=slice(0, 0))
+            self._group_attrs[group] = dataset.attrs
+            chunks = {
+                var_name: (chains, draws_per_chunk, *(max(size, 1) for size in shape))
+                for var_name, (shape, _) in variables.items()
+            }
+            if backend == "zarr":
+                encoding = {var_name: {"chunks": chunk} for var_name, chunk in chunks.items()}
+                encoding["draw"] = {"chunks": (draws_per_chunk,)}
+                dataset.to_zarr(store, group=group, mode="w", encoding=encoding, consolidated=False)
+            else:
+                encoding = {var_name: {"chunksizes": chunk} for var_name, chunk in chunks.items()}
+                encoding["draw"] = {"chunksizes": (draws_per_chunk,)}
+                dataset.to_netcdf(
+                    store,
+                    mode="a",
+                    group=group,
+                    engine="h5netcdf",
+                    encoding=encoding,
+                    unlimited_dims=["draw"],
+                )
+
+    def _to_dataset(self, draws, start=0):
+        """Convert a dictionary of draws to a dataset with draw coordinates from ``start``."""
+        n_draws = next(iter(draws.values())).shape[1] if draws else 0
+        coords = {
+            **self.coords,
+            "draw": np.arange(start, start + n_draws) + self.index_origin,
+        }
+        with warnings.catch_warnings():
+            # creating the layout uses a single draw, which can be less than the chains
+            warnings.filterwarnings("ignore", message="More chains")
+            return dict_to_dataset(draws, coords=coords, dims=self.dims)
+
+    def append(self, draws, group="posterior"):
+        """Append draws to a group.
+
+        Parameters
+        ----------
+        draws : dict of {str : array_like}
+            New draws of every variable in the group, with shape ``(chains, draws, *shape)``.
+        group : str, default "posterior"
+            Group the draws belong to.
+        """
+        if self._finalized:
+            raise ValueError("Draws can not be appended after calling finalize")
+        if group not in self._layout:
+            raise KeyError(f"Group {group} is not part of the layout of this writer")
+        layout = self._layout[group]
+        if set(draws) != set(layout):
+            raise ValueError(
+                f"Draws must have exactly the variables {list(layout)}, got {list(draws)}"
+            )
+        draws = {
+            var_name: np.asarray(values, dtype=layout[var_name][1])
+            for var_name, values in draws.items()
+        }
+        n_draws = None
+        for var_name, values in draws.items():
+            expected_shape = (self.chains, *layout[var_name][0])
+            if (values.shape[0], *values.shape[2:]) != expected_shape or (
+                n_draws is not None and values.shape[1] != n_draws
+            ):
+                raise ValueError(
+                    f"Variable {var_name} has shape {values.shape}, expected "
+                    f"({self.chains}, draws, {', '.join(map(str, layout[var_name][0]))}) "
+                    "with the same number of draws for all variables"
+                )
+            n_draws = values.shape[1]
+
+        start = self.draws[group]
+        dataset = self._to_dataset(draws, start=start)
+        dataset.attrs = self._group_attrs[group]
+        if self.backend == "zarr":
+            dataset.to_zarr(self.store, group=group, append_dim="draw", consolidated=False)
+        else:
+            import h5netcdf
+
+            with h5netcdf.File(self.store, mode="a") as file_handle:
+                h5group = file_handle[group]
+                h5group.resize_dimension("draw", start + n_draws)
+                for var_name, variable in dataset.variables.items():
+                    if "draw" not in variable.dims:
+                        continue
+                    draw_idx = variable.dims.index("draw")
+                    idx = (slice(None),) * draw_idx + (slice(start, start + n_draws),)
+                    h5group[var_name][idx] = variable.values
+        self.draws[group] = start + n_draws
+
+    def finalize(self):
+        """Write the global attributes and consolidated metadata.
+
+        Returns
+        -------
+        InferenceData
+            The written InferenceData, lazily loaded from disk.
+        """
+        if self.backend == "zarr":
+            import zarr
+
+            zarr.open_group(self.store, mode="a").attrs.update(self.attrs)
+            zarr.consolidate_metadata(self.store)
+            idata = InferenceData.from_zarr(self.store)
+        else:
+            import h5netcdf
+
+            with h5netcdf.File(self.store, mode="a") as file_handle:
+                file_handle.attrs.update(self.attrs)
+            idata = InferenceData.from_netcdf(self.store)
+        self._finalized = True
+        return idata
@@ -1,6 +1,7 @@
 """Plotting functions."""
 
 from .autocorrplot import plot_autocorr
+from .batchplot import render_batch
 from .bpvplot import plot_bpv
 from .bfplot import plot_bf
 from .compareplot import plot_compare
@@ -58,4 +59,5 @@ __all__ = [
     "plot_ts",
     "plot_violin",
     "plot_separation",
+    "render_batch",
 ]
@@ -1,10 +1,12 @@
 # pylint: disable=wrong-import-position
 """Bokeh Plotting Backend."""
+import numpy as np
+from bokeh.models import GlyphRenderer, Legend
 from bokeh.plotting import figure
-from numpy import array
 from packaging import version
 
 from ....rcparams import rcParams
+from ...plot_utils import steps_pre
 
 
 def backend_kwarg_defaults(*args, **kwargs):
@@ -109,7 +111,7 @@ def create_axes_grid(
             else:
                 row_figures.append(figure(**backend_kwargs))
         figures.append(row_figures)
-    figures = array(figures)
+    figures = np.array(figures)
     if figures.size == 1 and squeeze:
         figures = figures[0, 0]
     return figures
@@ -134,6 +136,80 @@ def dealiase_sel_kwargs(kwargs, prop_dict, idx):
     }
 
 
+def multi_line_data(x, y, steps=False):
+    """Split the broadcast `x` and `y` arrays into the per line lists taken by ``multi_line``.
+
+    The last dimension contains the points of each line and the other ones index the lines.
+    If `steps` is true, the vertices of the ``steps-pre`` version of the lines are used.
+    """
+    if steps:
+        x, y = steps_pre(x, y)
+    x, y = np.broadcast_arrays(x, y)
+    return list(x.reshape(-1, x.shape[-1])), list(y.reshape(-1, y.shape[-1]))
+
+
+def add_segments(ax, x_start, x_end, y_start, y_end, **kwargs):
+    """Draw the segments between the broadcast start and end points as a single glyph.
+
+    Parameters
+    ----------
+    ax : bokeh figure
+    x_start, x_end, y_start, y_end : array_like
+        Coordinates of the start and end points of every segment.
+    **kwargs
+        Passed to ``ax.segment``, properties like ``line_width`` or ``line_color`` can be
+        sequences with one element per segment.
+
+    Returns
+    -------
+    bokeh GlyphRenderer
+    """
+    x_start, x_end, y_start, y_end = (
+        ary.ravel() for ary in np.broadcast_arrays(x_start, x_end, y_start, y_end)
+    )
+    return ax.segment(x0=x_start, y0=y_start, x1=x_end, y1=y_end, **kwargs)
+
+
+def clear_glyphs(layout, keep=()):
+    """Remove the glyphs of existing figures so their content can be drawn again in place.
+
+    Used to update figures already rendered by a bokeh server or notebook without
+    creating new ones: only the glyphs drawn again are sent to the browser.
+
+    Parameters
+    ----------
+    layout : bokeh figure or array of bokeh figures
+        Figures to clear in place.
+    keep : iterable of bokeh ColumnDataSource, optional
+        Glyphs using these data sources are kept, together with their legend items.
+        Legends left without items are removed, axes, ranges and other annotations
+        are not modified.
+    """
+    keep_ids = {source.id for source in keep}
+    for fig in np.ravel(layout):
+        if fig is None:
+            continue
+        removed_ids = {
+            renderer.id
+            for renderer in fig.renderers
+            if isinstance(renderer, GlyphRenderer) and renderer.data_source.id not in keep_ids
+        }
+        if not removed_ids:
+            continue
+        fig.renderers = [renderer for renderer in fig.renderers if renderer.id not in removed_ids]
+        for legend in fig.select(type=Legend):
+            legend.items = [
+                item
+                for item in legend.items
+                if not any(renderer.id in removed_ids for renderer in item.renderers)
+            ]
+            if not legend.items:
+                for place in ("above", "below", "left", "right", "center"):
+                    panels = getattr(fig, place)
+                    if any(panel is legend for panel in panels):
+                        setattr(fig, place, [panel for panel in panels if panel is not legend])
+
+
 from .autocorrplot import plot_autocorr
 from .compareplot import plot_compare
 from .densityplot import plot_density
@@ -9,7 +9,12 @@ from bokeh.models.annotations import Legend, Title
 
 from ....stats import hdi
 from ....stats.density_utils import get_bins, histogram, kde
-from ...plot_utils import _scale_fig_size, calculate_point_estimate, vectorized_to_hex
+from ...plot_utils import (
+    _scale_fig_size,
+    calculate_point_estimate,
+    hdi_metric_names,
+    vectorized_to_hex,
+)
 from .. import show_layout
 from . import backend_kwarg_defaults, create_axes_grid
 
@@ -18,6 +23,7 @@ def plot_density(
     ax,
     all_labels,
     to_plot,
+    plotter_stats,
     colors,
     bw,
     circular,
@@ -78,7 +84,7 @@ def plot_density(
 
     legend_items = defaultdict(list)
     for m_idx, plotters in enumerate(to_plot):
-        for var_name, selection, isel, values in plotters:
+        for (var_name, selection, isel, values), stats in zip(plotters, plotter_stats[m_idx]):
             label = labeller.make_label_vert(var_name, selection, isel)
 
             data_label = data_labels[m_idx] if data_labels else None
@@ -97,6 +103,7 @@ def plot_density(
                 outline,
                 shade,
                 axis_map[label],
+                stats,
             )
             if data_label is not None:
                 legend_items[axis_map[label]].append((data_label, plotted))
@@ -129,13 +136,15 @@ def _d_helper(
     outline,
     shade,
     ax,
+    stats,
 ):
     extra = {}
     plotted = []
+    hdi_stats = [stats.get(name) for name in hdi_metric_names(hdi_prob)]
 
     if vec.dtype.kind == "f":
         if hdi_prob != 1:
-            hdi_ = hdi(vec, hdi_prob, multimodal=False)
+            hdi_ = hdi(vec, hdi_prob, multimodal=False) if None in hdi_stats else hdi_stats
             new_vec = vec[(vec >= hdi_[0]) & (vec <= hdi_[1])]
         else:
             new_vec = vec
@@ -184,7 +193,7 @@ def _d_helper(
             )
 
     else:
-        xmin, xmax = hdi(vec, hdi_prob, multimodal=False)
+        xmin, xmax = hdi(vec, hdi_prob, multimodal=False) if None in hdi_stats else hdi_stats
         bins = get_bins(vec)
 
         _, hist, edges = histogram(vec, bins=bins)
@@ -224,7 +233,9 @@ def _d_helper(
         plotted.append(ax.diamond(xmax, 0, line_color="black", fill_color=color, size=markersize))
 
     if point_estimate is not None:
-        est = calculate_point_estimate(point_estimate, vec, bw, circular)
+        est = stats.get(point_estimate)
+        if est is None:
+            est = calculate_point_estimate(point_estimate, vec, bw, circular)
         plotted.append(ax.circle(est, 0, fill_color=color, line_color="black", size=markersize))
 
     _title = Title()
@@ -15,9 +15,9 @@ from ....rcparams import rcParams
 from ....stats import hdi
 from ....stats.density_utils import get_bins, histogram, kde
 from ....stats.diagnostics import _ess, _rhat
-from ...plot_utils import _scale_fig_size
+from ...plot_utils import _scale_fig_size, hdi_metric_names, summary_lookup
 from .. import show_layout
-from . import backend_kwarg_defaults
+from . import add_segments, backend_kwarg_defaults
 
 
 def pairwise(iterable):
@@ -54,6 +54,7 @@ def plot_forest(
     labeller,
     ess,
     r_hat,
+    stats,
     backend_config,
     backend_kwargs,
     show,
@@ -67,6 +68,7 @@ def plot_forest(
         combine_dims=combine_dims,
         colors=colors,
         labeller=labeller,
+        stats=stats,
     )
 
     if figsize is None:
@@ -212,7 +214,9 @@ class PlotHandler:
 
     # pylint: disable=inconsistent-return-statements
 
-    def __init__(self, datasets, var_names, model_names, combined, combine_dims, colors, labeller):
+    def __init__(
+        self, datasets, var_names, model_names, combined, combine_dims, colors, labeller, stats=None
+    ):
         self.data = datasets
 
         if model_names is None:
@@ -252,6 +256,11 @@ class PlotHandler:
 
         self.colors = list(reversed(colors))  # y-values are upside down
         self.labeller = labeller
+        if stats is None:
+            stats = [None for _ in self.data]
+        elif len(stats) != len(self.data):
+            raise ValueError("The number of stats does not match the number of models")
+        self.stats = dict(zip(self.model_names, map(summary_lookup, stats)))
 
         self.plotters = self.make_plotters()
 
@@ -268,6 +277,7 @@ class PlotHandler:
                 combine_dims=self.combine_dims,
                 colors=self.colors,
                 labeller=self.labeller,
+                stats=self.stats,
             )
             y = plotters[var_name].y_max()
         return plotters
@@ -514,6 +524,8 @@ class PlotHandler:
         else:
             qlist = [endpoint, 50, 100 - endpoint]
 
+        intervals = defaultdict(list)
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, model_name, selection, values, color in plotter.treeplot(qlist, hdi_prob):
                 if isinstance(rope, dict):
@@ -526,22 +538,25 @@ class PlotHandler:
                     np.linspace(2 * linewidth, linewidth, mid, endpoint=True)[-1::-1], range(mid)
                 )
                 for width, j in param_iter:
-                    plotted[model_name].append(
-                        ax.line(
-                            [values[j], values[-(j + 1)]],
-                            [y, y],
-                            line_width=width,
-                            line_color=color,
-                        )
-                    )
-                plotted[model_name].append(
-                    ax.circle(
-                        x=values[mid],
-                        y=y,
-                        size=markersize * 0.75,
-                        fill_color=color,
-                    )
+                    intervals[model_name].append((values[j], values[-(j + 1)], y, width, color))
+                markers[model_name].append((values[mid], y, color))
+        for model_name, model_intervals in intervals.items():
+            x_start, x_end, y_vals, widths, colors = zip(*model_intervals)
+            plotted[model_name].append(
+                add_segments(
+                    ax, x_start, x_end, y_vals, y_vals, line_width=widths, line_color=colors
                 )
+            )
+        for model_name, model_markers in markers.items():
+            x_vals, y_vals, colors = zip(*model_markers)
+            plotted[model_name].append(
+                ax.circle(
+                    x=list(x_vals),
+                    y=list(y_vals),
+                    size=markersize * 0.75,
+                    fill_color=list(colors),
+                )
+            )
         _title = Title()
         _title.text = f"{hdi_prob:.1%} HDI"
         ax.title = _title
@@ -551,20 +566,24 @@ class PlotHandler:
     def plot_neff(self, ax, markersize, plotted):
         """Draw effective n for each plotter."""
         max_ess = 0
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, ess, color, model_name in plotter.ess():
                 if ess is not None:
-                    plotted[model_name].append(
-                        ax.circle(
-                            x=ess,
-                            y=y,
-                            fill_color=color,
-                            size=markersize,
-                            line_color="black",
-                        )
-                    )
+                    markers[model_name].append((ess, y, color))
                 if ess > max_ess:
                     max_ess = ess
+        for model_name, model_markers in markers.items():
+            x_vals, y_vals, colors = zip(*model_markers)
+            plotted[model_name].append(
+                ax.circle(
+                    x=list(x_vals),
+                    y=list(y_vals),
+                    fill_color=list(colors),
+                    size=markersize,
+                    line_color="black",
+                )
+            )
         ax.x_range._property_values["start"] = 0  # pylint: disable=protected-access
         ax.x_range._property_values["end"] = 1.07 * max_ess  # pylint: disable=protected-access
 
@@ -578,14 +597,22 @@ class PlotHandler:
 
     def plot_rhat(self, ax, markersize, plotted):
         """Draw r-hat for each plotter."""
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, r_hat, color, model_name in plotter.r_hat():
                 if r_hat is not None:
-                    plotted[model_name].append(
-                        ax.circle(
-                            x=r_hat, y=y, fill_color=color, size=markersize, line_color="black"
-                        )
-                    )
+                    markers[model_name].append((r_hat, y, color))
+        for model_name, model_markers in markers.items():
+            x_vals, y_vals, colors = zip(*model_markers)
+            plotted[model_name].append(
+                ax.circle(
+                    x=list(x_vals),
+                    y=list(y_vals),
+                    fill_color=list(colors),
+                    size=markersize,
+                    line_color="black",
+                )
+            )
         ax.x_range._property_values["start"] = 0.9  # pylint: disable=protected-access
         ax.x_range._property_values["end"] = 2.1  # pylint: disable=protected-access
 
@@ -616,7 +643,16 @@ class VarHandler:
     """Handle individual variable logic."""
 
     def __init__(
-        self, var_name, data, y_start, model_names, combined, combine_dims, colors, labeller
+        self,
+        var_name,
+        data,
+        y_start,
+        model_names,
+        combined,
+        combine_dims,
+        colors,
+        labeller,
+        stats=None,
     ):
         self.var_name = var_name
         self.data = data
@@ -631,9 +667,17 @@ class VarHandler:
         self.chain_offset = len(data) * 0.45 / max(1, max_chains)
         self.var_offset = 1.5 * self.chain_offset
         self.group_offset = 2 * self.var_offset
+        # statistics precomputed over all chains only apply to combined rows
+        self.stats = stats if combined and not combine_dims and stats is not None else {}
+        self._rows = None
 
     def iterator(self):
         """Iterate over models and chains for each variable."""
+        if self._rows is None:
+            self._rows = list(self._iterate_rows())
+        return iter(self._rows)
+
+    def _iterate_rows(self):
         if self.combined:
             grouped_data = [[(0, datum)] for datum in self.data]
             skip_dims = self.combine_dims.union({"chain"})
@@ -692,18 +736,32 @@ class VarHandler:
                 colors.append(data[2])  # the colors are all the same
         return labels, ticks, vals, colors, model_names
 
+    def summary_stat(self, model_name, selection, metric):
+        """Get a precomputed statistic of the variable, None if it is not available."""
+        if model_name not in self.stats:
+            return None
+        return self.stats[model_name](self.var_name, selection).get(metric)
+
     def treeplot(self, qlist, hdi_prob):
         """Get data for each treeplot for the variable."""
+        hdi_names = hdi_metric_names(hdi_prob)
         for y, _, model_name, _, selection, values, color in self.iterator():
-            ntiles = np.percentile(values.flatten(), qlist)
-            ntiles[0], ntiles[-1] = hdi(values.flatten(), hdi_prob, multimodal=False)
+            hdi_ = [self.summary_stat(model_name, selection, name) for name in hdi_names]
+            if None in hdi_:
+                ntiles = np.percentile(values.flatten(), qlist)
+                ntiles[0], ntiles[-1] = hdi(values.flatten(), hdi_prob, multimodal=False)
+            else:
+                ntiles = np.concatenate(
+                    ([hdi_[0]], np.percentile(values.flatten(), qlist[1:-1]), [hdi_[1]])
+                )
             yield y, model_name, selection, ntiles, color
 
     def ridgeplot(self, hdi_prob, mult, ridgeplot_kind):
         """Get data for each ridgeplot for the variable."""
         xvals, hdi_vals, yvals, pdfs, pdfs_q, colors, model_names = [], [], [], [], [], [], []
 
-        for y, _, model_name, *_, values, color in self.iterator():
+        hdi_names = hdi_metric_names(hdi_prob)
+        for y, _, model_name, _, selection, values, color in self.iterator():
             yvals.append(y)
             colors.append(color)
             model_names.append(model_name)
@@ -711,7 +769,9 @@ class VarHandler:
             values = values[np.isfinite(values)]
 
             if hdi_prob != 1:
-                hdi_ = hdi(values, hdi_prob, multimodal=False)
+                hdi_ = [self.summary_stat(model_name, selection, name) for name in hdi_names]
+                if None in hdi_:
+                    hdi_ = hdi(values, hdi_prob, multimodal=False)
             else:
                 hdi_ = min(values), max(values)
 
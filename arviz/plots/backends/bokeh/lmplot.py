@@ -90,26 +90,21 @@ def plot_lm(
         if y_hat is not None:
             _, _, _, y_hat_plotters = y_hat[i]
             if kind_pp == "samples":
-                posterior_legend = []
-                for j in range(num_samples):
-                    if xjitter is True:
-                        jitter_scale = x_plotters[1] - x_plotters[0]
-                        scale_high = jitter_scale * 0.2
-                        x_plotters_jitter = x_plotters + np.random.uniform(
-                            low=-scale_high, high=scale_high, size=len(x_plotters)
-                        )
-                        posterior_circle = ax_i.circle(
-                            x_plotters_jitter,
-                            y_hat_plotters[..., j],
-                            alpha=0.2,
-                            **y_hat_plot_kwargs,
-                        )
-                    else:
-                        posterior_circle = ax_i.circle(
-                            x_plotters, y_hat_plotters[..., j], alpha=0.2, **y_hat_plot_kwargs
-                        )
-                    posterior_legend.append(posterior_circle)
-                legend_it.append(("Posterior predictive samples", posterior_legend))
+                if xjitter is True:
+                    jitter_scale = x_plotters[1] - x_plotters[0]
+                    scale_high = jitter_scale * 0.2
+                    x_plotters_jitter = x_plotters + np.random.uniform(
+                        low=-scale_high, high=scale_high, size=(num_samples, len(x_plotters))
+                    )
+                else:
+                    x_plotters_jitter = x_plotters
+                x_plotters_jitter, y_hat_samples = np.broadcast_arrays(
+                    x_plotters_jitter, np.moveaxis(y_hat_plotters[..., :num_samples], -1, 0)
+                )
+                posterior_circle = ax_i.circle(
+                    x_plotters_jitter.ravel(), y_hat_samples.ravel(), alpha=0.2, **y_hat_plot_kwargs
+                )
+                legend_it.append(("Posterior predictive samples", [posterior_circle]))
 
             else:
                 plot_hdi(
@@ -31,6 +31,8 @@ def plot_pair(
     scatter_kwargs,  # pylint: disable=unused-argument
     kde_kwargs,
     hexbin_kwargs,
+    density_kwargs,
+    density_data,
     gridsize,  # pylint: disable=unused-argument
     colorbar,  # pylint: disable=unused-argument
     divergences,
@@ -60,6 +62,9 @@ def plot_pair(
     hexbin_kwargs = _init_kwargs_dict(hexbin_kwargs)
     hexbin_kwargs.setdefault("size", 0.5)
 
+    density_kwargs = _init_kwargs_dict(density_kwargs)
+    density_kwargs.setdefault("palette", "Viridis256")
+
     marginal_kwargs = _init_kwargs_dict(marginal_kwargs)
     point_estimate_kwargs = _init_kwargs_dict(point_estimate_kwargs)
     kde_kwargs = _init_kwargs_dict(kde_kwargs)
@@ -161,15 +166,29 @@ def plot_pair(
     point_estimate_kwargs.setdefault("line_width", 2)
     point_estimate_kwargs.setdefault("line_dash", "solid")
 
+    # Only the samples drawn as points are stored in the data source
+    if "scatter" in kind:
+        rows = slice(None)
+    elif divergences:
+        rows = np.array(diverging_mask).astype(bool)
+    else:
+        rows = slice(0, 0)
+
     tmp_flat_var_names = None
     if len(flat_var_names) == len(list(set(flat_var_names))):
-        source_dict = dict(zip(flat_var_names, [list(post[-1].flatten()) for post in plotters]))
+        source_dict = dict(
+            zip(flat_var_names, [list(post[-1].flatten()[rows]) for post in plotters])
+        )
     else:
         tmp_flat_var_names = [f"{name}__{str(uuid4())}" for name in flat_var_names]
-        source_dict = dict(zip(tmp_flat_var_names, [list(post[-1].flatten()) for post in plotters]))
+        source_dict = dict(
+            zip(tmp_flat_var_names, [list(post[-1].flatten()[rows]) for post in plotters])
+        )
     if divergences:
         divergenve_name = f"divergences_{str(uuid4())}"
-        source_dict[divergenve_name] = np.array(diverging_mask).astype(bool).astype(int).astype(str)
+        source_dict[divergenve_name] = (
+            np.array(diverging_mask).astype(bool).astype(int).astype(str)[rows]
+        )
 
     source = ColumnDataSource(data=source_dict)
 
@@ -296,6 +315,15 @@ def plot_pair(
                         **hexbin_kwargs,
                     )
 
+                if "density" in kind:
+                    _plot_density(
+                        ax[j, i],
+                        density_data,
+                        i,
+                        j + marginals_offset,
+                        density_kwargs,
+                    )
+
                 if divergences:
                     ax[j, i].circle(
                         var1,
@@ -355,3 +383,20 @@ def plot_pair(
     show_layout(ax, show)
 
     return ax
+
+
+def _plot_density(ax, density_data, x_idx, y_idx, density_kwargs):
+    """Draw the 2D histogram of two binned variables as an image, leaving empty cells blank."""
+    edges, pair_counts = density_data
+    x_edges, y_edges = edges[x_idx], edges[y_idx]
+    counts = pair_counts[x_idx, y_idx].astype(float)
+    counts[counts == 0] = np.nan
+    ax.grid.visible = False
+    ax.image(
+        image=[counts.T],
+        x=x_edges[0],
+        y=y_edges[0],
+        dw=x_edges[-1] - x_edges[0],
+        dh=y_edges[-1] - y_edges[0],
+        **density_kwargs,
+    )
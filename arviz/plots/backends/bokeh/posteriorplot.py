@@ -13,6 +13,7 @@ from ...plot_utils import (
     _scale_fig_size,
     calculate_point_estimate,
     format_sig_figs,
+    hdi_metric_names,
     round_num,
     vectorized_to_hex,
 )
@@ -27,6 +28,7 @@ def plot_posterior(
     cols,
     figsize,
     plotters,
+    plotter_stats,
     bw,
     circular,
     bins,
@@ -70,8 +72,8 @@ def plot_posterior(
     else:
         ax = np.atleast_2d(ax)
     idx = 0
-    for (var_name, selection, isel, x), ax_ in zip(
-        plotters, (item for item in ax.flatten() if item is not None)
+    for (var_name, selection, isel, x), stats, ax_ in zip(
+        plotters, plotter_stats, (item for item in ax.flatten() if item is not None)
     ):
         _plot_posterior_op(
             idx,
@@ -85,6 +87,7 @@ def plot_posterior(
             kind=kind,
             point_estimate=point_estimate,
             round_to=round_to,
+            stats=stats,
             hdi_prob=hdi_prob,
             multimodal=multimodal,
             skipna=skipna,
@@ -127,9 +130,12 @@ def _plot_posterior_op(
     rope_color,
     ax_labelsize,
     round_to: Optional[int] = None,
+    stats=None,
     **kwargs,
 ):  # noqa: D202
     """Artist to draw posterior."""
+    if stats is None:
+        stats = {}
 
     def format_as_percent(x, round_to=0):
         return "{0:.{1:d}f}%".format(100 * x, round_to)
@@ -230,7 +236,9 @@ def _plot_posterior_op(
     def display_point_estimate(max_data):
         if not point_estimate:
             return
-        point_value = calculate_point_estimate(point_estimate, values, bw, circular)
+        point_value = stats.get(point_estimate)
+        if point_value is None:
+            point_value = calculate_point_estimate(point_estimate, values, bw, circular)
         sig_figs = format_sig_figs(point_value, round_to)
         point_text = "{point_estimate}={point_value:.{sig_figs}g}".format(
             point_estimate=point_estimate, point_value=point_value, sig_figs=sig_figs
@@ -241,9 +249,11 @@ def _plot_posterior_op(
     def display_hdi(max_data):
         # np.ndarray with 2 entries, min and max
         # pylint: disable=line-too-long
-        hdi_probs = hdi(
-            values, hdi_prob=hdi_prob, circular=circular, multimodal=multimodal, skipna=skipna
-        )  # type: np.ndarray
+        hdi_probs = [stats.get(name) for name in hdi_metric_names(hdi_prob)]
+        if multimodal or None in hdi_probs:
+            hdi_probs = hdi(
+                values, hdi_prob=hdi_prob, circular=circular, multimodal=multimodal, skipna=skipna
+            )  # type: np.ndarray
 
         for hdi_i in np.atleast_2d(hdi_probs):
             ax.line(
@@ -6,13 +6,13 @@ from bokeh.models.glyphs import Scatter
 from bokeh.models import ColumnDataSource
 
 
-from ....stats.density_utils import get_bins, histogram, kde
+from ....stats.density_utils import get_bins, histogram
 from ...kdeplot import plot_kde
 from ...plot_utils import _scale_fig_size, vectorized_to_hex
 
 
 from .. import show_layout
-from . import backend_kwarg_defaults, create_axes_grid
+from . import backend_kwarg_defaults, create_axes_grid, multi_line_data
 
 
 def plot_ppc(
@@ -26,6 +26,7 @@ def plot_ppc(
     pp_plotters,
     predictive_dataset,
     pp_sample_ix,
+    pp_densities,
     kind,
     alpha,
     colors,
@@ -112,30 +113,11 @@ def plot_ppc(
                 "line_width": 0.5 * linewidth,
             }
 
-            pp_densities = []
-            pp_xs = []
-            for vals in pp_sampled_vals:
-                vals = np.array([vals]).flatten()
-                if dtype == "f":
-                    pp_x, pp_density = kde(vals)
-                    pp_densities.append(pp_density)
-                    pp_xs.append(pp_x)
-                else:
-                    bins = get_bins(vals)
-                    _, hist, bin_edges = histogram(vals, bins=bins)
-                    hist = np.concatenate((hist[:1], hist))
-                    pp_densities.append(hist)
-                    pp_xs.append(bin_edges)
-
-            if dtype == "f":
-                multi_line = ax_i.multi_line(pp_xs, pp_densities, **plot_kwargs)
-                legend_it.append((f"{group.capitalize()} predictive", [multi_line]))
-            else:
-                all_steps = []
-                for x_s, y_s in zip(pp_xs, pp_densities):
-                    step = ax_i.step(x_s, y_s, **plot_kwargs)
-                    all_steps.append(step)
-                legend_it.append((f"{group.capitalize()} predictive", all_steps))
+            pp_x, pp_y = pp_densities[i]
+            multi_line = ax_i.multi_line(
+                *multi_line_data(pp_x, pp_y, steps=dtype == "i"), **plot_kwargs
+            )
+            legend_it.append((f"{group.capitalize()} predictive", [multi_line]))
 
             if observed:
                 label = "Observed"
@@ -177,18 +159,9 @@ def plot_ppc(
             if mean:
                 label = f"{group.capitalize()} predictive mean"
                 if dtype == "f":
-                    rep = len(pp_densities)
-                    len_density = len(pp_densities[0])
-
-                    new_x = np.linspace(np.min(pp_xs), np.max(pp_xs), len_density)
-                    new_d = np.zeros((rep, len_density))
-                    bins = np.digitize(pp_xs, new_x, right=True)
-                    new_x -= (new_x[1] - new_x[0]) / 2
-                    for irep in range(rep):
-                        new_d[irep][bins[irep]] = pp_densities[irep]
                     line = ax_i.line(
-                        new_x,
-                        new_d.mean(0),
+                        pp_x,
+                        pp_y.mean(0),
                         color=colors[2],
                         line_dash="dashed",
                         line_width=linewidth,
@@ -244,15 +217,8 @@ def plot_ppc(
                     )
                     ax_i.add_glyph(cds_rug, glyph)
 
-            pp_densities = np.empty((2 * len(pp_sampled_vals), pp_sampled_vals[0].size))
-            for idx, vals in enumerate(pp_sampled_vals):
-                vals = np.array([vals]).flatten()
-                pp_x, pp_density = _empirical_cdf(vals)
-                pp_densities[2 * idx] = pp_x
-                pp_densities[2 * idx + 1] = pp_density
             multi_line = ax_i.multi_line(
-                list(pp_densities[::2]),
-                list(pp_densities[1::2]),
+                *multi_line_data(*pp_densities[i]),
                 line_alpha=alpha,
                 line_color=colors[0],
                 line_width=linewidth,
@@ -6,8 +6,7 @@ from bokeh.models import Span
 from bokeh.models.annotations import Title
 from bokeh.models.tickers import FixedTicker
 
-from ....stats.density_utils import histogram
-from ...plot_utils import _scale_fig_size, compute_ranks
+from ...plot_utils import _scale_fig_size
 from .. import show_layout
 from . import backend_kwarg_defaults, create_axes_grid
 
@@ -19,7 +18,7 @@ def plot_rank(
     cols,
     figsize,
     plotters,
-    bins,
+    histograms,
     kind,
     colors,
     ref_line,
@@ -73,14 +72,9 @@ def plot_rank(
     else:
         axes = np.atleast_2d(axes)
 
-    for ax, (var_name, selection, isel, var_data) in zip(
-        (item for item in axes.flatten() if item is not None), plotters
+    for ax, (var_name, selection, isel, _), (bin_ary, all_counts) in zip(
+        (item for item in axes.flatten() if item is not None), plotters, histograms
     ):
-        ranks = compute_ranks(var_data)
-        bin_ary = np.histogram_bin_edges(ranks, bins=bins, range=(0, ranks.size))
-        all_counts = np.empty((len(ranks), len(bin_ary) - 1))
-        for idx, row in enumerate(ranks):
-            _, all_counts[idx], _ = histogram(row, bins=bin_ary)
         counts_normalizer = all_counts.max() / 0.95
         gap = 1
         width = bin_ary[1] - bin_ary[0]
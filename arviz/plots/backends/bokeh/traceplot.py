@@ -15,7 +15,7 @@ from ...distplot import plot_dist
 from ...plot_utils import _scale_fig_size
 from ...rankplot import plot_rank
 from .. import show_layout
-from . import backend_kwarg_defaults, dealiase_sel_kwargs
+from . import backend_kwarg_defaults, clear_glyphs, dealiase_sel_kwargs
 from ....sel_utils import xarray_var_iter
 
 
@@ -43,12 +43,19 @@ def plot_trace(
     rank_kwargs,
     plotters,
     divergence_data,
+    trace_data,
     axes,
     backend_kwargs,
     backend_config,
     show,
+    update=False,
 ):
-    """Bokeh traceplot."""
+    """Bokeh traceplot.
+
+    With ``update=True``, `axes` are the figures of a previous call with the same
+    arguments: only the draws not yet in their data sources are converted and streamed,
+    the trace lines are kept and the other glyphs are drawn again.
+    """
     # If divergences are plotted they must be provided
     if divergences is not False:
         assert divergence_data is not None
@@ -166,10 +173,31 @@ def plot_trace(
             axes.append(_axes)
 
     axes = np.atleast_2d(axes)
+    if update and axes.shape != (len(plotters), 2):
+        raise ValueError("The figures to update were not created with the same arguments")
+
+    n_chains = len(data.chain)
+    stream_sources = _named_sources(axes, "arviz_stream_") if update else {}
+    if len(stream_sources) != n_chains:
+        stream_sources = None
+    elif update:
+        n_plotted = len(next(iter(stream_sources[0].data.values())))
+        if n_plotted > data.sizes["draw"]:
+            raise ValueError("The figures to update contain more draws than the data")
+        # only the draws not plotted yet are converted and streamed
+        data = data.isel(draw=slice(n_plotted, None))
+    if update and kind == "trace" and trace_data is None and stream_sources is None:
+        raise ValueError("The figures to update were not created with the same arguments")
 
     cds_data = {}
     cds_var_groups = {}
     draw_name = "draw"
+    trace_cds_data = None
+    if trace_data is not None:
+        trace_cds_data = {}
+        trace_iter = zip(
+            *(xarray_var_iter(ds, var_names=var_names, combined=True) for ds in trace_data)
+        )
 
     for var_name, selection, isel, value in list(
         xarray_var_iter(data, var_names=var_names, combined=True)
@@ -200,13 +228,55 @@ def plot_trace(
             _data = value[chain_idx]
             cds_data[chain_idx][cds_name] = _data
 
+        if trace_cds_data is not None:
+            (*_, trace_values), (*_, trace_draws) = next(trace_iter)
+            for chain_idx, _ in enumerate(data.chain.values):
+                chain_trace = trace_cds_data.setdefault(chain_idx, {})
+                chain_trace[cds_name] = trace_values[chain_idx]
+                chain_trace[f"{cds_name}_ARVIZ_TRACE_DRAW"] = trace_draws[chain_idx]
+
     while any(key == draw_name for key in cds_data[0]):
         draw_name += "w"
 
     for chain in cds_data.values():
         chain[draw_name] = data.draw.values
 
-    cds_data = {chain_idx: ColumnDataSource(cds) for chain_idx, cds in cds_data.items()}
+    if stream_sources is not None:
+        for chain_idx, source in stream_sources.items():
+            if set(source.data) != set(cds_data[chain_idx]):
+                raise ValueError("The figures to update were not created with the same arguments")
+            if data.sizes["draw"]:
+                source.stream(cds_data[chain_idx])
+        cds_data = stream_sources
+    else:
+        cds_data = {
+            chain_idx: ColumnDataSource(
+                cds, tags=["arviz_stream"], name=f"arviz_stream_{chain_idx}"
+            )
+            for chain_idx, cds in cds_data.items()
+        }
+    # sources of the trace lines kept when updating
+    trace_sources = cds_data if update and kind == "trace" else {}
+    if trace_cds_data is not None:
+        trace_sources = _named_sources(axes, "arviz_trace_") if update else {}
+        if len(trace_sources) == n_chains:
+            for chain_idx, source in trace_sources.items():
+                source.data = trace_cds_data[chain_idx]
+            trace_cds_data = trace_sources
+        else:
+            # the trace is downsampled for the first time, its lines are drawn again
+            trace_sources = {}
+            trace_cds_data = {
+                chain_idx: ColumnDataSource(cds, name=f"arviz_trace_{chain_idx}")
+                for chain_idx, cds in trace_cds_data.items()
+            }
+
+    if update:
+        # the trace lines are kept, everything else is drawn again
+        clear_glyphs(axes[:, 0])
+        clear_glyphs(axes[:, 1], keep=trace_sources.values())
+        # reference lines are annotations, they are not cleared
+        lines = ()
 
     for idx, (var_name, selection, isel, value) in enumerate(plotters):
         value = np.atleast_2d(value)
@@ -247,6 +317,8 @@ def plot_trace(
                 fill_kwargs=fill_kwargs,
                 rug_kwargs=rug_kwargs,
                 rank_kwargs=rank_kwargs,
+                trace_data=trace_cds_data,
+                draw_trace=not trace_sources,
             )
         else:
             for y_name in cds_var_groups[var_name]:
@@ -269,9 +341,12 @@ def plot_trace(
                     fill_kwargs=fill_kwargs,
                     rug_kwargs=rug_kwargs,
                     rank_kwargs=rank_kwargs,
+                    trace_data=trace_cds_data,
+                    draw_trace=not trace_sources,
                 )
 
-        for col in (0, 1):
+        # updated figures keep their titles and the ranges zoomed by the user
+        for col in () if update else (0, 1):
             _title = Title()
             _title.text = labeller.make_label_vert(var_name, selection, isel)
             axes[idx, col].title = _title
@@ -372,23 +447,27 @@ def _plot_chains_bokeh(
     fill_kwargs,
     rug_kwargs,
     rank_kwargs,
+    trace_data=None,
+    draw_trace=True,
 ):
     marker = trace_kwargs.pop("marker", True)
+    trace_x_name = x_name if trace_data is None else f"{y_name}_ARVIZ_TRACE_DRAW"
     for chain_idx, cds in data.items():
-        if kind == "trace":
+        if kind == "trace" and draw_trace:
+            trace_cds = cds if trace_data is None else trace_data[chain_idx]
             if legend:
                 trace_kwargs["legend_label"] = f"chain {chain_idx}"
             ax_trace.line(
-                x=x_name,
+                x=trace_x_name,
                 y=y_name,
-                source=cds,
+                source=trace_cds,
                 **dealiase_sel_kwargs(trace_kwargs, chain_prop, chain_idx),
             )
             if marker:
                 ax_trace.circle(
-                    x=x_name,
+                    x=trace_x_name,
                     y=y_name,
-                    source=cds,
+                    source=trace_cds,
                     radius=0.30,
                     alpha=0.5,
                     **dealiase_sel_kwargs({}, chain_prop, chain_idx),
@@ -433,3 +512,14 @@ def _plot_chains_bokeh(
             backend_kwargs={},
             show=False,
         )
+
+
+def _named_sources(axes, prefix):
+    """Get the data sources of the glyphs in `axes` named ``{prefix}{chain index}``."""
+    sources = {}
+    for fig in axes.ravel():
+        for renderer in fig.renderers:
+            name = getattr(getattr(renderer, "data_source", None), "name", None)
+            if name is not None and name.startswith(prefix):
+                sources[int(name[len(prefix) :])] = renderer.data_source
+    return sources
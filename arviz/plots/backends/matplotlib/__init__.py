@@ -1,12 +1,16 @@
 # pylint: disable=wrong-import-position
 """Matplotlib Plotting Backend."""
 import matplotlib as mpl
+import numpy as np
 
 from matplotlib.cbook import normalize_kwargs
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.pyplot import subplots
-from numpy import ndenumerate
 
 from ....rcparams import rcParams
+from ...plot_utils import steps_pre
 
 
 def backend_kwarg_defaults(*args, **kwargs):
@@ -55,7 +59,7 @@ def create_axes_grid(length_plotters, rows=1, cols=1, backend_kwargs=None):
     fig, axes = subplots(rows, cols, **backend_kwargs)
     extra = (rows * cols) - length_plotters
     if extra > 0:
-        for (row, col), ax in ndenumerate(axes):
+        for (row, col), ax in np.ndenumerate(axes):
             if (row * cols + col + 1) > length_plotters:
                 ax.set_axis_off()
     return fig, axes
@@ -76,6 +80,7 @@ def matplotlib_kwarg_dealiaser(args, kind):
         "text": mpl.text.Text,
         "contour": mpl.contour.ContourSet,
         "pcolormesh": mpl.collections.QuadMesh,
+        "imshow": mpl.image.AxesImage,
     }
     return normalize_kwargs(args, getattr(matplotlib_kwarg_dealiaser_dict[kind], "_alias_map", {}))
 
@@ -101,6 +106,100 @@ def dealiase_sel_kwargs(kwargs, prop_dict, idx):
     }
 
 
+def add_lines(ax, x, y, drawstyle="default", **kwargs):
+    """Draw many lines as a single :class:`~matplotlib.collections.LineCollection`.
+
+    Parameters
+    ----------
+    ax : matplotlib axes
+    x, y : array_like
+        Coordinates of the lines, broadcast against each other. The last dimension
+        contains the points of each line and the other ones index the lines.
+    drawstyle : {"default", "steps-pre"}, optional
+    **kwargs
+        Passed to the collection. If they contain properties only available on
+        :class:`~matplotlib.lines.Line2D` like markers, lines without line width or
+        style are drawn as a single marker only line and the rest one line at a time.
+
+    Returns
+    -------
+    matplotlib.collections.LineCollection or list of matplotlib.lines.Line2D
+    """
+    if drawstyle == "steps-pre":
+        x, y = steps_pre(x, y)
+    x, y = np.broadcast_arrays(x, y)
+    x = x.reshape(-1, x.shape[-1])
+    y = y.reshape(-1, y.shape[-1])
+    try:
+        collection = LineCollection(np.stack((x, y), axis=-1), **kwargs)
+    except AttributeError:
+        if kwargs.get("linewidth") == 0 or kwargs.get("linestyle") in ("", " ", "None", "none"):
+            return ax.plot(x.ravel(), y.ravel(), **kwargs)
+        return [line for x_i, y_i in zip(x, y) for line in ax.plot(x_i, y_i, **kwargs)]
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def add_segments(ax, x_start, x_end, y_start, y_end, **kwargs):
+    """Draw the segments between the broadcast start and end points as a single collection.
+
+    Parameters
+    ----------
+    ax : matplotlib axes
+    x_start, x_end, y_start, y_end : array_like
+        Coordinates of the start and end points of every segment.
+    **kwargs
+        Passed to :class:`~matplotlib.collections.LineCollection`, properties like
+        ``linewidths`` or ``colors`` can be sequences with one element per segment.
+
+    Returns
+    -------
+    matplotlib.collections.LineCollection
+    """
+    points = np.broadcast_arrays(x_start, y_start, x_end, y_end)
+    collection = LineCollection(np.stack(points, axis=-1).reshape(-1, 2, 2), **kwargs)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def _count_points(artist):
+    """Count the points drawn by a line or collection."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    return max(len(artist.get_offsets()), sum(len(path.vertices) for path in artist.get_paths()))
+
+
+def rasterize_dense_artists(axes, threshold=None):
+    """Rasterize the lines and collections with more than ``threshold`` points.
+
+    Only the dense artists are rasterized when saving to vector formats like pdf or svg,
+    axes, ticks and text are kept as vectors.
+
+    Parameters
+    ----------
+    axes : matplotlib axes or (nested) sequence of them
+        Objects that are not matplotlib axes are ignored.
+    threshold : int, optional
+        Defaults to the rcParam ``plot.matplotlib.rasterize_threshold``. If None,
+        nothing is rasterized.
+    """
+    if threshold is None:
+        threshold = rcParams["plot.matplotlib.rasterize_threshold"]
+    if threshold is None:
+        return
+    if isinstance(axes, (np.ndarray, list, tuple)):
+        for item in axes:
+            rasterize_dense_artists(item, threshold)
+    elif isinstance(axes, Axes):
+        for artist in (*axes.lines, *axes.collections):
+            # artists like contour sets ignore rasterization and warn about it
+            supported = getattr(artist.draw, "_supports_rasterization", False)
+            if supported and _count_points(artist) > threshold:
+                artist.set_rasterized(True)
+
+
 from .autocorrplot import plot_autocorr
 from .bpvplot import plot_bpv
 from .compareplot import plot_compare
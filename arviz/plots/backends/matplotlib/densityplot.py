@@ -7,7 +7,7 @@ import numpy as np
 
 from ....stats import hdi
 from ....stats.density_utils import get_bins, kde
-from ...plot_utils import _scale_fig_size, calculate_point_estimate
+from ...plot_utils import _scale_fig_size, calculate_point_estimate, hdi_metric_names
 from . import backend_kwarg_defaults, backend_show, create_axes_grid
 
 
@@ -15,6 +15,7 @@ def plot_density(
     ax,
     all_labels,
     to_plot,
+    plotter_stats,
     colors,
     bw,
     circular,
@@ -70,7 +71,7 @@ def plot_density(
     axis_map = dict(zip(all_labels, np.ravel(ax)))
 
     for m_idx, plotters in enumerate(to_plot):
-        for var_name, selection, isel, values in plotters:
+        for (var_name, selection, isel, values), stats in zip(plotters, plotter_stats[m_idx]):
             label = labeller.make_label_vert(var_name, selection, isel)
             _d_helper(
                 values.flatten(),
@@ -88,6 +89,7 @@ def plot_density(
                 outline,
                 shade,
                 axis_map[label],
+                stats,
             )
 
     if n_data > 1:
@@ -117,6 +119,7 @@ def _d_helper(
     outline,
     shade,
     ax,
+    stats,
 ):
     """Plot an individual dimension.
 
@@ -150,10 +153,13 @@ def _d_helper(
         Alpha blending value for the shaded area under the curve, between 0 (no shade) and 1
         (opaque). Defaults to 0.
     ax : matplotlib axes
+    stats : dict
+        Precomputed statistics of `vec`, used for the HDI and point estimate if available.
     """
+    hdi_stats = [stats.get(name) for name in hdi_metric_names(hdi_prob)]
     if vec.dtype.kind == "f":
         if hdi_prob != 1:
-            hdi_ = hdi(vec, hdi_prob, multimodal=False)
+            hdi_ = hdi(vec, hdi_prob, multimodal=False) if None in hdi_stats else hdi_stats
             new_vec = vec[(vec >= hdi_[0]) & (vec <= hdi_[1])]
         else:
             new_vec = vec
@@ -172,7 +178,7 @@ def _d_helper(
             ax.fill_between(x, density, color=color, alpha=shade)
 
     else:
-        xmin, xmax = hdi(vec, hdi_prob, multimodal=False)
+        xmin, xmax = hdi(vec, hdi_prob, multimodal=False) if None in hdi_stats else hdi_stats
         bins = get_bins(vec)
         if outline:
             ax.hist(vec, bins=bins, color=color, histtype="step", align="left")
@@ -184,7 +190,9 @@ def _d_helper(
         ax.plot(xmax, 0, hdi_markers, color=color, markeredgecolor="k", markersize=markersize)
 
     if point_estimate is not None:
-        est = calculate_point_estimate(point_estimate, vec, bw)
+        est = stats.get(point_estimate)
+        if est is None:
+            est = calculate_point_estimate(point_estimate, vec, bw)
         ax.plot(est, 0, "o", color=color, markeredgecolor="k", markersize=markersize)
 
     ax.set_yticks([])
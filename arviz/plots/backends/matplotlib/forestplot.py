@@ -12,8 +12,8 @@ from ....stats import hdi
 from ....stats.density_utils import get_bins, histogram, kde
 from ....stats.diagnostics import _ess, _rhat
 from ....sel_utils import xarray_var_iter
-from ...plot_utils import _scale_fig_size
-from . import backend_kwarg_defaults, backend_show
+from ...plot_utils import _scale_fig_size, hdi_metric_names, summary_lookup
+from . import add_segments, backend_kwarg_defaults, backend_show
 
 
 def pairwise(iterable):
@@ -50,6 +50,7 @@ def plot_forest(
     labeller,
     ess,
     r_hat,
+    stats,
     backend_kwargs,
     backend_config,  # pylint: disable=unused-argument
     show,
@@ -63,6 +64,7 @@ def plot_forest(
         combine_dims=combine_dims,
         colors=colors,
         labeller=labeller,
+        stats=stats,
     )
 
     if figsize is None:
@@ -176,7 +178,9 @@ class PlotHandler:
 
     # pylint: disable=inconsistent-return-statements
 
-    def __init__(self, datasets, var_names, model_names, combined, combine_dims, colors, labeller):
+    def __init__(
+        self, datasets, var_names, model_names, combined, combine_dims, colors, labeller, stats=None
+    ):
         self.data = datasets
 
         if model_names is None:
@@ -212,6 +216,11 @@ class PlotHandler:
 
         self.colors = list(reversed(colors))  # y-values are upside down
         self.labeller = labeller
+        if stats is None:
+            stats = [None for _ in self.data]
+        elif len(stats) != len(self.data):
+            raise ValueError("The number of stats does not match the number of models")
+        self.stats = dict(zip(self.model_names, map(summary_lookup, stats)))
 
         self.plotters = self.make_plotters()
 
@@ -228,6 +237,7 @@ class PlotHandler:
                 combine_dims=self.combine_dims,
                 colors=self.colors,
                 labeller=self.labeller,
+                stats=self.stats,
             )
             y = plotters[var_name].y_max()
         return plotters
@@ -407,6 +417,8 @@ class PlotHandler:
         else:
             qlist = [endpoint, 50, 100 - endpoint]
 
+        intervals = []
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, selection, values, color in plotter.treeplot(qlist, hdi_prob):
                 if isinstance(rope, dict):
@@ -417,15 +429,19 @@ class PlotHandler:
                     np.linspace(2 * linewidth, linewidth, mid, endpoint=True)[-1::-1], range(mid)
                 )
                 for width, j in param_iter:
-                    ax.hlines(y, values[j], values[-(j + 1)], linewidth=width, color=color)
-                ax.plot(
-                    values[mid],
-                    y,
-                    "o",
-                    mfc=ax.get_facecolor(),
-                    markersize=markersize * 0.75,
-                    color=color,
-                )
+                    intervals.append((values[j], values[-(j + 1)], y, width, color))
+                markers[color].append((values[mid], y))
+        if intervals:
+            x_start, x_end, y_vals, widths, colors = zip(*intervals)
+            add_segments(ax, x_start, x_end, y_vals, y_vals, linewidths=widths, colors=colors)
+        for color, points in markers.items():
+            ax.plot(
+                *zip(*points),
+                "o",
+                mfc=ax.get_facecolor(),
+                markersize=markersize * 0.75,
+                color=color,
+            )
         ax.tick_params(labelsize=xt_labelsize)
         ax.set_title(f"{hdi_prob:.1%} HDI", fontsize=titlesize, wrap=True)
         if rope is None or isinstance(rope, dict):
@@ -442,18 +458,20 @@ class PlotHandler:
 
     def plot_neff(self, ax, xt_labelsize, titlesize, markersize):
         """Draw effective n for each plotter."""
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, ess, color in plotter.ess():
                 if ess is not None:
-                    ax.plot(
-                        ess,
-                        y,
-                        "o",
-                        color=color,
-                        clip_on=False,
-                        markersize=markersize,
-                        markeredgecolor="k",
-                    )
+                    markers[color].append((ess, y))
+        for color, points in markers.items():
+            ax.plot(
+                *zip(*points),
+                "o",
+                color=color,
+                clip_on=False,
+                markersize=markersize,
+                markeredgecolor="k",
+            )
         ax.set_xlim(left=0)
         ax.set_title("ess", fontsize=titlesize, wrap=True)
         ax.tick_params(labelsize=xt_labelsize)
@@ -461,10 +479,13 @@ class PlotHandler:
 
     def plot_rhat(self, ax, xt_labelsize, titlesize, markersize):
         """Draw r-hat for each plotter."""
+        markers = defaultdict(list)
         for plotter in self.plotters.values():
             for y, r_hat, color in plotter.r_hat():
                 if r_hat is not None:
-                    ax.plot(r_hat, y, "o", color=color, markersize=markersize, markeredgecolor="k")
+                    markers[color].append((r_hat, y))
+        for color, points in markers.items():
+            ax.plot(*zip(*points), "o", color=color, markersize=markersize, markeredgecolor="k")
         ax.set_xlim(left=0.9, right=2.1)
         ax.set_xticks([1, 2])
         ax.tick_params(labelsize=xt_labelsize)
@@ -513,7 +534,16 @@ class VarHandler:
     """Handle individual variable logic."""
 
     def __init__(
-        self, var_name, data, y_start, model_names, combined, combine_dims, colors, labeller
+        self,
+        var_name,
+        data,
+        y_start,
+        model_names,
+        combined,
+        combine_dims,
+        colors,
+        labeller,
+        stats=None,
     ):
         self.var_name = var_name
         self.data = data
@@ -528,9 +558,17 @@ class VarHandler:
         self.chain_offset = len(data) * 0.45 / max(1, max_chains)
         self.var_offset = 1.5 * self.chain_offset
         self.group_offset = 2 * self.var_offset
+        # statistics precomputed over all chains only apply to combined rows
+        self.stats = stats if combined and not combine_dims and stats is not None else {}
+        self._rows = None
 
     def iterator(self):
         """Iterate over models and chains for each variable."""
+        if self._rows is None:
+            self._rows = list(self._iterate_rows())
+        return iter(self._rows)
+
+    def _iterate_rows(self):
         if self.combined:
             grouped_data = [[(0, datum)] for datum in self.data]
             skip_dims = self.combine_dims.union({"chain"})
@@ -567,9 +605,9 @@ class VarHandler:
             for model_name, value_list in model_data.items():
                 row_label = self.labeller.make_model_label(model_name, label)
                 for values in value_list:
-                    yield y, row_label, label, selection_list[idx], values, self.model_color[
-                        model_name
-                    ]
+                    yield y, row_label, model_name, label, selection_list[
+                        idx
+                    ], values, self.model_color[model_name]
                     y += self.chain_offset
                 y += self.var_offset
             y += self.group_offset
@@ -577,7 +615,7 @@ class VarHandler:
     def labels_ticks_and_vals(self):
         """Get labels, ticks, values, and colors for the variable."""
         y_ticks = defaultdict(list)
-        for y, label, _, _, vals, color in self.iterator():
+        for y, label, _, _, _, vals, color in self.iterator():
             y_ticks[label].append((y, vals, color))
         labels, ticks, vals, colors = [], [], [], []
         for label, all_data in y_ticks.items():
@@ -588,24 +626,40 @@ class VarHandler:
                 colors.append(data[2])  # the colors are all the same
         return labels, ticks, vals, colors
 
+    def summary_stat(self, model_name, selection, metric):
+        """Get a precomputed statistic of the variable, None if it is not available."""
+        if model_name not in self.stats:
+            return None
+        return self.stats[model_name](self.var_name, selection).get(metric)
+
     def treeplot(self, qlist, hdi_prob):
         """Get data for each treeplot for the variable."""
-        for y, _, _, selection, values, color in self.iterator():
-            ntiles = np.percentile(values.flatten(), qlist)
-            ntiles[0], ntiles[-1] = hdi(values.flatten(), hdi_prob, multimodal=False)
+        hdi_names = hdi_metric_names(hdi_prob)
+        for y, _, model_name, _, selection, values, color in self.iterator():
+            hdi_ = [self.summary_stat(model_name, selection, name) for name in hdi_names]
+            if None in hdi_:
+                ntiles = np.percentile(values.flatten(), qlist)
+                ntiles[0], ntiles[-1] = hdi(values.flatten(), hdi_prob, multimodal=False)
+            else:
+                ntiles = np.concatenate(
+                    ([hdi_[0]], np.percentile(values.flatten(), qlist[1:-1]), [hdi_[1]])
+                )
             yield y, selection, ntiles, color
 
     def ridgeplot(self, hdi_prob, mult, ridgeplot_kind):
         """Get data for each ridgeplot for the variable."""
         xvals, hdi_vals, yvals, pdfs, pdfs_q, colors = [], [], [], [], [], []
-        for y, *_, values, color in self.iterator():
+        hdi_names = hdi_metric_names(hdi_prob)
+        for y, _, model_name, _, selection, values, color in self.iterator():
             yvals.append(y)
             colors.append(color)
             values = values.flatten()
             values = values[np.isfinite(values)]
 
             if hdi_prob != 1:
-                hdi_ = hdi(values, hdi_prob, multimodal=False)
+                hdi_ = [self.summary_stat(model_name, selection, name) for name in hdi_names]
+                if None in hdi_:
+                    hdi_ = hdi(values, hdi_prob, multimodal=False)
             else:
                 hdi_ = min(values), max(values)
 
@@ -5,7 +5,13 @@ import numpy as np
 
 from ...plot_utils import _scale_fig_size
 from ...hdiplot import plot_hdi
-from . import create_axes_grid, matplotlib_kwarg_dealiaser, backend_show, backend_kwarg_defaults
+from . import (
+    add_lines,
+    backend_kwarg_defaults,
+    backend_show,
+    create_axes_grid,
+    matplotlib_kwarg_dealiaser,
+)
 
 
 def plot_lm(
@@ -96,16 +102,20 @@ def plot_lm(
         if y_hat is not None:
             _, _, _, y_hat_plotters = y_hat[i]
             if kind_pp == "samples":
-                for j in range(num_samples):
-                    if xjitter is True:
-                        jitter_scale = x_plotters[1] - x_plotters[0]
-                        scale_high = jitter_scale * 0.2
-                        x_plotters_jitter = x_plotters + np.random.uniform(
-                            low=-scale_high, high=scale_high, size=len(x_plotters)
-                        )
-                        ax_i.plot(x_plotters_jitter, y_hat_plotters[..., j], **y_hat_plot_kwargs)
-                    else:
-                        ax_i.plot(x_plotters, y_hat_plotters[..., j], **y_hat_plot_kwargs)
+                if xjitter is True:
+                    jitter_scale = x_plotters[1] - x_plotters[0]
+                    scale_high = jitter_scale * 0.2
+                    x_plotters_jitter = x_plotters + np.random.uniform(
+                        low=-scale_high, high=scale_high, size=(num_samples, len(x_plotters))
+                    )
+                else:
+                    x_plotters_jitter = x_plotters
+                add_lines(
+                    ax_i,
+                    x_plotters_jitter,
+                    np.moveaxis(y_hat_plotters[..., :num_samples], -1, 0),
+                    **y_hat_plot_kwargs,
+                )
                 ax_i.plot([], **y_hat_plot_kwargs, label="Posterior predictive samples")
             else:
                 plot_hdi(x_plotters, y_hat_plotters, ax=ax_i, **y_hat_fill_kwargs)
@@ -116,8 +126,12 @@ def plot_lm(
         if y_model is not None:
             _, _, _, y_model_plotters = y_model[i]
             if kind_model == "lines":
-                for j in range(num_samples):
-                    ax_i.plot(x_plotters, y_model_plotters[..., j], **y_model_plot_kwargs)
+                add_lines(
+                    ax_i,
+                    x_plotters,
+                    np.moveaxis(y_model_plotters[..., :num_samples], -1, 0),
+                    **y_model_plot_kwargs,
+                )
                 ax_i.plot([], **y_model_plot_kwargs, label="Uncertainty in mean")
 
                 y_model_mean = np.mean(y_model_plotters, axis=1)
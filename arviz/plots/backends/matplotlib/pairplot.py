@@ -10,7 +10,11 @@ from mpl_toolkits.axes_grid1 import make_axes_locatable
 from ....rcparams import rcParams
 from ...distplot import plot_dist
 from ...kdeplot import plot_kde
-from ...plot_utils import _scale_fig_size, calculate_point_estimate, _init_kwargs_dict
+from ...plot_utils import (
+    _scale_fig_size,
+    calculate_point_estimate,
+    _init_kwargs_dict,
+)
 from . import backend_kwarg_defaults, backend_show, matplotlib_kwarg_dealiaser
 
 
@@ -24,6 +28,8 @@ def plot_pair(
     scatter_kwargs,
     kde_kwargs,
     hexbin_kwargs,
+    density_kwargs,
+    density_data,
     gridsize,
     colorbar,
     divergences,
@@ -59,6 +65,11 @@ def plot_pair(
     hexbin_kwargs = matplotlib_kwarg_dealiaser(hexbin_kwargs, "hexbin")
     hexbin_kwargs.setdefault("mincnt", 1)
 
+    density_kwargs = matplotlib_kwarg_dealiaser(density_kwargs, "imshow")
+    density_kwargs.setdefault("origin", "lower")
+    density_kwargs.setdefault("aspect", "auto")
+    density_kwargs.setdefault("interpolation", "nearest")
+
     divergences_kwargs = matplotlib_kwarg_dealiaser(divergences_kwargs, "plot")
     divergences_kwargs.setdefault("marker", "o")
     divergences_kwargs.setdefault("markeredgecolor", "k")
@@ -185,8 +196,10 @@ def plot_pair(
                 **hexbin_kwargs,
             )
             ax.grid(False)
+        if "density" in kind:
+            hexbin = _plot_density(ax, density_data, 0, 1, density_kwargs)
 
-        if kind == "hexbin" and colorbar:
+        if kind in ("hexbin", "density") and colorbar:
             cbar = ax.figure.colorbar(hexbin, ticks=[hexbin.norm.vmin, hexbin.norm.vmax], ax=ax)
             cbar.ax.set_yticklabels(["low", "high"], fontsize=ax_labelsize)
 
@@ -303,12 +316,21 @@ def plot_pair(
                         ax[j, i].grid(False)
                         hexbin = ax[j, i].hexbin(var1, var2, gridsize=gridsize, **hexbin_kwargs)
 
+                    if "density" in kind:
+                        hexbin = _plot_density(
+                            ax[j, i],
+                            density_data,
+                            i,
+                            j + not_marginals,
+                            density_kwargs,
+                        )
+
                     if divergences:
                         ax[j, i].plot(
                             var1[diverging_mask], var2[diverging_mask], **divergences_kwargs
                         )
 
-                    if kind == "hexbin" and colorbar:
+                    if kind in ("hexbin", "density") and colorbar:
                         hexbin_values.append(hexbin.norm.vmin)
                         hexbin_values.append(hexbin.norm.vmax)
                         divider = make_axes_locatable(ax[-1, -1])
@@ -361,3 +383,16 @@ def plot_pair(
     if marginals and numvars == 2:
         return ax_return
     return ax
+
+
+def _plot_density(ax, density_data, x_idx, y_idx, density_kwargs):
+    """Draw the 2D histogram of two binned variables as an image, leaving empty cells blank."""
+    edges, pair_counts = density_data
+    x_edges, y_edges = edges[x_idx], edges[y_idx]
+    counts = pair_counts[x_idx, y_idx]
+    ax.grid(False)
+    return ax.imshow(
+        np.ma.masked_equal(counts.T, 0),
+        extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+        **density_kwargs,
+    )
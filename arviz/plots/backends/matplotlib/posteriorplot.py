@@ -12,6 +12,7 @@ from ...plot_utils import (
     _scale_fig_size,
     calculate_point_estimate,
     format_sig_figs,
+    hdi_metric_names,
     round_num,
     vectorized_to_hex,
 )
@@ -25,6 +26,7 @@ def plot_posterior(
     cols,
     figsize,
     plotters,
+    plotter_stats,
     bw,
     circular,
     bins,
@@ -73,7 +75,7 @@ def plot_posterior(
             backend_kwargs=backend_kwargs,
         )
     idx = 0
-    for (var_name, selection, isel, x), ax_ in zip(plotters, np.ravel(ax)):
+    for (var_name, selection, isel, x), stats, ax_ in zip(plotters, plotter_stats, np.ravel(ax)):
         _plot_posterior_op(
             idx,
             x.flatten(),
@@ -86,6 +88,7 @@ def plot_posterior(
             kind=kind,
             point_estimate=point_estimate,
             round_to=round_to,
+            stats=stats,
             hdi_prob=hdi_prob,
             multimodal=multimodal,
             skipna=skipna,
@@ -130,9 +133,12 @@ def _plot_posterior_op(
     ax_labelsize,
     xt_labelsize,
     round_to=None,
+    stats=None,
     **kwargs,
 ):  # noqa: D202
     """Artist to draw posterior."""
+    if stats is None:
+        stats = {}
 
     def format_as_percent(x, round_to=0):
         return "{0:.{1:d}f}%".format(100 * x, round_to)
@@ -246,7 +252,9 @@ def _plot_posterior_op(
     def display_point_estimate():
         if not point_estimate:
             return
-        point_value = calculate_point_estimate(point_estimate, values, bw, circular, skipna)
+        point_value = stats.get(point_estimate)
+        if point_value is None:
+            point_value = calculate_point_estimate(point_estimate, values, bw, circular, skipna)
         sig_figs = format_sig_figs(point_value, round_to)
         point_text = "{point_estimate}={point_value:.{sig_figs}g}".format(
             point_estimate=point_estimate, point_value=point_value, sig_figs=sig_figs
@@ -262,9 +270,11 @@ def _plot_posterior_op(
     def display_hdi():
         # np.ndarray with 2 entries, min and max
         # pylint: disable=line-too-long
-        hdi_probs = hdi(
-            values, hdi_prob=hdi_prob, circular=circular, multimodal=multimodal, skipna=skipna
-        )  # type: np.ndarray
+        hdi_probs = [stats.get(name) for name in hdi_metric_names(hdi_prob)]
+        if multimodal or None in hdi_probs:
+            hdi_probs = hdi(
+                values, hdi_prob=hdi_prob, circular=circular, multimodal=multimodal, skipna=skipna
+            )  # type: np.ndarray
 
         for hdi_i in np.atleast_2d(hdi_probs):
             ax.plot(
@@ -7,10 +7,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import animation, get_backend
 
-from ....stats.density_utils import get_bins, histogram, kde
+from ....stats.density_utils import get_bins, histogram
 from ...kdeplot import plot_kde
 from ...plot_utils import _scale_fig_size
-from . import backend_kwarg_defaults, backend_show, create_axes_grid
+from . import add_lines, backend_kwarg_defaults, backend_show, create_axes_grid
 
 _log = logging.getLogger(__name__)
 
@@ -26,6 +26,7 @@ def plot_ppc(
     pp_plotters,
     predictive_dataset,
     pp_sample_ix,
+    pp_densities,
     kind,
     alpha,
     colors,
@@ -158,48 +159,25 @@ def plot_ppc(
                         drawstyle=plot_kwargs["drawstyle"],
                     )
 
-            pp_densities = []
-            pp_xs = []
-            for vals in pp_sampled_vals:
-                vals = np.array([vals]).flatten()
-                if dtype == "f":
-                    pp_x, pp_density = kde(vals)
-                    pp_densities.append(pp_density)
-                    pp_xs.append(pp_x)
-                else:
-                    bins = get_bins(vals)
-                    _, hist, bin_edges = histogram(vals, bins=bins)
-                    hist = np.concatenate((hist[:1], hist))
-                    pp_densities.append(hist)
-                    pp_xs.append(bin_edges)
-
+            pp_x, pp_y = pp_densities[i]
             if animated:
                 animate, init = _set_animation(
-                    pp_sampled_vals, ax_i, dtype=dtype, kind=kind, plot_kwargs=plot_kwargs
+                    pp_sampled_vals,
+                    ax_i,
+                    kind=kind,
+                    plot_kwargs=plot_kwargs,
+                    pp_densities=pp_densities[i],
                 )
 
             else:
-                if dtype == "f":
-                    ax_i.plot(np.transpose(pp_xs), np.transpose(pp_densities), **plot_kwargs)
-                else:
-                    for x_s, y_s in zip(pp_xs, pp_densities):
-                        ax_i.plot(x_s, y_s, **plot_kwargs)
+                add_lines(ax_i, pp_x, pp_y, **plot_kwargs)
 
             if mean:
                 label = f"{group.capitalize()} predictive mean"
                 if dtype == "f":
-                    rep = len(pp_densities)
-                    len_density = len(pp_densities[0])
-
-                    new_x = np.linspace(np.min(pp_xs), np.max(pp_xs), len_density)
-                    new_d = np.zeros((rep, len_density))
-                    bins = np.digitize(pp_xs, new_x, right=True)
-                    new_x -= (new_x[1] - new_x[0]) / 2
-                    for irep in range(rep):
-                        new_d[irep][bins[irep]] = pp_densities[irep]
                     ax_i.plot(
-                        new_x,
-                        new_d.mean(0),
+                        pp_x,
+                        pp_y.mean(0),
                         color=colors[2],
                         linestyle="--",
                         linewidth=linewidth * 1.5,
@@ -251,18 +229,13 @@ def plot_ppc(
                     alpha=alpha,
                     drawstyle=drawstyle,
                     linewidth=linewidth,
+                    pp_densities=pp_densities[i],
                 )
 
             else:
-                pp_densities = np.empty((2 * len(pp_sampled_vals), pp_sampled_vals[0].size))
-                for idx, vals in enumerate(pp_sampled_vals):
-                    vals = np.array([vals]).flatten()
-                    pp_x, pp_density = _empirical_cdf(vals)
-                    pp_densities[2 * idx] = pp_x
-                    pp_densities[2 * idx + 1] = pp_density
-
-                ax_i.plot(
-                    *pp_densities,
+                add_lines(
+                    ax_i,
+                    *pp_densities[i],
                     alpha=alpha,
                     color=colors[0],
                     drawstyle=drawstyle,
@@ -388,7 +361,6 @@ def plot_ppc(
 def _set_animation(
     pp_sampled_vals,
     ax,
-    dtype=None,
     kind="density",
     alpha=None,
     color=None,
@@ -397,48 +369,25 @@ def _set_animation(
     height=None,
     markersize=None,
     plot_kwargs=None,
+    pp_densities=None,
 ):
     if kind == "kde":
-        length = len(pp_sampled_vals)
-        if dtype == "f":
-            x_vals, y_vals = kde(pp_sampled_vals[0])
-            max_max = max(max(kde(pp_sampled_vals[i])[1]) for i in range(length))
-            ax.set_ylim(0, max_max)
-            (line,) = ax.plot(x_vals, y_vals, **plot_kwargs)
-
-            def animate(i):
-                x_vals, y_vals = kde(pp_sampled_vals[i])
-                line.set_data(x_vals, y_vals)
-                return (line,)
-
-        else:
-            vals = pp_sampled_vals[0]
-            bins = get_bins(vals)
-            _, y_vals, x_vals = histogram(vals, bins=bins)
-            (line,) = ax.plot(x_vals[:-1], y_vals, **plot_kwargs)
-
-            max_max = max(
-                max(histogram(pp_sampled_vals[i], bins=get_bins(pp_sampled_vals[i]))[1])
-                for i in range(length)
-            )
-
-            ax.set_ylim(0, max_max)
+        x_vals, y_vals = pp_densities
+        ax.set_ylim(0, np.nanmax(y_vals))
+        (line,) = ax.plot(x_vals, y_vals[0], **plot_kwargs)
 
-            def animate(i):
-                pp_vals = pp_sampled_vals[i]
-                _, y_vals, x_vals = histogram(pp_vals, bins=get_bins(pp_vals))
-                line.set_data(x_vals[:-1], y_vals)
-                return (line,)
+        def animate(i):
+            line.set_data(x_vals, y_vals[i])
+            return (line,)
 
     elif kind == "cumulative":
-        x_vals, y_vals = _empirical_cdf(pp_sampled_vals[0])
+        x_vals, y_vals = pp_densities
         (line,) = ax.plot(
-            x_vals, y_vals, alpha=alpha, color=color, drawstyle=drawstyle, linewidth=linewidth
+            x_vals[0], y_vals, alpha=alpha, color=color, drawstyle=drawstyle, linewidth=linewidth
         )
 
         def animate(i):
-            x_vals, y_vals = _empirical_cdf(pp_sampled_vals[i])
-            line.set_data(x_vals, y_vals)
+            line.set_data(x_vals[i], y_vals)
             return (line,)
 
     elif kind == "scatter":
@@ -3,8 +3,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-from ....stats.density_utils import histogram
-from ...plot_utils import _scale_fig_size, compute_ranks
+from ...plot_utils import _scale_fig_size
 from . import backend_kwarg_defaults, backend_show, create_axes_grid
 
 
@@ -15,7 +14,7 @@ def plot_rank(
     cols,
     figsize,
     plotters,
-    bins,
+    histograms,
     kind,
     colors,
     ref_line,
@@ -66,13 +65,10 @@ def plot_rank(
             backend_kwargs=backend_kwargs,
         )
 
-    for ax, (var_name, selection, isel, var_data) in zip(np.ravel(axes), plotters):
-        ranks = compute_ranks(var_data)
-        bin_ary = np.histogram_bin_edges(ranks, bins=bins, range=(0, ranks.size))
-        all_counts = np.empty((len(ranks), len(bin_ary) - 1))
-        for idx, row in enumerate(ranks):
-            _, all_counts[idx], _ = histogram(row, bins=bin_ary)
-        gap = 2 / ranks.size
+    for ax, (var_name, selection, isel, var_data), (bin_ary, all_counts) in zip(
+        np.ravel(axes), plotters, histograms
+    ):
+        gap = 2 / var_data.size
         width = bin_ary[1] - bin_ary[0]
 
         bar_kwargs.setdefault("width", width)
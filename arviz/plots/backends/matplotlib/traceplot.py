@@ -40,6 +40,7 @@ def plot_trace(
     rank_kwargs,
     plotters,
     divergence_data,
+    trace_data,
     axes,
     backend_kwargs,
     backend_config,  # pylint: disable=unused-argument
@@ -90,6 +91,9 @@ def plot_trace(
         Extra keyword arguments passed to `plt.plot`
     rank_kwargs : dict
         Extra keyword arguments passed to `arviz.plot_rank`
+    trace_data : tuple of (xarray.Dataset, xarray.Dataset), optional
+        Downsampled values and their draws to use for the trace lines instead of `data`.
+
     Returns
     -------
     axes : matplotlib axes
@@ -241,6 +245,12 @@ def plot_trace(
             else:
                 ax = axes[idx, idy]
 
+            trace = None
+            if trace_data is not None and idy:
+                trace = tuple(
+                    np.atleast_2d(ds[var_name].isel(**isel).values) for ds in reversed(trace_data)
+                )
+
             if len(value.shape) == 2:
                 if compact_prop:
                     aux_plot_kwargs = dealiase_sel_kwargs(plot_kwargs, compact_prop, 0)
@@ -268,6 +278,7 @@ def plot_trace(
                     circular,
                     circ_var_units,
                     circ_units_trace,
+                    trace,
                 )
 
             else:
@@ -281,6 +292,8 @@ def plot_trace(
                     ]
                 )
                 value = value.reshape((value.shape[0], value.shape[1], -1))
+                if trace is not None:
+                    trace = tuple(ary.reshape((ary.shape[0], ary.shape[1], -1)) for ary in trace)
                 compact_prop_iter = {
                     prop_name: [prop for _, prop in zip(range(value.shape[2]), cycle(props))]
                     for prop_name, props in compact_prop.items()
@@ -308,6 +321,7 @@ def plot_trace(
                         circular,
                         circ_var_units,
                         circ_units_trace,
+                        None if trace is None else tuple(ary[..., sub_idx] for ary in trace),
                     )
                     if legend:
                         handles.append(
@@ -470,15 +484,19 @@ def _plot_chains_mpl(
     circular,
     circ_var_units,
     circ_units_trace,
+    trace=None,
 ):
     if not circular:
         circ_var_units = False
 
+    if trace is None:
+        trace = (np.broadcast_to(data.draw.values, value.shape), value)
+
     for chain_idx, row in enumerate(value):
         if kind == "trace":
             aux_kwargs = dealiase_sel_kwargs(trace_kwargs, chain_prop, chain_idx)
             if idy:
-                axes.plot(data.draw.values, row, **aux_kwargs)
+                axes.plot(trace[0][chain_idx], trace[1][chain_idx], **aux_kwargs)
                 if circ_units_trace == "degrees":
                     y_tick_locs = axes.get_yticks()
                     y_tick_labels = [i + 2 * 180 if i < 0 else i for i in np.rad2deg(y_tick_locs)]
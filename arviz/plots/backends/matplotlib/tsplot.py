@@ -4,7 +4,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from ...plot_utils import _scale_fig_size
-from . import create_axes_grid, backend_show, matplotlib_kwarg_dealiaser, backend_kwarg_defaults
+from . import (
+    add_lines,
+    backend_kwarg_defaults,
+    backend_show,
+    create_axes_grid,
+    matplotlib_kwarg_dealiaser,
+)
 
 
 def plot_ts(
@@ -83,8 +89,12 @@ def plot_ts(
         if y_hat_plotters is not None:
             *_, y_hat_plotters_i = y_hat_plotters[i]
             *_, x_hat_plotters_i = x_plotters[i]
-            for j in range(num_samples):
-                ax_i.plot(x_hat_plotters_i, y_hat_plotters_i[..., j], **y_hat_plot_kwargs)
+            add_lines(
+                ax_i,
+                x_hat_plotters_i,
+                np.moveaxis(y_hat_plotters_i[..., :num_samples], -1, 0),
+                **y_hat_plot_kwargs,
+            )
 
             *_, x_mean_plotters_i = x_plotters[i]
             *_, y_mean_plotters_i = y_mean_plotters[i]
@@ -100,10 +110,12 @@ def plot_ts(
         if y_forecasts_plotters is not None:
             *_, y_forecasts_plotters_i = y_forecasts_plotters[i]
             *_, x_forecasts_plotters_i = x_holdout_plotters[i]
-            for j in range(num_samples):
-                ax_i.plot(
-                    x_forecasts_plotters_i, y_forecasts_plotters_i[..., j], **y_hat_plot_kwargs
-                )
+            add_lines(
+                ax_i,
+                x_forecasts_plotters_i,
+                np.moveaxis(y_forecasts_plotters_i[..., :num_samples], -1, 0),
+                **y_hat_plot_kwargs,
+            )
 
             *_, x_forecasts_mean_plotters_i = x_holdout_plotters[i]
             *_, y_forecasts_mean_plotters_i = y_forecasts_mean_plotters[i]
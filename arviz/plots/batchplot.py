@@ -0,0 +1,168 @@
+"""Render and save many matplotlib figures in parallel."""
+
+# pylint: disable=global-statement
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from ..data import InferenceData, from_netcdf
+
+_log = logging.getLogger(__name__)
+
+_WORKER_DATA = None
+
+
+def _init_worker(data):
+    """Switch the worker to a non interactive backend and load ``data`` once."""
+    global _WORKER_DATA
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    if isinstance(data, (str, os.PathLike)):
+        data = from_netcdf(data, defer_groups=True)
+    _WORKER_DATA = data
+
+
+def _get_plot_function(func):
+    if callable(func):
+        return func
+    from .. import plots
+
+    if func not in plots.__all__:
+        raise ValueError(f"{func} is not an ArviZ plotting function")
+    return getattr(plots, func)
+
+
+def _render(task):
+    """Render one spec and save its figure, returning its timings."""
+    import matplotlib.pyplot as plt
+
+    func, kwargs, filename, savefig_kwargs = task
+    func = _get_plot_function(func)
+    args = () if _WORKER_DATA is None else (_WORKER_DATA,)
+    kwargs = {"show": False, **kwargs}
+    start = perf_counter()
+    axes = func(*args, **kwargs)
+    plotted = perf_counter()
+    fig = np.ravel(axes)[0].get_figure()
+    fig.savefig(filename, **savefig_kwargs)
+    plt.close(fig)
+    return {
+        "filename": str(filename),
+        "function": func.__name__,
+        "plot_time": plotted - start,
+        "save_time": perf_counter() - plotted,
+        "pid": os.getpid(),
+    }
+
+
+def render_batch(
+    specs, outdir, data=None, n_jobs=None, fmt="png", savefig_kwargs=None, mp_context=None
+):
+    """Render a list of matplotlib plots and save them to files in parallel.
+
+    The plots are distributed over a pool of processes using the non interactive
+    ``Agg`` backend. ``data`` is sent to or loaded by every worker only once and
+    shared by all the plots it renders.
+
+    Parameters
+    ----------
+    specs : list of tuple
+        Each element is a ``(func, kwargs)`` or ``(func, kwargs, filename)`` tuple.
+        ``func`` is an ArviZ plotting function or its name, like ``"plot_trace"``,
+        and ``kwargs`` the keyword arguments it is called with. Functions need to be
+        defined at the top level of a module so they can be sent to the workers.
+        If the filename is not given, ``"{index}_{func name}.{fmt}"`` is used. Relative
+        filenames are saved into ``outdir``.
+    outdir : str or path-like
+        Directory where the figures are saved, created if it doesn't exist.
+    data : InferenceData or str or path-like, optional
+        Data passed as first positional argument to all the plotting functions.
+        If a path to a netCDF file, every worker opens it with
+        :func:`arviz.from_netcdf` so the groups are read lazily from disk instead
+        of being copied to each process. If None, the data has to be part of ``kwargs``.
+    n_jobs : int, optional
+        Number of processes. Defaults to the number of CPUs. With ``n_jobs=1``
+        the plots are rendered in the current process and backend.
+    fmt : str, default "png"
+        File format of the filenames generated for specs without one.
+    savefig_kwargs : dict, optional
+        Passed to :meth:`matplotlib.figure.Figure.savefig`.
+    mp_context : multiprocessing context, optional
+        Passed to :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per spec, in the same order, with the ``filename`` it was saved to,
+        the ``function``, the time in seconds spent plotting (``plot_time``) and saving
+        (``save_time``) and the ``pid`` of the process that rendered it.
+        The total wall time is stored in the ``wall_time`` entry of its ``attrs``.
+
+    Examples
+    --------
+    Save the trace and posterior plots of every variable using 4 processes
+
+    .. code-block:: python
+
+        import arviz as az
+        idata = az.load_arviz_data("centered_eight")
+        idata.to_netcdf("centered_eight.nc")
+        specs = [
+            (plot, {"var_names": var_name})
+            for plot in ("plot_trace", "plot_posterior")
+            for var_name in idata.posterior.data_vars
+        ]
+        timings = az.plots.render_batch(specs, "report", data="centered_eight.nc", n_jobs=4)
+
+    """
+    if savefig_kwargs is None:
+        savefig_kwargs = {}
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if data is not None and not isinstance(data, (InferenceData, str, os.PathLike)):
+        raise TypeError("data must be an InferenceData or the path to a netCDF file")
+
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    tasks = []
+    for idx, spec in enumerate(specs):
+        if len(spec) == 2:
+            func, kwargs = spec
+            name = func if isinstance(func, str) else func.__name__
+            filename = f"{idx}_{name}.{fmt}"
+        else:
+            func, kwargs, filename = spec
+        _get_plot_function(func)
+        tasks.append((func, kwargs, outdir / filename, savefig_kwargs))
+
+    start = perf_counter()
+    if n_jobs == 1:
+        global _WORKER_DATA
+        previous = _WORKER_DATA
+        _WORKER_DATA = from_netcdf(data) if isinstance(data, (str, os.PathLike)) else data
+        try:
+            timings = [_render(task) for task in tasks]
+        finally:
+            _WORKER_DATA = previous
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, max(len(tasks), 1)),
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(data,),
+        ) as executor:
+            timings = list(executor.map(_render, tasks))
+    wall_time = perf_counter() - start
+    _log.info("Rendered %d figures with %d processes in %.2fs", len(tasks), n_jobs, wall_time)
+
+    timings = pd.DataFrame(
+        timings, columns=["filename", "function", "plot_time", "save_time", "pid"]
+    )
+    timings.attrs["wall_time"] = wall_time
+    return timings
@@ -9,7 +9,7 @@ from ..sel_utils import (
 )
 from ..rcparams import rcParams
 from ..utils import _var_names
-from .plot_utils import default_grid, get_plotting_function
+from .plot_utils import default_grid, get_plotting_function, summary_lookup
 
 
 # pylint:disable-msg=too-many-function-args
@@ -37,6 +37,7 @@ def plot_density(
     backend=None,
     backend_kwargs=None,
     show=None,
+    stats=None,
 ):
     r"""Generate KDE plots for continuous variables and histograms for discrete ones.
 
@@ -121,6 +122,12 @@ def plot_density(
         For additional documentation check the plotting method of the backend.
     show : bool, optional
         Call backend show function.
+    stats : xarray.Dataset or list of xarray.Dataset, optional
+        Statistics already computed with :func:`arviz.summary` and ``fmt="xarray"``,
+        one per dataset, used instead of computing them again. The HDI limits are read
+        from the ``hdi_*`` metrics matching `hdi_prob` and the point estimate from the
+        metric with the same name; missing metrics are computed from the data. Use
+        ``round_to="none"`` in the summary to avoid rounded statistics.
 
     Returns
     -------
@@ -213,6 +220,18 @@ def plot_density(
     elif not 1 >= hdi_prob > 0:
         raise ValueError("The value of hdi_prob should be in the interval (0, 1]")
 
+    if point_estimate == "auto":
+        point_estimate = rcParams["plot.point_estimate"]
+
+    if stats is None:
+        stats = [None for _ in datasets]
+    elif not isinstance(stats, (list, tuple)):
+        stats = [stats]
+    if len(stats) != n_data:
+        raise ValueError(
+            f"The number of stats ({len(stats)}) does not match the number of models ({n_data})"
+        )
+
     to_plot = [
         list(xarray_var_iter(data, var_names, combined=True, skip_dims=combine_dims))
         for data in datasets
@@ -246,6 +265,11 @@ def plot_density(
         ]
         length_plotters = max_plots
     rows, cols = default_grid(length_plotters, grid=grid, max_cols=3)
+    lookups = [summary_lookup(stats_) for stats_ in stats]
+    plotter_stats = [
+        [lookup(var_name, selection) for var_name, selection, *_ in plotters]
+        for lookup, plotters in zip(lookups, to_plot)
+    ]
 
     if bw == "default":
         bw = "taylor" if circular else "experimental"
@@ -254,6 +278,7 @@ def plot_density(
         ax=ax,
         all_labels=all_labels,
         to_plot=to_plot,
+        plotter_stats=plotter_stats,
         colors=colors,
         bw=bw,
         circular=circular,
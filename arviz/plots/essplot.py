@@ -1,13 +1,14 @@
 """Plot quantile or local effective sample sizes."""
 
 import numpy as np
-import xarray as xr
 
 from ..data import convert_to_dataset
 from ..labels import BaseLabeller
 from ..rcparams import rcParams
 from ..sel_utils import xarray_var_iter
 from ..stats import ess
+from ..stats.diagnostics import _ess_evolution, _ess_local_batch, _ess_quantile_batch
+from ..stats.stats_utils import wrap_xarray_ufunc as _wrap_xarray_ufunc
 from ..utils import _var_names, get_coords
 from .plot_utils import default_grid, filter_plotters_list, get_plotting_function
 
@@ -210,62 +211,57 @@ def plot_ess(
     mean_ess = None
     sd_ess = None
 
+    dataset = data if var_names is None else data[var_names]
+    ufunc_kwargs = {"ravel": False}
+    output_core_dims = [["ess_dim"]]
     if kind == "quantile":
         probs = np.linspace(1 / n_points, 1 - 1 / n_points, n_points)
         xdata = probs
         ylabel = "{} for quantiles"
-        ess_dataset = xr.concat(
-            [
-                ess(data, var_names=var_names, relative=relative, method="quantile", prob=p)
-                for p in probs
-            ],
-            dim="ess_dim",
+        ess_dataset = _wrap_xarray_ufunc(
+            _ess_quantile_batch,
+            dataset,
+            ufunc_kwargs=ufunc_kwargs,
+            func_kwargs={"probs": probs, "relative": relative, "out_shape": (n_points,)},
+            output_core_dims=output_core_dims,
         )
     elif kind == "local":
         probs = np.linspace(0, 1, n_points, endpoint=False)
         xdata = probs
         ylabel = "{} for small intervals"
-        ess_dataset = xr.concat(
-            [
-                ess(
-                    data,
-                    var_names=var_names,
-                    relative=relative,
-                    method="local",
-                    prob=[p, p + 1 / n_points],
-                )
-                for p in probs
-            ],
-            dim="ess_dim",
+        ess_dataset = _wrap_xarray_ufunc(
+            _ess_local_batch,
+            dataset,
+            ufunc_kwargs=ufunc_kwargs,
+            func_kwargs={
+                "probs": np.stack((probs, probs + 1 / n_points), axis=-1),
+                "relative": relative,
+                "out_shape": (n_points,),
+            },
+            output_core_dims=output_core_dims,
         )
     else:
         first_draw = data.draw.values[0]
         ylabel = "{}"
         xdata = np.linspace(n_samples / n_points, n_samples, n_points)
         draw_divisions = np.linspace(n_draws // n_points, n_draws, n_points, dtype=int)
-        ess_dataset = xr.concat(
-            [
-                ess(
-                    data.sel(draw=slice(first_draw + draw_div)),
-                    var_names=var_names,
-                    relative=relative,
-                    method="bulk",
-                )
-                for draw_div in draw_divisions
-            ],
-            dim="ess_dim",
-        )
-        ess_tail_dataset = xr.concat(
-            [
-                ess(
-                    data.sel(draw=slice(first_draw + draw_div)),
-                    var_names=var_names,
-                    relative=relative,
-                    method="tail",
-                )
-                for draw_div in draw_divisions
-            ],
-            dim="ess_dim",
+        draw_subsets = [
+            data.draw.sel(draw=slice(first_draw + draw_div)).size for draw_div in draw_divisions
+        ]
+        ess_dataset, ess_tail_dataset = (
+            _wrap_xarray_ufunc(
+                _ess_evolution,
+                dataset,
+                ufunc_kwargs=ufunc_kwargs,
+                func_kwargs={
+                    "n_draws": draw_subsets,
+                    "method": method,
+                    "relative": relative,
+                    "out_shape": (n_points,),
+                },
+                output_core_dims=output_core_dims,
+            )
+            for method in ("bulk", "tail")
         )
 
     plotters = filter_plotters_list(
@@ -1,5 +1,7 @@
 """Forest plot."""
 
+import numpy as np
+
 from ..data import convert_to_dataset
 from ..labels import BaseLabeller, NoModelLabeller
 from ..rcparams import rcParams
@@ -39,6 +41,8 @@ def plot_forest(
     backend_config=None,
     backend_kwargs=None,
     show=None,
+    update=None,
+    stats=None,
 ):
     r"""Forest plot to compare HDI intervals from a number of distributions.
 
@@ -139,6 +143,20 @@ def plot_forest(
         For additional documentation check the plotting method of the backend.
     show : bool, optional
         Call backend show function.
+    update : bokeh figures, optional
+        Figures returned by a previous call with the bokeh backend and the same arguments.
+        Instead of creating new figures, their glyphs are removed and drawn again in
+        place, which refreshes a live document without rebuilding its layout. The
+        statistics are still computed from all the draws. Only available for the bokeh
+        backend.
+    stats : xarray.Dataset or list of xarray.Dataset, optional
+        Statistics already computed with :func:`arviz.summary` and ``fmt="xarray"``,
+        one per model, used instead of computing them again. The HDI limits are read
+        from the ``hdi_*`` metrics matching `hdi_prob`, they are computed from the data
+        if missing. The effective sample size and R-hat are always computed from the data,
+        as the forest plot uses estimators other than the ``ess_bulk`` and ``r_hat``
+        of the summary. Only used if `combined` is True and `combine_dims` is empty, the
+        summary should be computed on the same data with ``round_to="none"``.
 
     Returns
     -------
@@ -216,6 +234,12 @@ def plot_forest(
         data = [data]
     if len(data) == 1:
         legend = False
+    if stats is not None:
+        if not isinstance(stats, (list, tuple)):
+            stats = [stats]
+        if len(stats) != len(data):
+            raise ValueError("The number of stats does not match the number of models")
+        stats = list(reversed(stats))
 
     if coords is None:
         coords = {}
@@ -277,6 +301,7 @@ def plot_forest(
         labeller=labeller,
         ess=ess,
         r_hat=r_hat,
+        stats=stats,
         backend_kwargs=backend_kwargs,
         backend_config=backend_config,
         show=show,
@@ -286,6 +311,17 @@ def plot_forest(
         backend = rcParams["plot.backend"]
     backend = backend.lower()
 
+    if update is not None:
+        if backend != "bokeh":
+            raise ValueError("update is only available with the bokeh backend")
+        update = np.atleast_2d(update)
+        if update.shape != (1, ncols):
+            raise ValueError("The figures to update were not created with the same arguments")
+        from .backends.bokeh import clear_glyphs
+
+        clear_glyphs(update)
+        plot_forest_kwargs.update(ax=update, show=False)
+
     # TODO: Add backend kwargs
     plot = get_plotting_function("plot_forest", "forestplot", backend)
     axes = plot(**plot_forest_kwargs)
@@ -1,12 +1,13 @@
 """Plot quantile MC standard error."""
 
 import numpy as np
-import xarray as xr
 
 from ..data import convert_to_dataset
 from ..labels import BaseLabeller
 from ..sel_utils import xarray_var_iter
 from ..stats import mcse
+from ..stats.diagnostics import _mcse_quantile_batch
+from ..stats.stats_utils import wrap_xarray_ufunc as _wrap_xarray_ufunc
 from ..rcparams import rcParams
 from ..utils import _var_names, get_coords
 from .plot_utils import default_grid, filter_plotters_list, get_plotting_function
@@ -143,8 +144,12 @@ def plot_mcse(
     var_names = _var_names(var_names, data, filter_vars)
 
     probs = np.linspace(1 / n_points, 1 - 1 / n_points, n_points)
-    mcse_dataset = xr.concat(
-        [mcse(data, var_names=var_names, method="quantile", prob=p) for p in probs], dim="mcse_dim"
+    mcse_dataset = _wrap_xarray_ufunc(
+        _mcse_quantile_batch,
+        data if var_names is None else data[var_names],
+        ufunc_kwargs={"ravel": False},
+        func_kwargs={"probs": probs, "out_shape": (n_points,)},
+        output_core_dims=[["mcse_dim"]],
     )
 
     plotters = filter_plotters_list(
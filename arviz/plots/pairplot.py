@@ -1,5 +1,6 @@
 """Plot a scatter, kde and/or hexbin of sampled parameters."""
 
+import itertools
 import warnings
 from typing import List, Optional, Union
 
@@ -8,7 +9,7 @@ import numpy as np
 from ..data import convert_to_dataset
 from ..labels import BaseLabeller
 from ..sel_utils import xarray_to_ndarray, xarray_var_iter
-from .plot_utils import get_plotting_function
+from .plot_utils import bin_samples, get_plotting_function, pair_histograms
 from ..rcparams import rcParams
 from ..utils import _var_names, get_coords
 
@@ -33,6 +34,7 @@ def plot_pair(
     scatter_kwargs=None,
     kde_kwargs=None,
     hexbin_kwargs=None,
+    density_kwargs=None,
     backend=None,
     backend_kwargs=None,
     marginal_kwargs=None,
@@ -73,13 +75,18 @@ def plot_pair(
     textsize: int
         Text size for labels. If None it will be autoscaled based on ``figsize``.
     kind : str or List[str]
-        Type of plot to display (scatter, kde and/or hexbin)
+        Type of plot to display (scatter, kde, hexbin, density and/or auto).
+        ``density`` bins every pair of variables into a 2D histogram shown as an image,
+        so its cost does not depend on the number of samples. ``auto`` uses ``density``
+        when there are more than 100000 samples and ``scatter`` otherwise.
     gridsize: int or (int, int), optional
-        Only works for ``kind=hexbin``. The number of hexagons in the x-direction.
-        The corresponding number of hexagons in the y-direction is chosen
+        Only works for ``kind=hexbin`` and ``kind=density``. The number of hexagons in the
+        x-direction. The corresponding number of hexagons in the y-direction is chosen
         such that the hexagons are approximately regular. Alternatively, gridsize
         can be a tuple with two elements specifying the number of hexagons
-        in the x-direction and the y-direction.
+        in the x-direction and the y-direction. With ``kind=density`` it is the number of
+        bins per variable, ``"auto"`` uses the square root of the number of samples
+        clipped between 20 and 200.
     divergences: Boolean
         If True divergences will be plotted in a different color, only if group is either 'prior'
         or 'posterior'.
@@ -100,6 +107,9 @@ def plot_pair(
     hexbin_kwargs: dict, optional
         Additional keywords passed to :meth:`matplotlib.axes.Axes.hexbin` when
         using hexbin kind
+    density_kwargs: dict, optional
+        Additional keywords passed to :meth:`matplotlib.axes.Axes.imshow` or
+        :meth:`bokeh.plotting.figure.image` when using density kind
     backend: str, optional
         Select plotting backend {"matplotlib","bokeh"}. Default "matplotlib".
     backend_kwargs: bool, optional
@@ -173,7 +183,7 @@ def plot_pair(
         ...             divergences=True,
         ...             textsize=18)
     """
-    valid_kinds = ["scatter", "kde", "hexbin"]
+    valid_kinds = ["scatter", "kde", "hexbin", "density", "auto"]
     kind_boolean: Union[bool, List[bool]]
     if isinstance(kind, str):
         kind_boolean = kind in valid_kinds
@@ -200,6 +210,13 @@ def plot_pair(
         labeller.make_label_vert(var_name, sel, isel) for var_name, sel, isel, _ in plotters
     ]
 
+    if "auto" in kind:
+        auto_kind = "density" if plotters and plotters[0][-1].size > 100000 else "scatter"
+        if isinstance(kind, str):
+            kind = auto_kind
+        else:
+            kind = [auto_kind if kind_i == "auto" else kind_i for kind_i in kind]
+
     divergent_data = None
     diverging_mask = None
 
@@ -229,6 +246,16 @@ def plot_pair(
                 UserWarning,
             )
 
+    density_data = None
+    if "density" in kind:
+        if gridsize == "auto":
+            bins = int(np.clip(plotters[0][-1].size ** 0.5, 20, 200)) if plotters else 20
+        else:
+            bins = int(np.max(gridsize))
+        codes, edges = zip(*(bin_samples(values, bins) for *_, values in plotters))
+        pairs = list(itertools.combinations(range(len(plotters)), 2))
+        density_data = (edges, dict(zip(pairs, pair_histograms(np.stack(codes), bins, pairs))))
+
     if gridsize == "auto":
         gridsize = int(dataset.sizes["draw"] ** 0.35)
 
@@ -247,6 +274,8 @@ def plot_pair(
         scatter_kwargs=scatter_kwargs,
         kde_kwargs=kde_kwargs,
         hexbin_kwargs=hexbin_kwargs,
+        density_kwargs=density_kwargs,
+        density_data=density_data,
         gridsize=gridsize,
         colorbar=colorbar,
         divergences=divergences,
@@ -1,15 +1,17 @@
 """Utilities for plotting."""
 
+import functools
 import importlib
 import warnings
+from itertools import product
 from typing import Any, Dict
 
 import matplotlib as mpl
 import numpy as np
 import packaging
+import xarray as xr
 from matplotlib.colors import to_hex
-from scipy.stats import mode, rankdata
-from scipy.interpolate import CubicSpline
+from scipy.stats import mode
 
 
 from ..rcparams import rcParams
@@ -315,6 +317,17 @@ def get_plotting_function(plot_name, plot_module, backend):
 
     plotting_method = getattr(module, plot_name)
 
+    if backend == "matplotlib" and rcParams["plot.matplotlib.rasterize_threshold"] is not None:
+        from .backends.matplotlib import rasterize_dense_artists
+
+        @functools.wraps(plotting_method)
+        def rasterized_plotting_method(*args, **kwargs):
+            output = plotting_method(*args, **kwargs)
+            rasterize_dense_artists(output)
+            return output
+
+        return rasterized_plotting_method
+
     return plotting_method
 
 
@@ -367,6 +380,50 @@ def calculate_point_estimate(point_estimate, values, bw="default", circular=Fals
     return point_value
 
 
+def summary_lookup(stats):
+    """Build a function to look up statistics precomputed with :func:`arviz.summary`.
+
+    Parameters
+    ----------
+    stats : xarray.Dataset or None
+        Output of :func:`arviz.summary` with ``fmt="xarray"``.
+
+    Returns
+    -------
+    callable
+        ``lookup(var_name, selection)`` returns a dict mapping metric names to the value
+        of the variable at ``selection``, a dict of coordinate values like the ones
+        generated by :func:`arviz.sel_utils.xarray_var_iter`. The dict is empty if
+        ``stats`` is None or doesn't contain the variable or the selection.
+    """
+    tables = {}
+
+    def lookup(var_name, selection):
+        if stats is None or var_name not in stats.data_vars:
+            return {}
+        if var_name not in tables:
+            stat = stats[var_name].transpose(..., "metric")
+            dims = stat.dims[:-1]
+            metrics = [str(metric) for metric in stat.metric.values]
+            keys = product(*(stat[dim].values.tolist() for dim in dims))
+            values = stat.values.reshape(-1, len(metrics)).tolist()
+            tables[var_name] = dims, {
+                key: dict(zip(metrics, row)) for key, row in zip(keys, values)
+            }
+        dims, table = tables[var_name]
+        if set(selection) != set(dims):
+            return {}
+        return table.get(tuple(selection[dim] for dim in dims), {})
+
+    return lookup
+
+
+def hdi_metric_names(hdi_prob):
+    """Get the names :func:`arviz.summary` gives to the limits of the ``hdi_prob`` HDI."""
+    alpha = 1 - hdi_prob
+    return f"hdi_{100 * alpha / 2:g}%", f"hdi_{100 * (1 - alpha / 2):g}%"
+
+
 def plot_point_interval(
     ax,
     values,
@@ -569,17 +626,278 @@ def set_bokeh_circular_ticks_labels(ax, hist, labels):
 
 
 def compute_ranks(ary):
-    """Compute ranks for continuous and discrete variables."""
-    if ary.dtype.kind == "i":
-        ary_shape = ary.shape
-        ary = ary.flatten()
-        min_ary, max_ary = min(ary), max(ary)
-        x = np.linspace(min_ary, max_ary, len(ary))
-        csi = CubicSpline(x, ary)
-        ary = csi(np.linspace(min_ary + 0.001, max_ary - 0.001, len(ary))).reshape(ary_shape)
-    ranks = rankdata(ary, method="average").reshape(ary.shape)
-
-    return ranks
+    """Compute ranks for continuous and discrete variables.
+
+    Ranks are computed jointly over the last two dimensions of ``ary`` (chain and draw),
+    so a stack of variables is ranked with a single ``argsort``. Continuous variables
+    get average ranks, ties of discrete variables are broken at random with a fixed seed
+    to keep the ranks uniform across chains.
+
+    Parameters
+    ----------
+    ary : array_like
+        Array of shape ``(..., chain, draw)``. 1D arrays are ranked as a whole.
+
+    Returns
+    -------
+    ranks : np.ndarray
+        Float array with the same shape as ``ary``.
+    """
+    ary = np.asarray(ary)
+    shape = ary.shape
+    flat = ary.reshape(1, -1) if ary.ndim <= 2 else ary.reshape(-1, shape[-2] * shape[-1])
+    n_rows, n_samples = flat.shape
+    positions = np.arange(1, n_samples + 1, dtype=float)
+    ranks = np.empty(flat.shape)
+    if ary.dtype.kind in "biu":
+        perm = np.random.default_rng(0).permutation(n_samples)
+        order = perm[np.argsort(flat[:, perm], axis=-1, kind="stable")]
+        np.put_along_axis(ranks, order, positions[None, :], axis=-1)
+    else:
+        order = np.argsort(flat, axis=-1, kind="stable")
+        sorted_ary = np.take_along_axis(flat, order, axis=-1)
+        new_value = np.ones(flat.shape, dtype=bool)
+        new_value[:, 1:] = sorted_ary[:, 1:] != sorted_ary[:, :-1]
+        groups = np.cumsum(new_value, axis=-1) - 1 + n_samples * np.arange(n_rows)[:, None]
+        sizes = np.bincount(groups.ravel(), minlength=n_rows * n_samples)
+        totals = np.bincount(
+            groups.ravel(),
+            weights=np.broadcast_to(positions, flat.shape).ravel(),
+            minlength=n_rows * n_samples,
+        )
+        with np.errstate(invalid="ignore"):
+            average = totals / sizes
+        np.put_along_axis(ranks, order, average[groups], axis=-1)
+    return ranks.reshape(shape)
+
+
+def compute_rank_histograms(values, bins):
+    """Compute the rank histogram of each chain for a list of variables.
+
+    Arrays with the same shape and kind (discrete or continuous) are ranked together
+    with :func:`compute_ranks` and their counts obtained with a single ``np.bincount``
+    over ``(variable, chain, bin)`` indexes.
+
+    Parameters
+    ----------
+    values : list of array_like
+        Arrays of shape ``(chain, draw)``.
+    bins : int or sequence or str
+        Passed to :func:`numpy.histogram_bin_edges` over the ``(0, chain * draw)`` range.
+
+    Returns
+    -------
+    list of tuple
+        ``(bin_edges, counts)`` for each element of `values`, with ``counts`` of shape
+        ``(chain, n_bins)``.
+    """
+    values = [np.atleast_2d(ary) for ary in values]
+    groups = {}
+    for idx, ary in enumerate(values):
+        groups.setdefault((ary.shape, ary.dtype.kind in "biu"), []).append(idx)
+
+    histograms = [None] * len(values)
+    for ((n_chains, n_draws), _), idxs in groups.items():
+        ranks = compute_ranks(np.stack([values[idx] for idx in idxs]))
+        bin_ary = np.histogram_bin_edges(ranks[0], bins=bins, range=(0, n_chains * n_draws))
+        n_bins = len(bin_ary) - 1
+        bin_idx = np.clip(np.searchsorted(bin_ary, ranks, side="right") - 1, 0, n_bins - 1)
+        bin_idx += n_bins * np.arange(len(idxs) * n_chains).reshape(len(idxs), n_chains, 1)
+        counts = np.bincount(bin_idx.ravel(), minlength=len(idxs) * n_chains * n_bins)
+        counts = counts.reshape((len(idxs), n_chains, n_bins)).astype(float)
+        for idx, idx_counts in zip(idxs, counts):
+            histograms[idx] = (bin_ary, idx_counts)
+    return histograms
+
+
+def _lttb_indices(x, y, n_out):
+    """Select ``n_out`` points per row of ``y`` with Largest-Triangle-Three-Buckets.
+
+    The loop runs over buckets and is vectorized over rows, so all series
+    sharing the same ``x`` are downsampled in a single pass.
+    """
+    n_rows, n_draws = y.shape
+    edges = np.linspace(1, n_draws - 1, n_out - 1).astype(int)
+    edges = np.append(edges, n_draws)
+    rows = np.arange(n_rows)
+    idx = np.empty((n_rows, n_out), dtype=int)
+    idx[:, 0] = 0
+    idx[:, -1] = n_draws - 1
+    prev = np.zeros(n_rows, dtype=int)
+    for i in range(n_out - 2):
+        start, stop, next_stop = edges[i], edges[i + 1], edges[i + 2]
+        next_x = x[stop:next_stop].mean()
+        next_y = y[:, stop:next_stop].mean(axis=1)
+        prev_x = x[prev][:, None]
+        prev_y = y[rows, prev][:, None]
+        area = np.abs(
+            (prev_x - next_x) * (y[:, start:stop] - prev_y)
+            - (prev_x - x[start:stop]) * (next_y[:, None] - prev_y)
+        )
+        prev = start + np.argmax(area, axis=1)
+        idx[:, i + 1] = prev
+    return idx
+
+
+def _minmax_indices(y, n_out):
+    """Select the minimum and maximum of ``n_out // 2`` equal width buckets per row of ``y``."""
+    n_rows, n_draws = y.shape
+    size = -(-n_draws // max(n_out // 2, 1))
+    n_buckets = -(-n_draws // size)
+    padded = np.full((n_rows, n_buckets * size), np.nan)
+    padded[:, :n_draws] = y
+    padded = padded.reshape(n_rows, n_buckets, size)
+    nan = np.isnan(padded)
+    offset = np.arange(n_buckets) * size
+    idx_min = offset + np.argmin(np.where(nan, np.inf, padded), axis=-1)
+    idx_max = offset + np.argmax(np.where(nan, -np.inf, padded), axis=-1)
+    idx = np.stack((np.minimum(idx_min, idx_max), np.maximum(idx_min, idx_max)), axis=-1)
+    return np.minimum(idx.reshape(n_rows, -1), n_draws - 1)
+
+
+def downsample_trace(dataset, method="lttb", max_points=2000):
+    """Reduce the number of draws shown per trace line while keeping its visual shape.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        Dataset with ``chain`` and ``draw`` dimensions on every variable.
+    method : {"lttb", "minmax"}, default "lttb"
+        ``"lttb"`` keeps the points selected by the Largest-Triangle-Three-Buckets
+        algorithm, ``"minmax"`` keeps the minimum and the maximum of each bucket of
+        draws so the envelope of the trace is preserved exactly.
+    max_points : int, default 2000
+        Maximum number of points kept per chain and variable.
+
+    Returns
+    -------
+    values, draws : xarray.Dataset or None
+        Datasets with the downsampled values and the draw each value corresponds to.
+        Both keep the variables and dimensions of `dataset`, with a shorter ``draw``
+        dimension without index. ``None`` if there are already ``max_points`` draws
+        or less.
+    """
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"downsample must be 'lttb' or 'minmax', got {method}")
+    max_points = int(max_points)
+    if max_points < 3:
+        raise ValueError(f"max_points must be at least 3, got {max_points}")
+    n_draws = dataset.sizes["draw"]
+    if n_draws <= max_points:
+        return None
+
+    draws = dataset.draw.values
+    x = np.arange(n_draws, dtype=float)
+    arrays = {}
+    for var_name, da in dataset.data_vars.items():
+        da = da.transpose("chain", "draw", ...)
+        arrays[var_name] = (da, np.moveaxis(da.values, 1, -1))
+    flat = np.concatenate(
+        [ary.reshape(-1, n_draws).astype(float) for _, ary in arrays.values()], axis=0
+    )
+    if method == "lttb":
+        idx = _lttb_indices(x, flat, max_points)
+    else:
+        idx = _minmax_indices(flat, max_points)
+
+    values = {}
+    draw_values = {}
+    start = 0
+    for var_name, (da, ary) in arrays.items():
+        n_rows = ary.size // n_draws
+        var_idx = idx[start : start + n_rows].reshape(*ary.shape[:-1], -1)
+        start += n_rows
+        coords = {dim: da[dim] for dim in da.dims if dim != "draw" and dim in da.coords}
+        values[var_name] = xr.DataArray(
+            np.moveaxis(np.take_along_axis(ary, var_idx, axis=-1), -1, 1),
+            dims=da.dims,
+            coords=coords,
+        )
+        draw_values[var_name] = xr.DataArray(
+            np.moveaxis(draws[var_idx], -1, 1), dims=da.dims, coords=coords
+        )
+    return xr.Dataset(values), xr.Dataset(draw_values)
+
+
+def bin_samples(values, bins):
+    """Assign every sample to one of ``bins`` equal width bins spanning the range of `values`.
+
+    Parameters
+    ----------
+    values : array_like
+        Samples to bin, flattened.
+    bins : int
+        Number of bins.
+
+    Returns
+    -------
+    codes : ndarray of int
+        Bin of each sample. Non finite samples are assigned to the extra bin ``bins``.
+    edges : ndarray
+        The ``bins + 1`` bin edges.
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    finite = np.isfinite(values)
+    if finite.any():
+        low, high = values[finite].min(), values[finite].max()
+    else:
+        low, high = 0.0, 1.0
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    with np.errstate(invalid="ignore"):
+        codes = ((values - low) * (bins / (high - low))).astype(np.intp)
+    codes = np.clip(codes, 0, bins - 1)
+    codes[~finite] = bins
+    return codes, np.linspace(low, high, bins + 1)
+
+
+def pair_histograms(codes, bins, pairs):
+    """Compute the 2D histograms of several pairs of binned variables.
+
+    The counts of all pairs are obtained with a single ``np.bincount`` over
+    ``(pair, x bin, y bin)`` indexes.
+
+    Parameters
+    ----------
+    codes : array_like of int
+        Array of shape ``(variable, sample)`` with the codes returned by :func:`bin_samples`
+        for each variable, all binned with the same number of `bins`.
+    bins : int
+        Number of bins of every variable.
+    pairs : list of tuple of int
+        ``(x, y)`` indexes of the variables of each histogram.
+
+    Returns
+    -------
+    ndarray of int
+        Array of shape ``(pair, bins, bins)`` with the number of samples in each cell.
+        Non finite samples are not counted.
+    """
+    codes = np.asarray(codes)
+    pairs = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+    n_cells = (bins + 1) ** 2
+    cells = codes[pairs[:, 0]] * (bins + 1) + codes[pairs[:, 1]]
+    cells += n_cells * np.arange(len(pairs)).reshape(-1, 1)
+    counts = np.bincount(cells.ravel(), minlength=len(pairs) * n_cells)
+    return counts.reshape((len(pairs), bins + 1, bins + 1))[:, :bins, :bins]
+
+
+def steps_pre(x, y):
+    """Convert lines to the vertices of their ``steps-pre`` drawstyle.
+
+    Collections of lines do not support drawstyles, so step lines drawn with them
+    need the vertices of the steps. `x` and `y` are broadcast against each other and
+    the last axis is the one with the points of each line.
+    """
+    x, y = np.broadcast_arrays(x, y)
+    n_points = x.shape[-1]
+    steps_x = np.empty(x.shape[:-1] + (2 * n_points - 1,), dtype=np.result_type(x, float))
+    steps_y = np.empty(y.shape[:-1] + (2 * n_points - 1,), dtype=np.result_type(y, float))
+    steps_x[..., 0::2] = x
+    steps_x[..., 1::2] = x[..., :-1]
+    steps_y[..., 0::2] = y
+    steps_y[..., 1::2] = y[..., 1:]
+    return steps_x, steps_y
 
 
 def _init_kwargs_dict(kwargs):
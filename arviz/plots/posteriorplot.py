@@ -5,7 +5,12 @@ from ..labels import BaseLabeller
 from ..sel_utils import xarray_var_iter
 from ..utils import _var_names, get_coords
 from ..rcparams import rcParams
-from .plot_utils import default_grid, filter_plotters_list, get_plotting_function
+from .plot_utils import (
+    default_grid,
+    filter_plotters_list,
+    get_plotting_function,
+    summary_lookup,
+)
 
 
 def plot_posterior(
@@ -37,6 +42,7 @@ def plot_posterior(
     backend=None,
     backend_kwargs=None,
     show=None,
+    stats=None,
     **kwargs
 ):
     r"""Plot Posterior densities in the style of John K. Kruschke's book.
@@ -126,6 +132,12 @@ def plot_posterior(
         :func:`matplotlib.pyplot.subplots` or :func:`bokeh.plotting.figure`
     show: bool, optional
         Call backend show function.
+    stats: xarray.Dataset, optional
+        Statistics already computed with :func:`arviz.summary` and ``fmt="xarray"`` on the
+        same data, used instead of computing them again. The point estimate is read from
+        the metric with the same name, e.g. ``mean``, and the HDI limits from the ``hdi_*``
+        metrics matching `hdi_prob`; missing metrics are computed from the data. Use
+        ``round_to="none"`` in the summary to avoid rounded statistics.
     **kwargs
         Passed as-is to :func:`matplotlib.pyplot.hist` or :func:`matplotlib.pyplot.plot` function
         depending on the value of `kind`.
@@ -260,6 +272,8 @@ def plot_posterior(
     )
     length_plotters = len(plotters)
     rows, cols = default_grid(length_plotters, grid=grid)
+    lookup = summary_lookup(stats)
+    plotter_stats = [lookup(var_name, selection) for var_name, selection, *_ in plotters]
 
     posteriorplot_kwargs = dict(
         ax=ax,
@@ -268,6 +282,7 @@ def plot_posterior(
         cols=cols,
         figsize=figsize,
         plotters=plotters,
+        plotter_stats=plotter_stats,
         bw=bw,
         circular=circular,
         bins=bins,
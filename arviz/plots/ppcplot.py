@@ -9,6 +9,7 @@ import numpy as np
 from ..labels import BaseLabeller
 from ..sel_utils import xarray_var_iter
 from ..rcparams import rcParams
+from ..stats.density_utils import _kde_linear_batch, get_bins
 from ..utils import _var_names
 from .plot_utils import default_grid, filter_plotters_list, get_plotting_function
 
@@ -334,6 +335,15 @@ def plot_ppc(
     ]
     rows, cols = default_grid(length_plotters, grid=grid)
 
+    pp_densities = [
+        _pp_densities(
+            pp_vals.reshape(total_pp_samples, -1)[pp_sample_ix],
+            kind,
+            predictive_dataset[pp_var_name].dtype.kind,
+        )
+        for pp_var_name, _, _, pp_vals in pp_plotters
+    ]
+
     ppcplot_kwargs = dict(
         ax=ax,
         length_plotters=length_plotters,
@@ -345,6 +355,7 @@ def plot_ppc(
         pp_plotters=pp_plotters,
         predictive_dataset=predictive_dataset,
         pp_sample_ix=pp_sample_ix,
+        pp_densities=pp_densities,
         kind=kind,
         alpha=alpha,
         colors=colors,
@@ -367,3 +378,39 @@ def plot_ppc(
     plot = get_plotting_function("plot_ppc", "ppcplot", backend)
     axes = plot(**ppcplot_kwargs)
     return axes
+
+
+def _pp_densities(pp_sampled_vals, kind, dtype):
+    """Compute the curves of all the predictive samples in a single vectorized pass.
+
+    Parameters
+    ----------
+    pp_sampled_vals : ndarray
+        2D array with one predictive sample per row.
+    kind : str
+        ``kind`` argument of :func:`plot_ppc`.
+    dtype : str
+        Kind of the dtype of the predictive data.
+
+    Returns
+    -------
+    tuple of (ndarray, ndarray) or None
+        x and y values of the lines, broadcastable to ``(n_samples, n_points)``.
+        Kernel density estimates and histograms share a common grid, empirical
+        cdfs share the y values. None for scatter plots or invalid data types.
+    """
+    if dtype not in ("i", "f"):
+        return None
+    if kind == "kde":
+        if dtype == "f":
+            return _kde_linear_batch(pp_sampled_vals)
+        bins = get_bins(pp_sampled_vals)
+        n_samples, n_bins = len(pp_sampled_vals), len(bins) - 1
+        codes = np.clip(np.searchsorted(bins, pp_sampled_vals, side="right") - 1, 0, n_bins - 1)
+        codes += np.arange(n_samples)[:, None] * n_bins
+        counts = np.bincount(codes.ravel(), minlength=n_samples * n_bins).reshape(n_samples, -1)
+        hist = counts / (counts.sum(axis=1, keepdims=True) * np.diff(bins))
+        return bins, np.concatenate((hist[:, :1], hist), axis=1)
+    if kind == "cumulative":
+        return np.sort(pp_sampled_vals, axis=1), np.linspace(0, 1, pp_sampled_vals.shape[1])
+    return None
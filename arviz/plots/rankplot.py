@@ -10,7 +10,12 @@ from ..sel_utils import xarray_var_iter
 from ..rcparams import rcParams
 from ..stats.density_utils import _sturges_formula
 from ..utils import _var_names
-from .plot_utils import default_grid, filter_plotters_list, get_plotting_function
+from .plot_utils import (
+    compute_rank_histograms,
+    default_grid,
+    filter_plotters_list,
+    get_plotting_function,
+)
 
 
 def plot_rank(
@@ -184,6 +189,7 @@ def plot_rank(
 
     if bins is None:
         bins = _sturges_formula(posterior_data, mult=2)
+    histograms = compute_rank_histograms([var_data for *_, var_data in plotters], bins)
 
     if labeller is None:
         labeller = BaseLabeller()
@@ -208,7 +214,7 @@ def plot_rank(
         cols=cols,
         figsize=figsize,
         plotters=plotters,
-        bins=bins,
+        histograms=histograms,
         kind=kind,
         colors=colors,
         ref_line=ref_line,
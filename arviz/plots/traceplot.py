@@ -8,7 +8,7 @@ from ..labels import BaseLabeller
 from ..rcparams import rcParams
 from ..sel_utils import xarray_var_iter
 from ..utils import _var_names, get_coords
-from .plot_utils import KwargSpec, get_plotting_function
+from .plot_utils import KwargSpec, downsample_trace, get_plotting_function
 
 
 def plot_trace(
@@ -35,12 +35,15 @@ def plot_trace(
     hist_kwargs: Optional[KwargSpec] = None,
     trace_kwargs: Optional[KwargSpec] = None,
     rank_kwargs: Optional[KwargSpec] = None,
+    downsample: Optional[str] = None,
+    downsample_points: int = 2000,
     labeller=None,
     axes=None,
     backend: Optional[str] = None,
     backend_config: Optional[KwargSpec] = None,
     backend_kwargs: Optional[KwargSpec] = None,
     show: Optional[bool] = None,
+    update=None,
 ):
     """Plot distribution (histogram or kernel density estimates) and sampled values or rank plot.
 
@@ -107,6 +110,14 @@ def plot_trace(
         Read the :ref:`label_guide` for more details and usage examples.
     rank_kwargs : dict, optional
         Extra keyword arguments passed to :func:`arviz.plot_rank`
+    downsample : {None, "lttb", "minmax"}, optional
+        Reduce the number of points drawn per trace line when there are more than
+        `downsample_points` draws. ``"lttb"`` uses the Largest-Triangle-Three-Buckets
+        algorithm, ``"minmax"`` keeps the minimum and maximum of each bucket of draws.
+        Only the trace lines are downsampled, densities, histograms, ranks and
+        divergences use all the draws. Defaults to None, which plots every draw.
+    downsample_points : int, default 2000
+        Maximum number of points per chain in each trace line when `downsample` is set.
     axes: axes, optional
         Matplotlib axes or bokeh figures.
     backend: {"matplotlib", "bokeh"}, optional
@@ -119,6 +130,13 @@ def plot_trace(
         :func:`bokeh.plotting.figure`.
     show: bool, optional
         Call backend show function.
+    update: bokeh figures, optional
+        Figures returned by a previous call with the bokeh backend and the same arguments.
+        Instead of creating new figures, only the draws not yet plotted are converted and
+        streamed to the trace lines, while the densities, rank plots and divergences are
+        drawn again from all the draws. Refreshing a live document then only sends the
+        new draws and the updated densities to the browser. Only available for the bokeh
+        backend.
 
     Returns
     -------
@@ -176,6 +194,9 @@ def plot_trace(
     if kind not in {"trace", "rank_vlines", "rank_bars"}:
         raise ValueError("The value of kind must be either trace, rank_vlines or rank_bars.")
 
+    if downsample not in {None, "lttb", "minmax"}:
+        raise ValueError("The value of downsample must be either None, lttb or minmax.")
+
     if divergences == "auto":
         divergences = "top" if rug else "bottom"
     if divergences:
@@ -228,6 +249,14 @@ def plot_trace(
         )
         plotters = plotters[:max_plots]
 
+    trace_data = None
+    if downsample is not None and kind == "trace":
+        trace_data = downsample_trace(
+            coords_data if var_names is None else coords_data[var_names],
+            method=downsample,
+            max_points=downsample_points,
+        )
+
     # TODO: Check if this can be further simplified
     trace_plot_args = dict(
         # User Kwargs
@@ -255,6 +284,7 @@ def plot_trace(
         labeller=labeller,
         # Generated kwargs
         divergence_data=divergence_data,
+        trace_data=trace_data,
         # skip_dims=skip_dims,
         plotters=plotters,
         axes=axes,
@@ -267,7 +297,11 @@ def plot_trace(
         backend = rcParams["plot.backend"]
     backend = backend.lower()
 
+    if update is not None:
+        if backend != "bokeh":
+            raise ValueError("update is only available with the bokeh backend")
+        trace_plot_args.update(axes=update, show=False, update=True)
+
     plot = get_plotting_function("plot_trace", "traceplot", backend)
     axes = plot(**trace_plot_args)
-
     return axes
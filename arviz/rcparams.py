@@ -212,6 +212,37 @@ def _validate_dict_of_lists(values):
     return validated_dict
 
 
+def _validate_chunks(value):
+    """Validate dask chunks: None, "auto" or a dict of dimension name to chunk size."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value.lower() == "none":
+            return None
+        if value.lower() == "auto":
+            return "auto"
+        items = [item.split(":", 1) for item in value.split(",") if item.strip()]
+        if any(len(item) != 2 for item in items):
+            raise ValueError(f"Could not interpret '{value}' as dim: size pairs")
+        value = {key.strip(' "{}'): size.strip(' "{}') for key, size in items}
+    if not isinstance(value, dict):
+        raise ValueError("Only None, 'auto' or a dict of dim: size are valid")
+    return {str(key): _validate_chunk_size(size) for key, size in value.items()}
+
+
+def _validate_chunk_size(value):
+    """Validate chunk size is a positive integer, -1 or "auto"."""
+    if isinstance(value, str) and value.lower() == "auto":
+        return "auto"
+    try:
+        value = int(value)
+    except (ValueError, TypeError) as err:
+        raise ValueError("Could not convert chunk size to int") from err
+    if value > 0 or value == -1:
+        return value
+    raise ValueError("Chunk sizes must be positive, -1 or 'auto'")
+
+
 def make_iterable_validator(scalar_validator, length=None, allow_none=False, allow_auto=False):
     """Validate value is an iterable datatype."""
     # based on matplotlib's _listify_validator function
@@ -254,7 +285,13 @@ METAGROUPS = {
 defaultParams = {  # pylint: disable=invalid-name
     "data.http_protocol": ("https", _make_validate_choice({"https", "http"})),
     "data.load": ("lazy", _make_validate_choice({"lazy", "eager"})),
+    "data.chunks": (None, _validate_chunks),
+    "data.float_dtype": (
+        None,
+        _make_validate_choice({"float16", "float32", "float64"}, allow_none=True),
+    ),
     "data.metagroups": (METAGROUPS, _validate_dict_of_lists),
+    "data.repr_memory": (False, _validate_boolean),
     "data.index_origin": (0, _make_validate_choice({0, 1}, typeof=int)),
     "data.log_likelihood": (True, _validate_boolean),
     "data.save_warmup": (False, _validate_boolean),
@@ -301,6 +338,7 @@ defaultParams = {  # pylint: disable=invalid-name
         "reset,pan,box_zoom,wheel_zoom,lasso_select,undo,save,hover",
         lambda x: x,
     ),
+    "plot.matplotlib.rasterize_threshold": (None, _validate_positive_int_or_none),
     "plot.matplotlib.show": (False, _validate_boolean),
     "stats.ci_prob": (0.94, _validate_probability),
     "stats.information_criterion": (
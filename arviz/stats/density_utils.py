@@ -201,22 +201,22 @@ def _dct1d(x):
     Parameters
     ----------
     x : numpy array
-        1 dimensional array of values for which the
-        DCT is desired
+        Array of values for which the DCT is desired. The transform
+        is computed along the last axis.
 
     Returns
     -------
     output : DTC transformed values
     """
-    x_len = len(x)
+    x_len = x.shape[-1]
 
     even_increasing = np.arange(0, x_len, 2)
     odd_decreasing = np.arange(x_len - 1, 0, -2)
 
-    x = np.concatenate((x[even_increasing], x[odd_decreasing]))
+    x = np.concatenate((x[..., even_increasing], x[..., odd_decreasing]), axis=-1)
 
     w_1k = np.r_[1, (2 * np.exp(-(0 + 1j) * (np.arange(1, x_len)) * np.pi / (2 * x_len)))]
-    output = np.real(w_1k * fft(x))
+    output = np.real(w_1k * fft(x, axis=-1))
 
     return output
 
@@ -271,6 +271,152 @@ def _root(function, N, args, x):
     return bw
 
 
+def _fixed_point_batch(t, N, k_sq, a_sq):
+    """Evaluate :func:`_fixed_point` for every row of `a_sq`, with one `t` and `N` per row."""
+    l = 7
+    f = np.sum(k_sq**l * a_sq * np.exp(-k_sq * np.pi**2 * t[:, None]), axis=1)
+    f *= 0.5 * np.pi ** (2.0 * l)
+
+    for j in range(l - 1, 1, -1):
+        c1 = (1 + 0.5 ** (j + 0.5)) / 3
+        c2 = np.prod(np.arange(1.0, 2 * j + 1, 2, dtype=np.float64))
+        c2 /= (np.pi / 2) ** 0.5
+        t_j = np.power((c1 * (c2 / (N * f))), (2.0 / (3.0 + 2.0 * j)))
+        f = np.sum(k_sq**j * a_sq * np.exp(-k_sq * np.pi**2.0 * t_j[:, None]), axis=1)
+        f *= 0.5 * np.pi ** (2 * j)
+
+    return t - (2 * N * np.pi**0.5 * f) ** (-0.4)
+
+
+def _root_batch(N, k_sq, a_sq, xtol=2e-12, maxiter=100):
+    """Find the roots of :func:`_fixed_point_batch` in [0, 0.01] for all rows at once.
+
+    It uses the Illinois variant of the false position method, iterating only
+    on the rows that have not converged yet. Rows without a sign change in the
+    interval or that do not converge get ``nan``.
+    """
+    n_rows = len(a_sq)
+    low = np.zeros(n_rows)
+    high = np.full(n_rows, 0.01)
+    with np.errstate(all="ignore"):
+        f_low = _fixed_point_batch(low, N, k_sq, a_sq)
+        f_high = _fixed_point_batch(high, N, k_sq, a_sq)
+    root = np.full(n_rows, np.nan)
+    side = np.zeros(n_rows)
+    active = np.flatnonzero(np.isfinite(f_low) & np.isfinite(f_high) & (f_low * f_high < 0))
+    for _ in range(maxiter):
+        if not active.size:
+            break
+        f_lo, f_hi = f_low[active], f_high[active]
+        t = high[active] - f_hi * (high[active] - low[active]) / (f_hi - f_lo)
+        with np.errstate(all="ignore"):
+            f_t = _fixed_point_batch(t, N[active], k_sq, a_sq[active])
+        move_high = np.sign(f_t) == np.sign(f_hi)
+        move_low = ~move_high
+        high[active[move_high]] = t[move_high]
+        f_high[active[move_high]] = f_t[move_high]
+        f_low[active[move_high & (side[active] == 1)]] /= 2
+        low[active[move_low]] = t[move_low]
+        f_low[active[move_low]] = f_t[move_low]
+        f_high[active[move_low & (side[active] == -1)]] /= 2
+        side[active] = np.where(move_high, 1, -1)
+        done = (f_t == 0) | (high[active] - low[active] < xtol + 4 * np.finfo(float).eps * t)
+        done |= ~np.isfinite(f_t)
+        root[active[done]] = np.where(np.isfinite(f_t[done]), t[done], np.nan)
+        active = active[~done]
+    return root
+
+
+def _kde_linear_batch(x, bw="experimental", bw_fct=1, grid_len=512):
+    """Density estimation of every row of `x` on a grid shared by all rows.
+
+    Vectorized version of :func:`_kde_linear` with its default boundary correction.
+    All rows are binned with a single ``np.bincount`` call on a grid spanning the range
+    of the whole array, bandwidths are computed for all rows at once and the Gaussian
+    smoothing is done in the frequency domain, where each row can use its own bandwidth.
+
+    Parameters
+    ----------
+    x : 2D numpy array
+        Data used to calculate the density estimation, one estimation per row.
+    bw : int, float or str, optional
+        Bandwidth or bandwidth method, one of "scott", "silverman", "isj" or "experimental".
+        Defaults to "experimental".
+    bw_fct : float, optional
+        A value that multiplies `bw`. Defaults to 1.
+    grid_len : int, optional
+        The number of intervals used to bin the data points. Defaults to 512.
+
+    Returns
+    -------
+    grid : numpy.ndarray
+        1D gridded array for the x values, shared by all rows.
+    pdf : numpy.ndarray
+        2D array with the density estimate of each row.
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    n_rows = x.shape[0]
+    finite = np.isfinite(x)
+    x_len = finite.sum(axis=1)
+    if not finite.any() or np.nanmin(x) == np.nanmax(x):
+        warnings.warn("Your data appears to have a single value or no finite values")
+        return np.zeros(2), np.full((n_rows, 2), np.nan)
+
+    grid_min, grid_max = np.nanmin(x), np.nanmax(x)
+    x_range = grid_max - grid_min
+    grid_len = max(int(grid_len), 100)
+    grid_edges = np.linspace(grid_min, grid_max, grid_len + 1)
+    bin_width = grid_edges[1] - grid_edges[0]
+
+    codes = np.clip(((x[finite] - grid_min) / bin_width).astype(np.intp), 0, grid_len - 1)
+    codes += np.nonzero(finite)[0] * grid_len
+    grid_counts = np.bincount(codes, minlength=n_rows * grid_len).reshape(n_rows, grid_len)
+
+    x_len_safe = np.maximum(x_len, 1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        x_std = np.nanstd(x, axis=1)
+        q75, q25 = np.nanpercentile(x, [75, 25], axis=1)
+    bw_silverman = 0.9 * np.minimum(x_std, (q75 - q25) / 1.34) * x_len_safe ** (-0.2)
+
+    if isinstance(bw, str):
+        bw_lower = bw.lower()
+        if bw_lower not in _BW_METHODS_LINEAR:
+            raise ValueError(
+                "Unrecognized bandwidth method.\n"
+                f"Input is: {bw_lower}.\n"
+                f"Expected one of: {list(_BW_METHODS_LINEAR)}."
+            )
+        if bw_lower == "scott":
+            bw = 1.06 * x_std * x_len_safe ** (-0.2)
+        elif bw_lower == "silverman":
+            bw = bw_silverman
+        else:
+            # Same grid as the one used for the density, `_bw_isj` uses ``grid_len - 1``
+            a_k = _dct1d(grid_counts / x_len_safe[:, None])
+            k_sq = np.arange(1, grid_len - 1, dtype=np.float64) ** 2
+            t = _root_batch(x_len_safe, k_sq, a_k[:, 1 : grid_len - 1] ** 2)
+            bw_isj = np.where(np.isfinite(t) & (t > 0), t**0.5 * x_range, bw_silverman)
+            bw = bw_isj if bw_lower == "isj" else 0.5 * (bw_silverman + bw_isj)
+    else:
+        bw = _get_bw(x[0], bw) * np.ones(n_rows)
+    bw = bw_fct * bw
+
+    # Gaussian smoothing with reflection at the boundaries, as in `_kde_convolution`
+    f = grid_counts / bin_width / x_len_safe[:, None]
+    npad = int(grid_len / 5)
+    f = np.concatenate([f[:, npad - 1 :: -1], f, f[:, : grid_len - npad - 1 : -1]], axis=1)
+    n_fft = 2 * f.shape[1]
+    freqs = np.fft.rfftfreq(n_fft)
+    kernel = np.exp(-2 * (np.pi * freqs * (bw / bin_width)[:, None]) ** 2)
+    pdf = np.fft.irfft(np.fft.rfft(f, n_fft, axis=1) * kernel, n_fft, axis=1)
+    pdf = pdf[:, npad : npad + grid_len]
+    pdf[x_len == 0] = np.nan
+
+    grid = (grid_edges[1:] + grid_edges[:-1]) / 2
+    return grid, pdf
+
+
 def _check_custom_lims(custom_lims, x_min, x_max):
     """Check if `custom_lims` are of the correct type.
 
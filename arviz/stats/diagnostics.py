@@ -8,6 +8,7 @@ import packaging
 import pandas as pd
 import scipy
 from scipy import stats
+from scipy.fftpack import next_fast_len
 
 from ..data import convert_to_dataset
 from ..utils import Numba, _numba_var, _stack, _var_names
@@ -562,6 +563,9 @@ def _split_chains(ary):
     ary = np.asarray(ary)
     if len(ary.shape) <= 1:
         ary = np.atleast_2d(ary)
+    if len(ary.shape) > 2:
+        half = ary.shape[-1] // 2
+        return np.concatenate((ary[..., :half], ary[..., -half:]), axis=-2)
     _, n_draw = ary.shape
     half = n_draw // 2
     return _stack(ary[:, :half], ary[:, -half:])
@@ -701,6 +705,94 @@ def _ess(ary, relative=False):
     return ess
 
 
+def _ess_batch(ary, n_draws=None, relative=False):
+    """Compute the effective sample size for a stack of 2D arrays.
+
+    Vectorized version of :func:`_ess` over the leading dimensions of ``ary``, whose
+    last two dimensions are ``(chain, draw)``. The autocovariances of all the elements
+    are computed with a single FFT and Geyer's initial positive and monotone sequences
+    are evaluated without looping over lags.
+
+    Parameters
+    ----------
+    ary : np.ndarray
+        Array of shape ``(..., chain, draw)``.
+    n_draws : array_like of int, optional
+        Number of valid draws of each element of the stack, with the shape of the leading
+        dimensions of ``ary``. Draws after it are ignored, which allows computing the ess
+        of chains of different lengths at once. Defaults to all draws.
+    relative : bool
+        Return relative ess.
+
+    Returns
+    -------
+    np.ndarray
+        Array with the shape of the leading dimensions of ``ary``.
+    """
+    ary = np.asarray(ary, dtype=float)
+    batch_shape = ary.shape[:-2]
+    n_chain, max_draw = ary.shape[-2:]
+    ary = ary.reshape(-1, n_chain, max_draw)
+    if n_draws is None:
+        n_draws = np.full(ary.shape[0], max_draw)
+    else:
+        n_draws = np.broadcast_to(n_draws, batch_shape).ravel().astype(int)
+
+    valid = np.arange(max_draw) < n_draws[:, None, None]
+    finite = np.isfinite(ary)
+    has_nan = (valid & ~finite).any(axis=(1, 2)) | (n_draws < 1)
+    ary = np.where(valid & finite, ary, 0.0)
+    value_range = np.where(valid, ary, -np.inf).max(axis=(1, 2)) - np.where(valid, ary, np.inf).min(
+        axis=(1, 2)
+    )
+    constant = value_range < np.finfo(float).resolution  # pylint: disable=no-member
+
+    n_draws_f = np.maximum(n_draws, 2).astype(float)
+    chain_mean = ary.sum(axis=-1) / n_draws_f[:, None]
+    centered = np.where(valid, ary - chain_mean[..., None], 0.0)
+    n_fft = next_fast_len(2 * max_draw)
+    fft_ary = np.fft.rfft(centered, n=n_fft, axis=-1)
+    acov = np.fft.irfft(fft_ary * np.conjugate(fft_ary), n=n_fft, axis=-1)[..., :max_draw]
+    mean_acov = acov.mean(axis=1) / n_draws_f[:, None]
+
+    mean_var = mean_acov[:, 0] * n_draws_f / (n_draws_f - 1.0)
+    var_plus = mean_var * (n_draws_f - 1.0) / n_draws_f
+    if n_chain > 1:
+        var_plus = var_plus + np.var(chain_mean, axis=1, ddof=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rho_hat = 1.0 - (mean_var[:, None] - mean_acov) / var_plus[:, None]
+    rho_hat[:, 0] = 1.0
+
+    # Geyer's initial positive sequence: sum lag pairs until the first non positive one
+    n_pairs = max(max_draw // 2, 1)
+    rho_pad = np.zeros((rho_hat.shape[0], 2 * n_pairs + 1))
+    rho_pad[:, :max_draw] = rho_hat
+    pair_sums = rho_pad[:, : 2 * n_pairs : 2] + rho_pad[:, 1 : 2 * n_pairs : 2]
+    max_pairs = np.maximum((n_draws - 3) // 2, 0)
+    pair_idx = np.arange(n_pairs)
+    stop = ~(pair_sums > 0) | (pair_idx >= max_pairs[:, None])
+    last_pair = np.argmax(stop, axis=1)
+    rows = np.arange(rho_hat.shape[0])
+    rho_hat_even = rho_pad[rows, 2 * last_pair]
+    rho_hat_last = np.where(
+        (pair_sums[rows, last_pair] >= 0) | (rho_hat_even > 0), rho_hat_even, 0.0
+    )
+    # Geyer's initial monotone sequence
+    pair_sums = np.minimum.accumulate(pair_sums, axis=1)
+    pair_sums = np.where(pair_idx < last_pair[:, None], pair_sums, 0.0)
+
+    ess = n_chain * n_draws
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau_hat = -1.0 + 2.0 * pair_sums.sum(axis=1) + rho_hat_last
+        tau_hat = np.fmax(tau_hat, 1 / np.log10(ess))
+        ess = (1 if relative else ess) / tau_hat
+    ess = np.where(np.isnan(rho_hat[:, min(1, max_draw - 1)]), np.nan, ess)
+    ess = np.where(constant, n_chain * n_draws, ess)
+    ess = np.where(has_nan, np.nan, ess)
+    return ess.reshape(batch_shape)
+
+
 def _ess_bulk(ary, relative=False):
     """Compute the effective sample size for the bulk."""
     ary = np.asarray(ary)
@@ -774,6 +866,86 @@ def _ess_local(ary, prob, relative=False):
     return _ess(_split_chains(iquantile), relative=relative)
 
 
+def _ess_quantile_batch(ary, probs, relative=False):
+    """Compute the quantile effective sample size for every probability in ``probs``."""
+    ary = np.asarray(ary)
+    probs = np.asarray(probs, dtype=float)
+    if _not_valid(ary, shape_kwargs=dict(min_draws=4, min_chains=1)):
+        return np.full(probs.shape, np.nan)
+    quantiles = np.reshape(_quantile(ary, probs.ravel()), probs.shape)
+    iquantile = ary <= quantiles[..., None, None]
+    return _ess_batch(_split_chains(iquantile), relative=relative)
+
+
+def _ess_local_batch(ary, probs, relative=False):
+    """Compute the local effective sample size for every interval in ``probs``.
+
+    ``probs`` is an array of shape ``(n, 2)`` with lower and upper probability bounds.
+    """
+    ary = np.asarray(ary)
+    probs = np.asarray(probs, dtype=float)
+    if probs.shape[-1] != 2:
+        raise ValueError("Prob argument in ess local must be upper and lower bound")
+    if _not_valid(ary, shape_kwargs=dict(min_draws=4, min_chains=1)):
+        return np.full(probs.shape[:-1], np.nan)
+    quantiles = np.reshape(_quantile(ary, probs.ravel()), probs.shape)
+    iquantile = (quantiles[..., :1, None] <= ary) & (ary <= quantiles[..., 1:, None])
+    return _ess_batch(_split_chains(iquantile), relative=relative)
+
+
+def _ess_evolution(ary, n_draws, method="bulk", prob=None, relative=False):
+    """Compute the bulk or tail effective sample size of the first ``n_draws`` draws.
+
+    The ranks and quantiles depend on each subset of draws, but the autocovariances and
+    Geyer sequences of all the subsets are computed together with :func:`_ess_batch`.
+
+    Parameters
+    ----------
+    ary : np.ndarray
+        Array of shape ``(chain, draw)``.
+    n_draws : array_like of int
+        Number of leading draws of each subset.
+    method : {"bulk", "tail"}
+    prob : float or tuple of two floats, optional
+        Probabilities used by the "tail" method.
+    relative : bool
+        Return relative ess.
+
+    Returns
+    -------
+    np.ndarray
+        Effective sample size of each subset.
+    """
+    if method not in ("bulk", "tail"):
+        raise TypeError(f"ess evolution method {method} not found. Valid methods are: bulk, tail")
+    if prob is None:
+        prob = (0.05, 0.95)
+    elif not isinstance(prob, Sequence):
+        prob = (prob, 1 - prob)
+    ary = np.atleast_2d(np.asarray(ary))
+    n_draws = np.asarray(n_draws, dtype=int)
+    n_chain = ary.shape[0]
+    halves = n_draws // 2
+    max_half = max(halves.max(initial=0), 1)
+
+    n_subsets = 1 if method == "bulk" else 2
+    split = np.zeros((n_subsets, len(n_draws), 2 * n_chain, max_half))
+    valid = np.zeros(len(n_draws), dtype=bool)
+    for i, (n_draw, half) in enumerate(zip(n_draws, halves)):
+        subset = ary[:, :n_draw]
+        if _not_valid(subset, shape_kwargs=dict(min_draws=4, min_chains=1)):
+            continue
+        valid[i] = True
+        if method == "bulk":
+            split[0, i, :, :half] = _z_scale(_split_chains(subset))
+        else:
+            quantiles = _quantile(subset, prob)
+            split[:, i, :, :half] = _split_chains(subset <= quantiles[:, None, None])
+
+    ess = _ess_batch(split, n_draws=np.where(valid, halves, 0), relative=relative).min(axis=0)
+    return np.where(valid, ess, np.nan)
+
+
 def _ess_z_scale(ary, relative=False):
     """Calculate ess for z-scaLe."""
     ary = np.asarray(ary)
@@ -820,7 +992,7 @@ def _ess_identity(ary, relative=False):
 def _mcse_mean(ary):
     """Compute the Markov Chain mean error."""
     _numba_flag = Numba.numba_flag
-    ary = np.asarray(ary)
+    ary = np.asarray(ary, dtype=float)
     if _not_valid(ary, shape_kwargs=dict(min_draws=4, min_chains=1)):
         return np.nan
     ess = _ess_mean(ary)
@@ -835,7 +1007,7 @@ def _mcse_mean(ary):
 def _mcse_sd(ary):
     """Compute the Markov Chain sd error."""
     _numba_flag = Numba.numba_flag
-    ary = np.asarray(ary)
+    ary = np.asarray(ary, dtype=float)
     if _not_valid(ary, shape_kwargs=dict(min_draws=4, min_chains=1)):
         return np.nan
     ess = _ess_sd(ary)
@@ -870,6 +1042,24 @@ def _mcse_quantile(ary, prob):
     return (th2 - th1) / 2
 
 
+def _mcse_quantile_batch(ary, probs):
+    """Compute the Markov Chain quantile error for every probability in ``probs``."""
+    ary = np.asarray(ary)
+    probs = np.asarray(probs, dtype=float)
+    if _not_valid(ary, shape_kwargs=dict(min_draws=4, min_chains=1)):
+        return np.full(probs.shape, np.nan)
+    ess = _ess_quantile_batch(ary, probs)
+    probability = np.array([0.1586553, 0.8413447]).reshape((2,) + (1,) * probs.ndim)
+    with np.errstate(invalid="ignore"):
+        ppf = stats.beta.ppf(probability, ess * probs + 1, ess * (1 - probs) + 1)
+    sorted_ary = np.sort(ary.ravel())
+    size = sorted_ary.size
+    ppf_size = ppf * size - 1
+    th1 = sorted_ary[np.floor(np.fmax(ppf_size[0], 0)).astype(int)]
+    th2 = sorted_ary[np.ceil(np.fmin(ppf_size[1], size - 1)).astype(int)]
+    return (th2 - th1) / 2
+
+
 def _mc_error(ary, batches=5, circular=False):
     """Calculate the simulation standard error, accounting for non-independent samples.
 
@@ -10,6 +10,7 @@ import pandas as pd
 from scipy.fftpack import next_fast_len
 from scipy.interpolate import CubicSpline
 from scipy.stats.mstats import mquantiles
+import xarray as xr
 from xarray import apply_ufunc
 
 from .. import _log
@@ -413,6 +414,21 @@ def not_valid(ary, check_nan=True, check_shape=True, nan_kwargs=None, shape_kwar
     return nan_error | chain_error | draw_error
 
 
+def upcast_float(data):
+    """Cast floating point variables with less than 64 bits to float64.
+
+    Data stored with a lower precision (see the ``data.float_dtype`` rcParam) is
+    upcast before computing statistics prone to round-off errors like sums of
+    log likelihood values. Other arrays are returned unchanged, without copies.
+    """
+    if isinstance(data, xr.Dataset):
+        return data.assign({var_name: upcast_float(da) for var_name, da in data.data_vars.items()})
+    dtype = data.dtype
+    if np.issubdtype(dtype, np.floating) and dtype.itemsize < 8:
+        return data.astype(np.float64)
+    return data
+
+
 def get_log_likelihood(idata, var_name=None, single_var=True):
     """Retrieve the log likelihood dataarray of a given variable."""
     if (
@@ -424,7 +440,7 @@ def get_log_likelihood(idata, var_name=None, single_var=True):
             "Storing the log_likelihood in sample_stats groups has been deprecated",
             DeprecationWarning,
         )
-        return idata.sample_stats.log_likelihood
+        return upcast_float(idata.sample_stats.log_likelihood)
     if not hasattr(idata, "log_likelihood"):
         raise TypeError("log likelihood not found in inference data object")
     if var_name is None:
@@ -434,14 +450,14 @@ def get_log_likelihood(idata, var_name=None, single_var=True):
                 raise TypeError(
                     f"Found several log likelihood arrays {var_names}, var_name cannot be None"
                 )
-            return idata.log_likelihood[var_names]
-        return idata.log_likelihood[var_names[0]]
+            return upcast_float(idata.log_likelihood[var_names])
+        return upcast_float(idata.log_likelihood[var_names[0]])
     else:
         try:
             log_likelihood = idata.log_likelihood[var_name]
         except KeyError as err:
             raise TypeError(f"No log likelihood data named {var_name} found") from err
-        return log_likelihood
+        return upcast_float(log_likelihood)
 
 
 BASE_FMT = """Computed from {{n_samples}} posterior samples and \
@@ -2,6 +2,7 @@
 # pylint: disable=too-many-lines
 
 import importlib
+import io
 import os
 from collections import namedtuple
 from copy import deepcopy
@@ -18,6 +19,7 @@ from xarray.testing import assert_identical
 
 from ... import (
     InferenceData,
+    InferenceDataWriter,
     clear_data_home,
     concat,
     convert_to_dataset,
@@ -28,11 +30,15 @@ from ... import (
     from_netcdf,
     list_datasets,
     load_arviz_data,
+    rc_context,
+    to_json,
     to_netcdf,
     extract,
 )
+from ...stats import ess
 
 from ...data.base import dict_to_dataset, generate_dims_coords, infer_stan_dtypes, make_attrs
+from ...data.inference_data import _variable_storage
 from ...data.datasets import LOCAL_DATASETS, REMOTE_DATASETS, RemoteFileMetadata
 from ..helpers import (  # pylint: disable=unused-import
     chains,
@@ -322,6 +328,22 @@ def test_concat_dim(dim, copy, inplace, sequence, reset_dim):
         )
 
 
+def test_concat_dim_many():
+    idatas = [
+        from_dict(
+            posterior={"A": np.full((1, 10, 2), i)},
+            observed_data={"C": np.zeros(5)},
+            attrs={"chain_id": i},
+        )
+        for i in range(16)
+    ]
+    new_idata = concat(idatas, dim="chain", copy=False)
+    assert new_idata.posterior.sizes["chain"] == 16
+    assert np.all(new_idata.posterior["A"].values[:, 0, 0] == np.arange(16))
+    assert new_idata.attrs["chain_id"] == list(range(16))
+    assert new_idata.observed_data["C"].equals(idatas[0].observed_data["C"])
+
+
 @pytest.mark.parametrize("copy", [True, False])
 @pytest.mark.parametrize("inplace", [True, False])
 @pytest.mark.parametrize("sequence", [True, False])
@@ -477,6 +499,31 @@ class TestInferenceData:  # pylint: disable=too-many-public-methods
                 assert np.all(dataset.chain.values == np.arange(0, 4, 2))
                 assert np.all(dataset.draw.values == np.arange(200, ndraws))
 
+    def test_sel_shares_data(self, data_random):
+        idata = data_random
+        idata2 = idata.sel(draw=slice(0, 100), groups="posterior")
+        assert np.shares_memory(idata2.posterior["a"].values, idata.posterior["a"].values)
+        assert np.shares_memory(idata2.sample_stats["a"].values, idata.sample_stats["a"].values)
+        assert idata2.sample_stats.sizes["draw"] == idata.sample_stats.sizes["draw"]
+        idata2.sample_stats.attrs["new_attr"] = 1
+        assert "new_attr" not in idata.sample_stats.attrs
+
+    @pytest.mark.parametrize("deep", [True, False])
+    def test_copy(self, data_random, deep):
+        idata = data_random
+        idata2 = idata.copy(deep=deep)
+        assert idata2 is not idata
+        assert idata2.groups() == idata.groups()
+        assert (
+            np.shares_memory(idata2.posterior["a"].values, idata.posterior["a"].values) is not deep
+        )
+        idata2.posterior["a"] = idata2.posterior["a"] + 1
+        idata2.attrs["new_attr"] = 1
+        del idata2.sample_stats
+        assert not idata2.posterior["a"].equals(idata.posterior["a"])
+        assert "new_attr" not in idata.attrs
+        assert "sample_stats" in idata.groups()
+
     def test_sel_chain_prior(self):
         idata = load_arviz_data("centered_eight")
         original_groups = getattr(idata, "_groups")
@@ -827,6 +874,24 @@ class TestInferenceData:  # pylint: disable=too-many-public-methods
         assert not test_data.empty
         assert set(test_data.columns).symmetric_difference(results) == set(["chain", "draw"])
 
+    def test_to_dataframe_values(self):
+        idata = from_dict(
+            posterior={"a": np.random.randn(2, 10, 12), "b": np.random.randn(2, 10)},
+            prior={"a": np.random.randn(1, 5, 12)},
+            sample_stats={"diverging": np.zeros((2, 10), dtype=bool)},
+        )
+        test_data = idata.to_dataframe(groups=["posterior", "prior", "sample_stats"])
+        assert test_data.shape == (20, 2 + 12 + 1 + 12 + 1)
+        assert list(test_data.columns[2:4]) == [
+            ("posterior", "a[0]", 0),
+            ("posterior", "a[1]", 1),
+        ]
+        assert test_data[("posterior", "a[11]", 11)].values.tolist() == (
+            idata.posterior["a"].values[..., 11].ravel().tolist()
+        )
+        assert test_data[("prior", "a[0]", 0)].isna().sum() == 15
+        assert test_data["draw"].dtype.kind == "i"
+
     def test_to_dataframe_bad(self):
         idata = from_dict(
             posterior={"a": np.random.randn(4, 100, 3, 4, 5), "b": np.random.randn(4, 100)},
@@ -895,6 +960,80 @@ class TestInferenceData:  # pylint: disable=too-many-public-methods
         assert escape(repr(idata)) in html
         xr.set_options(display_style=display_style)
 
+    def test_thin(self, data_random):
+        idata = data_random
+        idata_thin = idata.thin(5)
+        assert idata_thin.posterior.sizes["draw"] == idata.posterior.sizes["draw"] // 5
+        assert np.all(idata_thin.posterior["draw"] == idata.posterior["draw"][::5])
+        assert np.shares_memory(idata_thin.posterior["a"].values, idata.posterior["a"].values)
+        assert idata_thin.observed_data.identical(idata.observed_data)
+
+        # independent draws are only thinned to keep target_ess of them
+        n_draws = idata.posterior.sizes["draw"]
+        n_samples = idata.posterior.sizes["chain"] * n_draws
+        assert idata.thin().posterior.sizes["draw"] == n_draws
+        idata_thin = idata.thin(target_ess=100)
+        assert idata_thin.posterior.sizes["draw"] == len(range(0, n_draws, n_samples // 100))
+
+        idata_walk = from_dict(
+            posterior={"a": np.cumsum(np.random.randn(4, 1000), axis=1)},
+            sample_stats={"lp": np.random.randn(4, 1000)},
+        )
+        ess_walk = ess(idata_walk, method="bulk")["a"].item()
+        autocorr_draws = len(range(0, 1000, int(4000 // ess_walk)))
+        assert idata_walk.thin().posterior.sizes["draw"] == autocorr_draws
+        # a target_ess above the ESS can not be reached, the autocorrelation time is used
+        assert idata_walk.thin(target_ess=4 * ess_walk).posterior.sizes["draw"] == autocorr_draws
+        idata_thin = idata_walk.thin(target_ess=ess_walk / 2)
+        assert idata_thin.posterior.sizes["draw"] == len(
+            range(0, 1000, int(4000 // (ess_walk / 2)))
+        )
+        assert idata_thin.sample_stats.sizes["draw"] == idata_thin.posterior.sizes["draw"]
+        assert idata_thin.posterior.sizes["draw"] < autocorr_draws
+
+        idata_thin = idata.copy()
+        assert idata_thin.thin(groups="posterior", inplace=True) is None
+        assert idata_thin.sample_stats.sizes["draw"] == idata.sample_stats.sizes["draw"]
+
+    @pytest.mark.parametrize("kwargs", [{"factor": 0}, {"factor": 1.5}, {"target_ess": -1}])
+    def test_thin_error(self, data_random, kwargs):
+        with pytest.raises(ValueError):
+            data_random.thin(**kwargs)
+
+    def test_fingerprint(self, data_random):
+        idata = data_random
+        fingerprint = idata.fingerprint()
+        assert fingerprint == idata.fingerprint()
+        assert fingerprint == idata.copy().fingerprint()
+        assert idata.fingerprint(groups="posterior") != fingerprint
+        chunked = idata.chunk({"draw": 100}, groups="posterior_groups")
+        assert chunked.fingerprint() == fingerprint
+
+        idata2 = idata.copy()
+        idata2.posterior["a"] = idata2.posterior["a"] + 1
+        assert idata2.fingerprint() != fingerprint
+        assert idata2.fingerprint(groups="sample_stats") == idata.fingerprint(groups="sample_stats")
+
+    def test_memory_usage(self, data_random):
+        idata = data_random
+        usage = idata.memory_usage()
+        assert list(usage.columns) == ["dtype", "shape", "storage", "nbytes", "loaded_nbytes"]
+        assert (usage["storage"] == "memory").all()
+        assert usage.loc[("posterior", "a"), "nbytes"] == idata.posterior["a"].nbytes
+        assert usage["nbytes"].sum() == idata.nbytes
+        assert usage["loaded_nbytes"].sum() == idata.nbytes
+
+        buf = io.StringIO()
+        idata.info(memory=True, buf=buf)
+        info = buf.getvalue()
+        assert "memory" in info
+        for group in idata.groups():
+            assert group in info
+
+        with rc_context(rc={"data.repr_memory": True}):
+            html = idata._repr_html_()  # pylint: disable=protected-access
+        assert "loaded)" in html
+
     def test_add_groups(self, data_random):
         data = np.random.normal(size=(4, 500, 8))
         idata = data_random
@@ -1076,6 +1215,31 @@ def test_dict_to_dataset():
     assert set(dataset.b.coords) == {"chain", "draw", "c"}
 
 
+def test_dict_to_dataset_no_copy(tmp_path):
+    memmap = np.memmap(tmp_path / "memmap.dat", dtype=float, mode="w+", shape=(4, 100))
+    datadict = {"a": np.random.randn(4, 100, 3), "b": np.random.randn(4, 100), "c": memmap}
+    dataset = dict_to_dataset(datadict)
+    for var_name, ary in datadict.items():
+        assert np.shares_memory(dataset[var_name].values, ary)
+    ary = np.random.randn(100)
+    assert np.shares_memory(dict_to_dataset({"d": ary})["d"].values, ary)
+
+
+def test_dict_to_dataset_dask():
+    dask_array = pytest.importorskip("dask.array")
+    ary = dask_array.ones((4, 100, 3), chunks=(1, 100, 3))
+    dataset = dict_to_dataset({"a": ary, "b": np.ones((4, 100))})
+    assert dataset["a"].chunks == ((1, 1, 1, 1), (100,), (3,))
+    assert dataset["b"].chunks is None
+
+
+def test_dict_to_dataset_align():
+    datadict = {"a": np.ones((4, 100, 3)), "b": np.ones((4, 100, 5))}
+    dataset = dict_to_dataset(datadict, dims={"a": ["x"], "b": ["x"]})
+    assert dataset.sizes["x"] == 5
+    assert np.isnan(dataset["a"].sel(x=4)).all()
+
+
 def test_nested_dict_to_dataset():
     datadict = {
         "top": {"a": np.random.randn(100), "b": np.random.randn(1, 100, 10)},
@@ -1320,6 +1484,29 @@ class TestDataDict:
         with pytest.warns(UserWarning):
             from_dict(posterior=bad_posterior_dict)
 
+    def test_from_dict_dtype(self):
+        posterior = {"mu": np.random.randn(4, 100), "n": np.ones((4, 100), dtype=int)}
+        observed_data = {"y": np.random.randn(8)}
+        inference_data = from_dict(
+            posterior=posterior, observed_data=observed_data, dtype="float32"
+        )
+        assert inference_data.posterior["mu"].dtype == np.float32
+        assert inference_data.posterior["n"].dtype == int
+        assert inference_data.observed_data["y"].dtype == np.float32
+
+        inference_data = from_dict(
+            posterior=posterior, observed_data=observed_data, dtype={"posterior": "float32"}
+        )
+        assert inference_data.posterior["mu"].dtype == np.float32
+        assert inference_data.observed_data["y"].dtype == np.float64
+
+        with rc_context(rc={"data.float_dtype": "float32"}):
+            inference_data = from_dict(
+                posterior=posterior, observed_data=observed_data, dtype={"posterior": "float16"}
+            )
+        assert inference_data.posterior["mu"].dtype == np.float16
+        assert inference_data.observed_data["y"].dtype == np.float32
+
 
 class TestDataNetCDF:
     @pytest.fixture(scope="class")
@@ -1438,6 +1625,176 @@ class TestDataNetCDF:
         os.remove(filepath)
         assert not os.path.exists(filepath)
 
+    def test_memory_usage_lazy(self, data, eight_schools_params, tmpdir):
+        inference_data = self.get_inference_data(data, eight_schools_params)
+        filepath = os.path.join(str(tmpdir), "memory_testfile.nc")
+        inference_data.to_netcdf(filepath)
+
+        with rc_context(rc={"data.load": "lazy"}):
+            inference_data2 = from_netcdf(filepath)
+        usage = inference_data2.memory_usage(groups="posterior")
+        assert usage.loc[("posterior", "theta"), "storage"] == "disk"
+        assert usage.loc[("posterior", "theta"), "loaded_nbytes"] == 0
+        assert usage.loc[("posterior", "theta"), "nbytes"] == inference_data.posterior.theta.nbytes
+        buf = io.StringIO()
+        inference_data2.info(memory=True, buf=buf)
+        assert f"{filepath}: " in buf.getvalue()
+        assert (
+            _variable_storage(inference_data2.posterior["theta"].variable) == "disk"
+        ), "computing the memory usage must not load the data"
+
+        with rc_context(rc={"data.chunks": "auto"}):
+            inference_data3 = from_netcdf(filepath)
+        usage = inference_data3.memory_usage()
+        assert usage.loc[("posterior", "theta"), "storage"] == "dask"
+
+    def test_fingerprint_from_file(self, data, eight_schools_params, tmpdir):
+        inference_data = self.get_inference_data(data, eight_schools_params)
+        filepath = os.path.join(str(tmpdir), "fingerprint_testfile.nc")
+        inference_data.to_netcdf(filepath)
+
+        with rc_context(rc={"data.load": "lazy"}):
+            inference_data2 = from_netcdf(filepath)
+        fingerprint = inference_data2.fingerprint()
+        assert _variable_storage(inference_data2.posterior["theta"].variable) == "disk"
+        assert from_netcdf(filepath).fingerprint() == fingerprint
+        assert from_netcdf(filepath, defer_groups=True).fingerprint() == fingerprint
+
+        inference_data2.posterior["theta"] = inference_data2.posterior["theta"] * 2
+        assert inference_data2.fingerprint() != fingerprint
+
+        os.utime(filepath, ns=(0, 0))
+        assert from_netcdf(filepath).fingerprint() != fingerprint
+
+    def test_io_deferred_groups(self, data, eight_schools_params, tmpdir):
+        inference_data = self.get_inference_data(data, eight_schools_params)
+        filepath = os.path.join(str(tmpdir), "deferred_testfile.nc")
+        inference_data.to_netcdf(filepath)
+
+        inference_data2 = from_netcdf(filepath, defer_groups=True)
+        assert inference_data2.groups() == inference_data.groups()
+        assert all(
+            inference_data2._is_deferred(group)  # pylint: disable=protected-access
+            for group in inference_data2.groups()
+        )
+        assert "posterior" in inference_data2._repr_html_()  # pylint: disable=protected-access
+        usage = inference_data2.memory_usage()
+        assert (usage["storage"] == "deferred").all()
+        assert inference_data2.nbytes == 0
+        inference_data2.info(memory=True, buf=io.StringIO())
+        with rc_context(rc={"data.repr_memory": True}):
+            assert "deferred" in inference_data2._repr_html_()  # pylint: disable=protected-access
+
+        # saving does not load the deferred groups
+        filepath2 = os.path.join(str(tmpdir), "deferred_testfile2.nc")
+        inference_data2.to_netcdf(filepath2)
+        assert inference_data2._is_deferred("posterior")  # pylint: disable=protected-access
+
+        assert_identical(inference_data2.posterior, inference_data.posterior)
+        assert not inference_data2._is_deferred("posterior")  # pylint: disable=protected-access
+        assert inference_data2._is_deferred("prior")  # pylint: disable=protected-access
+        assert_identical(inference_data2["prior"], inference_data.prior)
+        del inference_data2.sample_stats
+        assert "sample_stats" not in inference_data2.groups()
+
+        inference_data3 = from_netcdf(filepath2)
+        for group, dataset in inference_data.items():
+            assert_identical(inference_data3[group], dataset)
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    @pytest.mark.parametrize("engine", ["h5netcdf", "netcdf4"])
+    def test_io_encoding(self, data, eight_schools_params, tmpdir, n_jobs, engine):
+        inference_data = self.get_inference_data(data, eight_schools_params)
+        filepath = os.path.join(str(tmpdir), "encoding_testfile.nc")
+        inference_data.to_netcdf(
+            filepath,
+            compress={"zlib": True, "complevel": 2, "shuffle": True},
+            chunks={"chain": 1},
+            encoding={"posterior": {"theta": {"complevel": 9, "chunksizes": (1, 10, 4)}}},
+            n_jobs=n_jobs,
+            engine=engine,
+        )
+
+        inference_data2 = from_netcdf(filepath, engine=engine)
+        for group, dataset in inference_data.items():
+            assert_identical(inference_data2[group].load(), dataset)
+        posterior = inference_data2.posterior
+        sizes = posterior.sizes
+        assert posterior["mu"].encoding["chunksizes"] == (1, sizes["draw"])
+        assert posterior["theta"].encoding["chunksizes"] == (1, 10, 4)
+        assert posterior["eta"].encoding["shuffle"]
+        assert posterior["eta"].encoding["complevel"] == 2
+        assert posterior["theta"].encoding["complevel"] == 9
+
+    def test_io_encoding_dtype_parallel(self, tmpdir):
+        h5py = pytest.importorskip("h5py")
+        values = np.random.randn(2, 50, 3)
+        values[0, :5] = np.nan
+        inference_data = from_dict(posterior={"a": values, "b": np.random.randn(2, 50)})
+        encoding = {
+            "posterior": {
+                "a": {"dtype": "float32", "zlib": True, "_FillValue": -99.0},
+                "b": {"dtype": "float32", "zlib": True},
+            }
+        }
+        datasets = []
+        for n_jobs in (1, 2):
+            filepath = os.path.join(str(tmpdir), f"dtype_testfile_{n_jobs}.nc")
+            inference_data.to_netcdf(filepath, encoding=encoding, n_jobs=n_jobs, engine="h5netcdf")
+            with h5py.File(filepath, mode="r") as file_handle:
+                assert file_handle["posterior/a"].dtype == np.float32
+                assert file_handle["posterior/b"].dtype == np.float32
+                assert np.sum(file_handle["posterior/a"][...] == -99.0) == 15
+            datasets.append(from_netcdf(filepath).posterior.load())
+        assert_identical(datasets[0], datasets[1])
+        assert np.isnan(datasets[1]["a"].values[0, :5]).all()
+        posterior = inference_data.posterior
+        assert np.array_equal(datasets[1]["b"], posterior["b"].astype(np.float32))
+
+    def test_writer(self, tmpdir):
+        filepath = os.path.join(str(tmpdir), "writer_testfile.nc")
+        writer = InferenceDataWriter(
+            filepath,
+            {"posterior": {"mu": (), "theta": (8,)}},
+            chains=2,
+            coords={"school": np.arange(8)},
+            dims={"theta": ["school"]},
+            attrs={"test": 1},
+        )
+        for i in range(3):
+            writer.append({"mu": np.full((2, 5), i), "theta": np.zeros((2, 5, 8))})
+            partial_idata = from_netcdf(filepath)
+            assert partial_idata.posterior.sizes["draw"] == 5 * (i + 1)
+            partial_idata.close()
+        idata = writer.finalize()
+        assert idata.attrs["test"] == 1
+        assert np.all(idata.posterior["draw"] == np.arange(15))
+        assert np.all(idata.posterior["mu"].values[:, 10:] == 2)
+        assert idata.posterior["theta"].dims == ("chain", "draw", "school")
+        idata.close()
+
+    @pytest.mark.parametrize("chunks", ["auto", {"school": 3}])
+    def test_io_chunks(self, data, eight_schools_params, tmpdir, chunks):
+        pytest.importorskip("dask")
+        inference_data = self.get_inference_data(data, eight_schools_params)
+        filepath = os.path.join(str(tmpdir), "chunks_testfile.nc")
+        inference_data.to_netcdf(filepath)
+
+        inference_data2 = from_netcdf(
+            filepath, chunks=chunks, group_kwargs={"observed_data": {"chunks": None}}
+        )
+        theta_chunks = inference_data2.posterior["theta"].chunks
+        sizes = inference_data.posterior.sizes
+        assert theta_chunks[:2] == ((sizes["chain"],), (sizes["draw"],))
+        if chunks != "auto":
+            assert theta_chunks[2] == (3, 3, 2)
+        assert inference_data2.observed_data["y"].chunks is None
+        assert_identical(inference_data2.posterior.load(), inference_data.posterior)
+
+        with rc_context(rc={"data.chunks": chunks}):
+            inference_data3 = from_netcdf(filepath)
+        assert inference_data3.posterior["theta"].chunks == theta_chunks
+
     def test_empty_inference_data_object(self):
         inference_data = InferenceData()
         here = os.path.dirname(os.path.abspath(__file__))
@@ -1451,11 +1808,13 @@ class TestDataNetCDF:
 
 
 class TestJSON:
-    def test_json_converters(self, models):
+    @pytest.mark.parametrize("array_format", ["list", "base64", "binary"])
+    def test_json_converters(self, models, array_format):
         idata = models.model_1
 
         filepath = os.path.realpath("test.json")
-        idata.to_json(filepath)
+        idata.to_json(filepath, array_format=array_format)
+        assert os.path.exists(f"{filepath}.bin") is (array_format == "binary")
 
         idata_copy = from_json(filepath)
         for group in idata._groups_all:  # pylint: disable=protected-access
@@ -1465,6 +1824,24 @@ class TestJSON:
 
         os.remove(filepath)
         assert not os.path.exists(filepath)
+        if array_format == "binary":
+            os.remove(f"{filepath}.bin")
+
+    def test_json_binary_dtypes(self, tmpdir):
+        idata = from_dict(
+            posterior={"a": np.random.randn(2, 10, 3).astype(">f4")},
+            sample_stats={"diverging": np.zeros((2, 10), dtype=bool)},
+            coords={"letter": ["x", "y", "z"]},
+            dims={"a": ["letter"]},
+        )
+        filepath = os.path.join(tmpdir, "test.json")
+        to_json(idata, filepath, array_format="base64")
+        idata_copy = from_json(filepath)
+        assert idata_copy.posterior["a"].dtype == np.dtype("<f4")
+        assert idata_copy.sample_stats["diverging"].dtype == bool
+        assert idata_copy.posterior.equals(idata.posterior)
+        with pytest.raises(ValueError, match="array_format"):
+            idata.to_json(filepath, array_format="numpy")
 
 
 @pytest.mark.skipif(
@@ -0,0 +1,69 @@
+# pylint: disable=redefined-outer-name
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ... import InferenceData, from_dict, from_parquet, to_parquet
+from ..helpers import (  # pylint: disable=unused-import
+    chains,
+    draws,
+    eight_schools_params,
+    importorskip,
+)
+
+pa = importorskip("pyarrow")  # pylint: disable=invalid-name
+
+
+class TestDataParquet:
+    @pytest.fixture(scope="class")
+    def inference_data(self, draws, chains, eight_schools_params):
+        return from_dict(
+            posterior={
+                "mu": np.random.randn(chains, draws),
+                "theta": np.random.randn(chains, draws, 8),
+            },
+            sample_stats={"diverging": np.zeros((chains, draws), dtype=bool)},
+            observed_data=eight_schools_params,
+            coords={"school": [f"school_{i}" for i in range(8)]},
+            dims={"theta": ["school"], "y": ["school"], "sigma": ["school"]},
+            attrs={"test": 1},
+        )
+
+    def test_to_arrow_tables(self, inference_data):
+        tables = inference_data.to_arrow_tables()
+        assert set(tables) == set(inference_data.groups())
+        posterior = tables["posterior"]
+        assert posterior.column_names == ["chain", "draw", "mu", "theta"]
+        assert posterior.num_rows == inference_data.posterior.sizes["chain"] * (
+            inference_data.posterior.sizes["draw"]
+        )
+        assert pa.types.is_fixed_size_list(posterior.schema.field("theta").type)
+        assert np.all(
+            posterior.column("mu").to_numpy() == inference_data.posterior["mu"].values.ravel()
+        )
+        assert tables["observed_data"].num_rows == 1
+
+        inference_data2 = InferenceData.from_arrow_tables(tables)
+        assert np.shares_memory(
+            inference_data2.posterior["theta"].values, inference_data.posterior["theta"].values
+        )
+        for group in inference_data.groups():
+            assert inference_data2[group].identical(inference_data[group])
+
+    def test_io_function(self, inference_data):
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            path = os.path.join(tmp_dir, "parquet")
+            to_parquet(inference_data, path)
+            assert os.path.exists(os.path.join(path, "posterior.parquet"))
+
+            inference_data2 = from_parquet(path)
+            assert inference_data2.attrs["test"] == 1
+            for group in inference_data.groups():
+                assert inference_data2[group].identical(inference_data[group])
+
+            inference_data3 = from_parquet(path, groups=["posterior"], var_names=["theta"])
+            assert inference_data3.groups() == ["posterior"]
+            assert list(inference_data3.posterior.data_vars) == ["theta"]
+            assert inference_data3.posterior["theta"].equals(inference_data.posterior["theta"])
@@ -7,8 +7,9 @@ from typing import Mapping
 import numpy as np
 import pytest
 
-from ... import InferenceData, from_dict
+from ... import InferenceData, InferenceDataWriter, from_dict
 from ... import to_zarr, from_zarr
+from ...rcparams import rc_context
 
 from ..helpers import (  # pylint: disable=unused-import
     chains,
@@ -141,3 +142,146 @@ class TestDataZarr:
             assert not fails
 
             assert inference_data2.attrs["test"] == 1
+
+    def test_io_deferred_groups(self, data, eight_schools_params):
+        inference_data = self.get_inference_data(data, eight_schools_params, fill_attrs=True)
+
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            inference_data.to_zarr(store=filepath)
+
+            inference_data2 = from_zarr(filepath, defer_groups=True)
+            assert set(inference_data2.groups()) == set(inference_data.groups())
+            assert inference_data2._is_deferred("posterior")  # pylint: disable=protected-access
+            assert inference_data2.attrs["test"] == 1
+
+            posterior = inference_data2.posterior
+            assert posterior.equals(inference_data.posterior)
+            assert not inference_data2._is_deferred("posterior")  # pylint: disable=protected-access
+            assert inference_data2._is_deferred("prior")  # pylint: disable=protected-access
+
+    def test_fingerprint(self, data, eight_schools_params):
+        inference_data = self.get_inference_data(data, eight_schools_params, fill_attrs=False)
+
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            inference_data.to_zarr(store=filepath)
+
+            fingerprint = from_zarr(filepath).fingerprint()
+            assert from_zarr(filepath, defer_groups=True).fingerprint() == fingerprint
+
+            inference_data.posterior["theta"] = inference_data.posterior["theta"] + 1
+            inference_data.to_zarr(store=filepath, groups=["posterior"])
+            inference_data2 = from_zarr(filepath)
+            assert inference_data2.fingerprint() != fingerprint
+            assert inference_data2.fingerprint(groups="prior") == from_zarr(filepath).fingerprint(
+                groups="prior"
+            )
+
+    def test_fingerprint_no_stat_on_open(self, data, eight_schools_params, monkeypatch):
+        inference_data = self.get_inference_data(data, eight_schools_params, fill_attrs=False)
+
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            inference_data.to_zarr(store=filepath, chunks={"chain": 1, "draw": 10})
+            chunk_files = {
+                os.path.join(filepath, group, var_name, chunk)
+                for group in inference_data.groups()
+                for var_name in inference_data[group].data_vars
+                for chunk in os.listdir(os.path.join(filepath, group, var_name))
+                if not chunk.startswith(".")
+            }
+
+            stat_calls = []
+            stat = os.stat
+
+            def counting_stat(path, *args, **kwargs):
+                stat_calls.append(os.fspath(path))
+                return stat(path, *args, **kwargs)
+
+            monkeypatch.setattr(os, "stat", counting_stat)
+            with rc_context(rc={"data.load": "lazy"}):
+                inference_data2 = from_zarr(filepath)
+            assert not chunk_files.intersection(stat_calls)
+            inference_data2.fingerprint()
+            assert chunk_files.issubset(stat_calls)
+
+    def test_io_chunks(self, data, eight_schools_params):
+        pytest.importorskip("dask")
+        inference_data = self.get_inference_data(data, eight_schools_params, fill_attrs=False)
+
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            inference_data.to_zarr(store=filepath)
+
+            inference_data2 = from_zarr(
+                filepath, chunks={"school": 4}, group_kwargs={"prior": {"chunks": "auto"}}
+            )
+            sizes = inference_data.posterior.sizes
+            assert inference_data2.posterior["theta"].chunks == (
+                (sizes["chain"],),
+                (sizes["draw"],),
+                (4, 4),
+            )
+            assert inference_data2.prior["theta"].chunks[2] == (8,)
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_io_consolidated(self, data, eight_schools_params, n_jobs):
+        numcodecs = pytest.importorskip("numcodecs")
+        inference_data = self.get_inference_data(data, eight_schools_params, fill_attrs=True)
+
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            inference_data.to_zarr(
+                store=filepath,
+                chunks={"posterior": {"draw": 10}},
+                compressor={"prior": numcodecs.Zlib(level=1)},
+                encoding={"observed_data": {"y": {"chunks": (4,)}}},
+                n_jobs=n_jobs,
+            )
+            assert os.path.exists(os.path.join(filepath, ".zmetadata"))
+            zarr_handle = zarr.open_consolidated(filepath, mode="r")
+            assert zarr_handle["posterior/theta"].chunks == (
+                inference_data.posterior.sizes["chain"],
+                10,
+                8,
+            )
+            assert zarr_handle["prior/theta"].compressor == numcodecs.Zlib(level=1)
+            assert zarr_handle["observed_data/y"].chunks == (4,)
+
+            inference_data2 = from_zarr(filepath, n_jobs=n_jobs)
+            assert set(inference_data2.groups()) == set(inference_data.groups())
+            assert inference_data2.attrs["test"] == 1
+            for group in inference_data.groups():
+                assert inference_data2[group].equals(inference_data[group])
+
+    def test_writer(self):
+        with TemporaryDirectory(prefix="arviz_tests_") as tmp_dir:
+            filepath = os.path.join(tmp_dir, "zarr")
+            writer = InferenceDataWriter(
+                filepath,
+                {"posterior": {"mu": (), "theta": ((8,), "float32")}, "sample_stats": {"lp": ()}},
+                chains=2,
+                coords={"school": np.arange(8)},
+                dims={"theta": ["school"]},
+                attrs={"test": 1},
+            )
+            for i in range(3):
+                writer.append({"mu": np.full((2, 5), i), "theta": np.zeros((2, 5, 8))})
+                partial_idata = from_zarr(filepath)
+                assert partial_idata.posterior.sizes["draw"] == 5 * (i + 1)
+                assert partial_idata.sample_stats.sizes["draw"] == 0
+            with pytest.raises(ValueError, match="has shape"):
+                writer.append({"mu": np.zeros((3, 5)), "theta": np.zeros((3, 5, 8))})
+            writer.append({"lp": np.zeros((2, 15))}, group="sample_stats")
+
+            idata = writer.finalize()
+            assert idata.attrs["test"] == 1
+            assert idata.posterior["theta"].dtype == np.float32
+            assert idata.posterior["theta"].dims == ("chain", "draw", "school")
+            assert np.all(idata.posterior["draw"] == np.arange(15))
+            assert np.all(idata.posterior["mu"].values[:, 5:10] == 1)
+            assert idata.sample_stats.sizes["draw"] == 15
+            assert os.path.exists(os.path.join(filepath, ".zmetadata"))
+            with pytest.raises(ValueError, match="finalize"):
+                writer.append({"lp": np.zeros((2, 15))}, group="sample_stats")
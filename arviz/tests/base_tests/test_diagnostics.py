@@ -16,9 +16,17 @@ from ...sel_utils import xarray_var_iter
 from ...stats import bfmi, ess, mcse, rhat
 from ...stats.diagnostics import (
     _ess,
+    _ess_batch,
+    _ess_bulk,
+    _ess_evolution,
+    _ess_local,
+    _ess_local_batch,
     _ess_quantile,
+    _ess_quantile_batch,
+    _ess_tail,
     _mc_error,
     _mcse_quantile,
+    _mcse_quantile_batch,
     _multichain_statistics,
     _rhat,
     _rhat_rank,
@@ -362,6 +370,39 @@ class TestDiagnostics:
             ess_hat = ess(data, var_names=var_names, method=method, relative=relative)
         assert np.all(ess_hat.mu.values > n_low)  # This might break if the data is regenerated
 
+    @pytest.mark.parametrize("relative", (True, False))
+    def test_effective_sample_size_batch(self, data, relative):
+        ary = data.theta.values
+        ess_batch = _ess_batch(np.moveaxis(ary, -1, 0), relative=relative)
+        assert_almost_equal(ess_batch, [_ess(ary[..., i], relative=relative) for i in range(8)])
+        probs = np.linspace(0.05, 0.95, 10)
+        ary = data.mu.values
+        assert_almost_equal(
+            _ess_quantile_batch(ary, probs, relative=relative),
+            [_ess_quantile(ary, prob, relative=relative) for prob in probs],
+        )
+        intervals = np.stack((probs - 0.05, probs + 0.05), axis=-1)
+        assert_almost_equal(
+            _ess_local_batch(ary, intervals, relative=relative),
+            [_ess_local(ary, interval, relative=relative) for interval in intervals],
+        )
+
+    @pytest.mark.parametrize("method", ("bulk", "tail"))
+    def test_effective_sample_size_evolution(self, data, method):
+        ary = data.mu.values
+        n_draws = [3, 25, 101, 250, 500]
+        ess_func = _ess_bulk if method == "bulk" else _ess_tail
+        ess_evolution = _ess_evolution(ary, n_draws, method=method)
+        assert np.isnan(ess_evolution[0])
+        assert_almost_equal(ess_evolution[1:], [ess_func(ary[:, :n]) for n in n_draws[1:]])
+
+    def test_mcse_quantile_batch(self, data):
+        probs = np.linspace(0.05, 0.95, 10)
+        ary = data.mu.values
+        assert_almost_equal(
+            _mcse_quantile_batch(ary, probs), [_mcse_quantile(ary, prob) for prob in probs]
+        )
+
     @pytest.mark.parametrize("mcse_method", ("mean", "sd", "median", "quantile"))
     def test_mcse_array(self, mcse_method):
         if mcse_method == "quantile":
@@ -5,20 +5,33 @@ import os
 import numpy as np
 import pytest
 import xarray as xr
+from scipy.stats import rankdata
 
 from ...data import from_dict
-from ...plots.backends.matplotlib import dealiase_sel_kwargs, matplotlib_kwarg_dealiaser
+from ...plots.backends.matplotlib import (
+    add_lines,
+    add_segments,
+    dealiase_sel_kwargs,
+    matplotlib_kwarg_dealiaser,
+    rasterize_dense_artists,
+)
 from ...plots.plot_utils import (
+    bin_samples,
+    compute_rank_histograms,
     compute_ranks,
+    downsample_trace,
     filter_plotters_list,
     format_sig_figs,
     get_plotting_function,
     make_2d,
+    pair_histograms,
     set_bokeh_circular_ticks_labels,
+    summary_lookup,
     vectorized_to_hex,
 )
 from ...rcparams import rc_context
-from ...sel_utils import xarray_sel_iter, xarray_to_ndarray
+from ...sel_utils import xarray_sel_iter, xarray_to_ndarray, xarray_var_iter
+from ...stats import summary
 from ...stats.density_utils import get_bins
 from ...utils import get_coords
 
@@ -288,6 +301,59 @@ def test_mpl_dealiase_sel_kwargs():
     assert res["line_color"] == "red"
 
 
+def test_mpl_add_lines():
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    _, ax = plt.subplots()
+    x = np.linspace(0, 1, 5)
+    y = np.random.randn(10, 5)
+    collection = add_lines(ax, x, y, drawstyle="steps-pre", color="C1", linewidth=2)
+    assert isinstance(collection, LineCollection)
+    assert len(collection.get_segments()) == 10
+    assert collection.get_segments()[0].shape == (9, 2)
+    lines = add_lines(ax, x, y, marker=".", linewidth=0)
+    assert len(lines) == 1
+    assert len(lines[0].get_xdata()) == 50
+    lines = add_lines(ax, x, y, marker=".")
+    assert len(lines) == 10
+    collection = add_segments(ax, [0, 1], [2, 3], [0, 1], [0, 1], linewidths=[1, 2])
+    np.testing.assert_equal(collection.get_segments()[1], [[1, 1], [3, 1]])
+    plt.close("all")
+
+
+def test_rasterize_dense_artists():
+    import matplotlib.pyplot as plt
+
+    _, axes = plt.subplots(1, 2)
+    (dense_line,) = axes[0].plot(np.random.randn(100))
+    (sparse_line,) = axes[0].plot(np.random.randn(10))
+    scatter = axes[1].scatter(*np.random.randn(2, 100))
+    collection = add_lines(axes[1], np.arange(5), np.random.randn(30, 5))
+    text = axes[1].text(0, 0, "label")
+    rasterize_dense_artists(axes)
+    assert not dense_line.get_rasterized()
+    rasterize_dense_artists((axes, {"other": "output"}), threshold=50)
+    assert dense_line.get_rasterized()
+    assert not sparse_line.get_rasterized()
+    assert scatter.get_rasterized()
+    assert collection.get_rasterized()
+    assert not text.get_rasterized()
+    plt.close("all")
+
+
+@pytest.mark.skipif(skip_tests, reason="test requires bokeh which is not installed")
+def test_bokeh_multi_line_data():
+    from ...plots.backends.bokeh import multi_line_data
+
+    xs, ys = multi_line_data(np.arange(4), np.ones((3, 4)))
+    assert len(xs) == len(ys) == 3
+    np.testing.assert_equal(xs[2], np.arange(4))
+    xs, ys = multi_line_data(np.arange(4), np.arange(12).reshape(3, 4), steps=True)
+    np.testing.assert_equal(xs[0], [0, 0, 1, 1, 2, 2, 3])
+    np.testing.assert_equal(ys[0], [0, 1, 1, 2, 2, 3, 3])
+
+
 @pytest.mark.skipif(skip_tests, reason="test requires bokeh which is not installed")
 def test_bokeh_dealiase_sel_kwargs():
     """Check bokeh dealiase_sel_kwargs behaviour.
@@ -327,9 +393,9 @@ def test_set_bokeh_circular_ticks_labels():
 
 def test_compute_ranks():
     pois_data = np.array([[5, 4, 1, 4, 0], [2, 8, 2, 1, 1]])
-    expected = np.array([[9.0, 7.0, 3.0, 8.0, 1.0], [5.0, 10.0, 6.0, 2.0, 4.0]])
     ranks = compute_ranks(pois_data)
-    np.testing.assert_equal(ranks, expected)
+    np.testing.assert_equal(np.sort(ranks.ravel()), np.arange(1, 11))
+    assert np.all(np.diff(pois_data.ravel()[np.argsort(ranks.ravel())]) >= 0)
 
     norm_data = np.array(
         [
@@ -340,3 +406,86 @@ def test_compute_ranks():
     expected = np.array([[7.0, 1.0, 3.0, 9.0, 8.0], [10.0, 6.0, 4.0, 2.0, 5.0]])
     ranks = compute_ranks(norm_data)
     np.testing.assert_equal(ranks, expected)
+
+    tied_data = np.round(np.random.default_rng(0).normal(size=(3, 4, 50)), 1)
+    ranks = compute_ranks(tied_data)
+    for ary, ary_ranks in zip(tied_data, ranks):
+        np.testing.assert_equal(ary_ranks, rankdata(ary, method="average").reshape(ary.shape))
+
+
+def test_compute_rank_histograms():
+    rng = np.random.default_rng(0)
+    values = [rng.normal(size=(4, 100)), rng.poisson(2, size=(4, 100)), rng.normal(size=(2, 10))]
+    histograms = compute_rank_histograms(values, bins=7)
+    for ary, (bin_ary, counts) in zip(values, histograms):
+        ranks = compute_ranks(ary)
+        expected_bins = np.histogram_bin_edges(ranks, bins=7, range=(0, ranks.size))
+        np.testing.assert_allclose(bin_ary, expected_bins)
+        np.testing.assert_equal(counts, [np.histogram(row, bins=bin_ary)[0] for row in ranks])
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample_trace(method):
+    rng = np.random.default_rng(0)
+    dataset = from_dict(
+        {"a": rng.normal(size=(2, 5000)).cumsum(-1), "b": rng.normal(size=(2, 5000, 3))}
+    ).posterior
+    values, draws = downsample_trace(dataset, method=method, max_points=200)
+    assert values["a"].shape == (2, 200)
+    assert values["b"].shape == (2, 200, 3)
+    assert draws["b"].dims == dataset["b"].dims
+    assert np.all(np.diff(draws["a"].values, axis=1) >= 0)
+    chain_a = dataset["a"].values[1]
+    np.testing.assert_array_equal(values["a"].values[1], chain_a[draws["a"].values[1]])
+    if method == "minmax":
+        assert values["a"].max("draw").equals(dataset["a"].max("draw"))
+        assert values["b"].min("draw").equals(dataset["b"].min("draw"))
+    else:
+        assert draws["a"][:, 0].values.tolist() == [0, 0]
+        assert draws["a"][:, -1].values.tolist() == [4999, 4999]
+
+    assert downsample_trace(dataset, method=method, max_points=5000) is None
+
+
+def test_downsample_trace_error():
+    dataset = from_dict({"a": np.zeros((2, 100))}).posterior
+    with pytest.raises(ValueError, match="lttb"):
+        downsample_trace(dataset, method="every_other", max_points=10)
+
+
+def test_pair_histograms():
+    x = np.array([0.0, 0.1, 0.5, 1.0, np.nan])
+    y = np.array([0.0, 1.0, 1.0, 1.0, 0.0])
+    z = np.array([1.0, 0.2, 0.3, np.inf, 0.0])
+    codes_x, edges_x = bin_samples(x, 2)
+    np.testing.assert_array_equal(codes_x, [0, 0, 1, 1, 2])
+    np.testing.assert_allclose(edges_x, [0, 0.5, 1])
+    binned = [bin_samples(values, 4) for values in (x, y, z)]
+    codes = np.stack([codes for codes, _ in binned])
+    pairs = [(0, 1), (0, 2), (1, 2)]
+    counts = pair_histograms(codes, 4, pairs)
+    assert counts.shape == (3, 4, 4)
+    for (idx_x, idx_y), pair_counts in zip(pairs, counts):
+        values_x, values_y = (x, y, z)[idx_x], (x, y, z)[idx_y]
+        edges_x, edges_y = binned[idx_x][1], binned[idx_y][1]
+        finite = np.isfinite(values_x) & np.isfinite(values_y)
+        expected, *_ = np.histogram2d(values_x[finite], values_y[finite], bins=(edges_x, edges_y))
+        np.testing.assert_array_equal(pair_counts, expected)
+
+
+def test_summary_lookup():
+    posterior = from_dict(
+        {"a": np.random.randn(2, 50), "b": np.random.randn(2, 50, 3)},
+        coords={"x": ["u", "v", "w"]},
+        dims={"b": ["x"]},
+    ).posterior
+    stats = summary(posterior, fmt="xarray", round_to="none")
+    lookup = summary_lookup(stats)
+    for var_name, selection, _, _ in xarray_var_iter(posterior, combined=True):
+        values = lookup(var_name, selection)
+        assert values["mean"] == stats[var_name].sel(metric="mean", **selection).item()
+        assert values.keys() == set(stats.metric.values)
+    assert not lookup("c", {})
+    assert not lookup("b", {})
+    assert not lookup("b", {"x": "z"})
+    assert not summary_lookup(None)("a", {})
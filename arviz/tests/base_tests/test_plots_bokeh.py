@@ -37,7 +37,7 @@ from ...plots import (  # pylint: disable=wrong-import-position
     plot_violin,
 )
 from ...rcparams import rc_context, rcParams  # pylint: disable=wrong-import-position
-from ...stats import compare, hdi, loo, waic  # pylint: disable=wrong-import-position
+from ...stats import compare, hdi, loo, summary, waic  # pylint: disable=wrong-import-position
 from ..helpers import (  # pylint: disable=unused-import, wrong-import-position
     create_model,
     create_multidimensional_model,
@@ -135,6 +135,18 @@ def test_plot_density_one_var():
     assert axes.size == 1
 
 
+def test_plot_density_stats(models):
+    stats = [
+        summary(model, fmt="xarray", round_to="none") for model in (models.model_1, models.model_2)
+    ]
+    axes = plot_density(
+        [models.model_1, models.model_2], hdi_markers="v", stats=stats, backend="bokeh", show=False
+    )
+    assert axes.shape
+    with pytest.raises(ValueError):
+        plot_density([models.model_1, models.model_2], stats=stats[0], backend="bokeh", show=False)
+
+
 def test_plot_density_bad_kwargs(models):
     obj = [getattr(models, model_fit) for model_fit in ["model_1", "model_2"]]
     with pytest.raises(ValueError):
@@ -183,6 +195,8 @@ def test_plot_separation(kwargs):
         {"kind": "rank_bars"},
         {"lines": [("mu", {}, [1, 2])]},
         {"lines": [("mu", {}, 8)]},
+        {"downsample": "lttb", "downsample_points": 100},
+        {"downsample": "minmax", "downsample_points": 100, "compact": True, "combined": True},
     ],
 )
 def test_plot_trace(models, kwargs):
@@ -195,6 +209,61 @@ def test_plot_trace_discrete(discrete_model):
     assert axes.shape
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"kind": "rank_bars"},
+        {"downsample": "lttb", "downsample_points": 100},
+        {"downsample": "lttb", "downsample_points": 300},
+    ],
+)
+def test_plot_trace_update(models, monkeypatch, kwargs):
+    from ...plots.backends.bokeh import traceplot as bokeh_traceplot
+
+    posterior = models.model_1.posterior
+    n_draws = posterior.sizes["draw"]
+    axes = plot_trace(posterior.isel(draw=slice(200)), backend="bokeh", show=False, **kwargs)
+    figures = list(axes.ravel())
+    n_renderers = [len(fig.renderers) for fig in figures]
+
+    converted_draws = []
+    var_iter = bokeh_traceplot.xarray_var_iter
+
+    def recording_var_iter(data, *args, **kwargs):
+        converted_draws.append(data.sizes["draw"])
+        return var_iter(data, *args, **kwargs)
+
+    def no_figure(*args, **kwargs):
+        raise AssertionError("no figure should be created when updating")
+
+    monkeypatch.setattr(bokeh_traceplot, "xarray_var_iter", recording_var_iter)
+    monkeypatch.setattr(bokeh_traceplot.bkp, "figure", no_figure)
+    updated = plot_trace(posterior, backend="bokeh", show=False, update=axes, **kwargs)
+    assert updated is axes
+    assert all(old is new for old, new in zip(figures, updated.ravel()))
+    assert [len(fig.renderers) for fig in figures] == n_renderers
+    sources = {
+        renderer.data_source
+        for fig in axes.ravel()
+        for renderer in fig.renderers
+        if "arviz_stream" in renderer.data_source.tags
+    }
+    if kwargs:
+        # the draws are not plotted as lines, they are converted again
+        assert not sources
+    else:
+        # only the new draws are converted and streamed to the existing sources
+        assert converted_draws == [n_draws - 200]
+        assert sources
+        assert all(len(source.data["draw"]) == n_draws for source in sources)
+
+    with pytest.raises(ValueError):
+        plot_trace(posterior, var_names="mu", backend="bokeh", show=False, update=axes)
+    with pytest.raises(ValueError):
+        plot_trace(posterior, backend="matplotlib", show=False, update=axes)
+
+
 def test_plot_trace_max_subplots_warning(models):
     with pytest.warns(UserWarning):
         with rc_context(rc={"plot.max_subplots": 2}):
@@ -547,11 +616,52 @@ def test_plot_forest_rope_exception():
     assert "Argument `rope` must be None, a dictionary like" in str(err.value)
 
 
+@pytest.mark.parametrize("kind", ["forestplot", "ridgeplot"])
+def test_plot_forest_stats(models, kind):
+    stats = [
+        summary(model, fmt="xarray", round_to="none") for model in (models.model_1, models.model_2)
+    ]
+    stats[0]["mu"].loc[{"metric": "hdi_3%"}] = -100
+    axes = plot_forest(
+        [models.model_1, models.model_2],
+        kind=kind,
+        combined=True,
+        ess=True,
+        r_hat=True,
+        stats=stats,
+        backend="bokeh",
+        show=False,
+    )
+    assert axes.shape
+    with pytest.raises(ValueError):
+        plot_forest([models.model_1, models.model_2], stats=stats[0], backend="bokeh", show=False)
+
+
 def test_plot_forest_single_value():
     axes = plot_forest({"x": [1]}, backend="bokeh", show=False)
     assert axes.shape
 
 
+def test_plot_forest_update(models):
+    axes = plot_forest(models.model_1, r_hat=True, ess=True, backend="bokeh", show=False)
+    figures = list(axes.ravel())
+    old_data = [[dict(renderer.data_source.data) for renderer in fig.renderers] for fig in figures]
+    updated = plot_forest(
+        models.model_2, r_hat=True, ess=True, backend="bokeh", show=False, update=axes
+    )
+    assert updated is axes
+    assert all(old is new for old, new in zip(figures, updated.ravel()))
+    new_data = [[renderer.data_source.data for renderer in fig.renderers] for fig in figures]
+    assert [len(data) for data in new_data] == [len(data) for data in old_data]
+    assert any(
+        any(not np.array_equal(old[key], new[key]) for key in old)
+        for fig_old, fig_new in zip(old_data, new_data)
+        for old, new in zip(fig_old, fig_new)
+    )
+    with pytest.raises(ValueError):
+        plot_forest(models.model_2, backend="bokeh", show=False, update=axes)
+
+
 @pytest.mark.parametrize("model_fits", [["model_1"], ["model_1", "model_2"]])
 def test_plot_forest_bad(models, model_fits):
     obj = [getattr(models, model_fit) for model_fit in model_fits]
@@ -780,6 +890,8 @@ def test_plot_mcse_no_divergences(models):
             "coords": {"school": [0, 1]},
             "textsize": 20,
         },
+        {"kind": "density", "var_names": ["theta"]},
+        {"kind": ["density", "kde"], "divergences": True, "var_names": ["mu", "tau"]},
         {
             "point_estimate": "mean",
             "reference_values": {"mu": 0, "tau": 0},
@@ -792,7 +904,9 @@ def test_plot_pair(models, kwargs):
     assert np.any(ax)
 
 
-@pytest.mark.parametrize("kwargs", [{"kind": "scatter"}, {"kind": "kde"}, {"kind": "hexbin"}])
+@pytest.mark.parametrize(
+    "kwargs", [{"kind": "scatter"}, {"kind": "kde"}, {"kind": "hexbin"}, {"kind": "density"}]
+)
 def test_plot_pair_2var(discrete_model, kwargs):
     ax = plot_pair(
         discrete_model, ax=np.atleast_2d(bkp.figure()), backend="bokeh", show=False, **kwargs
@@ -1047,6 +1161,21 @@ def test_plot_posterior_point_estimates(models, point_estimate):
     assert axes.shape == (1, 2)
 
 
+@pytest.mark.parametrize("point_estimate", ["mean", "median", "mode"])
+def test_plot_posterior_stats(models, point_estimate):
+    stats = summary(models.model_1, var_names="mu", fmt="xarray", round_to="none")
+    stats["mu"].loc[{"metric": "hdi_3%"}] = -100
+    axes = plot_posterior(
+        models.model_1,
+        var_names="mu",
+        point_estimate=point_estimate,
+        stats=stats,
+        backend="bokeh",
+        show=False,
+    )
+    assert axes.shape
+
+
 def test_plot_posterior_skipna():
     sample = np.linspace(0, 1)
     sample[:10] = np.nan
@@ -8,6 +8,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from matplotlib import animation
+from matplotlib.collections import LineCollection
 from pandas import DataFrame
 from scipy.stats import gaussian_kde, norm
 import xarray as xr
@@ -42,9 +43,10 @@ from ...plots import (
     plot_trace,
     plot_ts,
     plot_violin,
+    render_batch,
 )
 from ...rcparams import rc_context, rcParams
-from ...stats import compare, hdi, loo, waic
+from ...stats import compare, hdi, loo, summary, waic
 from ...stats.density_utils import kde as _kde
 from ...utils import _cov, BehaviourChangeWarning
 from ...plots.plot_utils import plot_point_interval
@@ -189,6 +191,16 @@ def test_plot_density_nonstring_varnames():
     assert axes.size == 3
 
 
+def test_plot_density_stats(models):
+    stats = [
+        summary(model, fmt="xarray", round_to="none") for model in (models.model_1, models.model_2)
+    ]
+    axes = plot_density([models.model_1, models.model_2], hdi_markers="v", stats=stats)
+    assert axes.shape
+    with pytest.raises(ValueError):
+        plot_density([models.model_1, models.model_2], stats=stats[0])
+
+
 def test_plot_density_bad_kwargs(models):
     obj = [getattr(models, model_fit) for model_fit in ["model_1", "model_2"]]
     with pytest.raises(ValueError):
@@ -242,6 +254,8 @@ def test_plot_separation(kwargs):
         {"lines": [("mu", {}, 8)]},
         {"circ_var_names": ["mu"]},
         {"circ_var_names": ["mu"], "circ_var_units": "degrees"},
+        {"downsample": "lttb", "downsample_points": 100},
+        {"downsample": "minmax", "downsample_points": 100, "compact": True, "combined": True},
     ],
 )
 def test_plot_trace(models, kwargs):
@@ -272,6 +286,27 @@ def test_plot_trace_legend(compact, combined):
         assert not compact_legend
 
 
+def test_plot_trace_downsample(models):
+    draws = models.model_1.posterior.sizes["draw"]
+    axes = plot_trace(
+        models.model_1, var_names="mu", divergences=False, downsample="lttb", downsample_points=50
+    )
+    assert all(len(line.get_xdata()) == 50 for line in axes[0, 1].get_lines())
+    assert all(len(line.get_xdata()) > 50 for line in axes[0, 0].get_lines())
+    assert axes[0, 1].get_xlim()[1] == draws - 1
+
+
+def test_plot_trace_rasterize_threshold(models):
+    with rc_context(rc={"plot.matplotlib.rasterize_threshold": 100}):
+        axes = plot_trace(models.model_1, var_names="mu", compact=False)
+    dense_lines = [line for ax in axes.ravel() for line in ax.lines if len(line.get_xdata()) > 100]
+    assert dense_lines
+    assert all(line.get_rasterized() for line in dense_lines)
+    assert not any(ax.get_rasterized() for ax in axes.ravel())
+    axes = plot_trace(models.model_1, var_names="mu")
+    assert not any(line.get_rasterized() for ax in axes.ravel() for line in ax.lines)
+
+
 def test_plot_trace_discrete(discrete_model):
     axes = plot_trace(discrete_model)
     assert axes.shape
@@ -364,6 +399,41 @@ def test_plot_forest_rope_exception():
     assert "Argument `rope` must be None, a dictionary like" in str(err.value)
 
 
+@pytest.mark.parametrize("kind", ["forestplot", "ridgeplot"])
+def test_plot_forest_stats(models, kind):
+    stats = [
+        summary(model, fmt="xarray", round_to="none") for model in (models.model_1, models.model_2)
+    ]
+    stats[0]["mu"].loc[{"metric": "hdi_3%"}] = -100
+    axes = plot_forest(
+        [models.model_1, models.model_2],
+        kind=kind,
+        combined=True,
+        ess=True,
+        r_hat=True,
+        stats=stats,
+    )
+    if kind == "forestplot":
+        assert axes[0].get_xlim()[0] < -100
+    with pytest.raises(ValueError):
+        plot_forest([models.model_1, models.model_2], stats=stats[0])
+
+
+@pytest.mark.parametrize("n_chains", [1, 4])
+def test_plot_forest_stats_diagnostics(models, n_chains):
+    data = models.model_1.posterior.isel(chain=slice(None, n_chains))
+    stats = summary(data, fmt="xarray", round_to="none")
+    kwargs = {"var_names": ["mu", "tau"], "combined": True, "ess": True, "r_hat": True}
+    axes = plot_forest(data, **kwargs)
+    axes_stats = plot_forest(data, stats=stats, **kwargs)
+    for ax, ax_stats in zip(axes[1:], axes_stats[1:]):
+        assert len(ax.lines) == len(ax_stats.lines)
+        for line, line_stats in zip(ax.lines, ax_stats.lines):
+            np.testing.assert_array_equal(line.get_xydata(), line_stats.get_xydata())
+    # r_hat is not defined with a single chain and no marker is plotted
+    assert not any(np.isnan(line.get_xdata()).any() for line in axes_stats[2].lines)
+
+
 def test_plot_forest_single_value():
     axes = plot_forest({"x": [1]})
     assert axes.shape
@@ -593,6 +663,13 @@ def test_plot_kde_inference_data(models):
             "hexbin_kwargs": {"cmap": "viridis"},
             "textsize": 20,
         },
+        {"kind": "density", "colorbar": True, "var_names": ["theta"]},
+        {
+            "kind": ["density", "kde"],
+            "divergences": True,
+            "gridsize": 30,
+            "var_names": ["mu", "tau"],
+        },
         {
             "point_estimate": "mean",
             "reference_values": {"mu": 0, "tau": 0},
@@ -606,7 +683,13 @@ def test_plot_pair(models, kwargs):
 
 
 @pytest.mark.parametrize(
-    "kwargs", [{"kind": "scatter"}, {"kind": "kde"}, {"kind": "hexbin", "colorbar": True}]
+    "kwargs",
+    [
+        {"kind": "scatter"},
+        {"kind": "kde"},
+        {"kind": "hexbin", "colorbar": True},
+        {"kind": "density", "colorbar": True},
+    ],
 )
 def test_plot_pair_2var(discrete_model, fig_ax, kwargs):
     _, ax = fig_ax
@@ -614,6 +697,20 @@ def test_plot_pair_2var(discrete_model, fig_ax, kwargs):
     assert ax
 
 
+def test_plot_pair_density():
+    rng = np.random.default_rng(0)
+    idata = from_dict({"a": rng.normal(size=(2, 60000)), "b": rng.normal(size=(2, 60000))})
+    ax = plot_pair(idata, kind="auto", gridsize=50, density_kwargs={"cmap": "magma"})
+    (image,) = ax.get_images()
+    assert image.get_array().shape == (50, 50)
+    assert image.get_array().sum() == 120000
+    assert image.get_cmap().name == "magma"
+    assert not ax.collections
+    ax = plot_pair(idata.sel(draw=slice(None, 100)), kind="auto")
+    assert not ax.get_images()
+    assert ax.collections
+
+
 def test_plot_pair_bad(models):
     with pytest.raises(ValueError):
         plot_pair(models.model_1, kind="bad_kind")
@@ -787,6 +884,20 @@ def test_plot_ppc_multichain(kind, jitter, animated):
         assert np.all(axes)
 
 
+@pytest.mark.parametrize("kind", ["kde", "cumulative"])
+@pytest.mark.parametrize("dtype", ["f", "i"])
+def test_plot_ppc_line_collection(kind, dtype):
+    rng = np.random.default_rng(0)
+    if dtype == "f":
+        obs, pp_obs = rng.normal(size=15), rng.normal(size=(2, 20, 15))
+    else:
+        obs, pp_obs = rng.poisson(4, size=15), rng.poisson(4, size=(2, 20, 15))
+    data = from_dict(observed_data={"obs": obs}, posterior_predictive={"obs": pp_obs})
+    axes = plot_ppc(data, kind=kind, num_pp_samples=30, mean=False)
+    (collection,) = [item for item in axes.collections if isinstance(item, LineCollection)]
+    assert len(collection.get_segments()) == 30
+
+
 @pytest.mark.parametrize("kind", ["kde", "cumulative", "scatter"])
 @pytest.mark.parametrize("animated", [False, True])
 def test_plot_ppc_discrete(kind, animated):
@@ -1127,6 +1238,16 @@ def test_plot_posterior_point_estimates(models, point_estimate):
     assert axes.size == 2
 
 
+@pytest.mark.parametrize("point_estimate", ["mean", "median", "mode"])
+def test_plot_posterior_stats(models, point_estimate):
+    stats = summary(models.model_1, var_names="mu", fmt="xarray", round_to="none")
+    stats["mu"].loc[{"metric": "hdi_3%"}] = -100
+    axes = plot_posterior(
+        models.model_1, var_names="mu", point_estimate=point_estimate, stats=stats
+    )
+    assert "-100 " in [text.get_text() for text in axes.texts]
+
+
 def test_plot_posterior_skipna():
     sample = np.linspace(0, 1)
     sample[:10] = np.nan
@@ -2083,3 +2204,31 @@ def test_plot_bf():
     bf_dict1, _ = plot_bf(idata, prior=np.random.normal(0, 10, 5000), var_name="a", ref_val=0)
     assert bf_dict0["BF10"] > bf_dict0["BF01"]
     assert bf_dict1["BF10"] < bf_dict1["BF01"]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("from_file", [False, True])
+def test_render_batch(models, tmp_path, n_jobs, from_file):
+    data = models.model_1
+    if from_file:
+        data.to_netcdf(tmp_path / "data.nc")
+        data = tmp_path / "data.nc"
+    specs = [
+        ("plot_trace", {"var_names": "mu"}),
+        (plot_posterior, {"var_names": "tau"}),
+        (plot_trace, {"var_names": "theta", "compact": True}, "theta.pdf"),
+    ]
+    timings = render_batch(specs, tmp_path / "figs", data=data, n_jobs=n_jobs)
+    assert list(timings["function"]) == ["plot_trace", "plot_posterior", "plot_trace"]
+    assert [os.path.basename(filename) for filename in timings["filename"]] == [
+        "0_plot_trace.png",
+        "1_plot_posterior.png",
+        "theta.pdf",
+    ]
+    assert all(os.path.isfile(filename) for filename in timings["filename"])
+    assert timings.attrs["wall_time"] > 0
+
+
+def test_render_batch_bad_function(models, tmp_path):
+    with pytest.raises(ValueError):
+        render_batch([("summary", {})], tmp_path, data=models.model_1)
@@ -9,6 +9,7 @@ from ...data import datasets, load_arviz_data
 from ...rcparams import (
     _make_validate_choice,
     _make_validate_choice_regex,
+    _validate_chunks,
     _validate_float_or_none,
     _validate_positive_int_or_none,
     _validate_probability,
@@ -272,6 +273,36 @@ def test_validate_probability(args):
         assert isinstance(value, float)
 
 
+@pytest.mark.parametrize(
+    "args",
+    [
+        (None, None),
+        ("none", None),
+        ("auto", "auto"),
+        ("obs: 100, school: auto", {"obs": 100, "school": "auto"}),
+        ({"obs": "50", "chain": -1}, {"obs": 50, "chain": -1}),
+    ],
+)
+def test_validate_chunks(args):
+    value, expected = args
+    assert _validate_chunks(value) == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("Could not interpret", "obs"),
+        ("Could not convert", {"obs": "many"}),
+        ("Chunk sizes must be", {"obs": 0}),
+        ("Only None, 'auto'", 100),
+    ],
+)
+def test_validate_chunks_illegal(args):
+    raise_error, value = args
+    with pytest.raises(ValueError, match=raise_error):
+        _validate_chunks(value)
+
+
 ### Test integration of rcParams in ArviZ ###
 def test_data_load():
     rcParams["data.load"] = "lazy"
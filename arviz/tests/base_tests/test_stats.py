@@ -499,6 +499,15 @@ def test_loo_one_chain(centered_eight):
     assert loo(centered_eight) is not None
 
 
+def test_loo_float32(centered_eight):
+    centered_eight32 = centered_eight.copy(deep=False)
+    centered_eight32.log_likelihood = centered_eight.log_likelihood.astype(np.float32)
+    loo_data = loo(centered_eight, pointwise=True)
+    loo_data32 = loo(centered_eight32, pointwise=True)
+    assert loo_data32["loo_i"].dtype == np.float64
+    assert_allclose(loo_data32["elpd_loo"], loo_data["elpd_loo"], rtol=1e-5)
+
+
 def test_loo_bad(centered_eight):
     with pytest.raises(TypeError):
         loo(np.random.randn(2, 10))
@@ -8,7 +8,13 @@ import pytest
 import scipy.stats as st
 
 from ...data import dict_to_dataset, from_dict, load_arviz_data
-from ...stats.density_utils import _circular_mean, _normalize_angle, _find_hdi_contours
+from ...stats.density_utils import (
+    _circular_mean,
+    _find_hdi_contours,
+    _kde_linear_batch,
+    _normalize_angle,
+    kde,
+)
 from ...utils import (
     _stack,
     _subset_list,
@@ -374,3 +380,27 @@ def test_find_hdi_contours(mean, cov, contour_sigma):
     contour_az = _find_hdi_contours(density, hdi_probs)
 
     np.testing.assert_allclose(contour_sp, contour_az, rtol=1e-2, atol=1e-4)
+
+
+@pytest.mark.parametrize("bw", ["experimental", "scott", 0.3])
+def test_kde_linear_batch(bw):
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=(10, 300))
+    x[0, :5] = np.nan
+    grid, pdf = _kde_linear_batch(x, bw=bw)
+    assert grid.shape == (512,)
+    assert pdf.shape == (10, 512)
+    np.testing.assert_allclose(np.trapz(pdf, grid, axis=1), 1, atol=0.01)
+    np.testing.assert_allclose(pdf.mean(0), np.exp(-(grid**2) / 2) / (2 * np.pi) ** 0.5, atol=0.05)
+
+
+def test_kde_linear_batch_isj():
+    rng = np.random.default_rng(3)
+    x = rng.gamma(2, size=(5, 300))
+    # every row spans the same range so the shared grid is the grid of each row
+    x[:, 0], x[:, 1] = x.min(), x.max()
+    grid, pdf = _kde_linear_batch(x, bw="isj")
+    for row, row_pdf in zip(x, pdf):
+        expected_grid, expected = kde(row, bw="isj")
+        np.testing.assert_allclose(grid, expected_grid)
+        np.testing.assert_allclose(row_pdf, expected, atol=0.01 * expected.max())
@@ -5,7 +5,7 @@ import os
 import numpy as np
 import pytest
 
-from ... import from_cmdstan
+from ... import from_cmdstan, rc_context
 
 from ..helpers import check_multiple_attrs
 
@@ -92,6 +92,27 @@ class TestDataCmdStan:
             assert np.isclose(Z_mean, Z_mean_true, atol=7e-1).all()
             assert "comments" in inference_data.posterior.attrs
 
+    def test_inference_data_dtype(self, paths):
+        for key, path in paths.items():
+            if "eight" in key or "missing" in key:
+                continue
+            inference_data = self.get_inference_data(
+                path, dtype={"posterior": "float32"}, dtypes={"y": int}
+            )
+            assert inference_data.posterior["x"].dtype == np.float32
+            assert inference_data.posterior["y"].dtype == int
+            assert inference_data.sample_stats["lp"].dtype == np.float64
+
+    def test_inference_data_dtype_override(self, paths):
+        path = paths["no_warmup"]
+        reference = self.get_inference_data(path)
+        with rc_context(rc={"data.float_dtype": "float32"}):
+            inference_data = self.get_inference_data(path, dtype={"posterior": "float64"})
+        for var_name, values in reference.posterior.items():
+            assert inference_data.posterior[var_name].dtype == np.float64
+            assert np.array_equal(inference_data.posterior[var_name], values)
+        assert inference_data.sample_stats["lp"].dtype == np.float32
+
     def test_inference_data_input_types1(self, paths, observed_data_paths):
         """Check input types
 
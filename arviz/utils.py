@@ -694,7 +694,7 @@ class HtmlTemplate:
             <li class = "xr-section-item">
                   <input id="idata_{group_id}" class="xr-section-summary-in" type="checkbox">
                   <label for="idata_{group_id}" class = "xr-section-summary">{group}</label>
-                  <div class="xr-section-inline-details"></div>
+                  <div class="xr-section-inline-details">{details}</div>
                   <div class="xr-section-details">
                       <ul id="xr-dataset-coord-list" class="xr-var-list">
                           <div style="padding-left:2rem;">{xr_data}<br></div>